@@ -0,0 +1,232 @@
+"""
+FontBakery batch checks a whole collection of font families (laid out like
+the google/fonts repository: one directory per family) in a single process.
+
+The profile is built, and the check modules imported, only once for the
+whole collection. Each family is then checked on its own CheckRunContext,
+possibly in parallel with the others, and gets its own report, while a
+summary of all the families is written next to them.
+"""
+import concurrent.futures
+import json
+import multiprocessing
+import os
+from typing import List
+
+from fontbakery.callable import import_callable, import_module_or_file
+from fontbakery.checkrunner import CheckRunner, condition_modules, EXECUTORS
+from fontbakery.fonts_profile import setup_context
+from fontbakery.reporters.serialize import JSONReporter
+from fontbakery.status import PASS
+from fontbakery.testable import FILE_TYPES, CheckRunContext, Font, TTCFont
+
+SUMMARY_FILENAME = "summary.json"
+FONT_EXTENSIONS = tuple(f".{ext}" for ext in Font.extensions) + (".ttc", ".otc")
+
+
+def discover_families(root) -> List[str]:
+    """The family directories under root, sorted: those which have a
+    METADATA.pb file or font files. The directories inside a family (such
+    as its static/ directory) belong to it, rather than being families of
+    their own."""
+    families = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        if "METADATA.pb" in filenames or any(
+            filename.endswith(FONT_EXTENSIONS) for filename in filenames
+        ):
+            families.append(dirpath)
+            dirnames.clear()
+    return families
+
+
+def family_files(family) -> List[str]:
+    """The files of a family directory, including those of its
+    subdirectories, sorted."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(family):
+        dirnames.sort()
+        files += [os.path.join(dirpath, filename) for filename in sorted(filenames)]
+    return files
+
+
+def check_family(
+    profile, config, family, report, loglevels=None, cache=None, reporters=()
+):
+    """Check all the files of a family directory, write a JSON report
+    (and the reports of the other `reporters`, given as pairs of a reporter
+    class and an output file) and return a summary of the results."""
+    context = setup_context(family_files(family))
+    runner = CheckRunner(profile, context, config, cache=cache)
+    reporter = JSONReporter(
+        runner=runner,
+        loglevels=loglevels or [PASS],
+        output_file=report,
+        quiet=True,
+    )
+    others = [
+        reporter_class(
+            runner=runner,
+            loglevels=loglevels or [PASS],
+            output_file=output_file,
+            quiet=True,
+        )
+        for reporter_class, output_file in reporters
+    ]
+    runner.run([reporter] + others)
+    for each in [reporter] + others:
+        os.makedirs(os.path.dirname(each.output_file) or ".", exist_ok=True)
+        each.write()
+    worst_status = reporter.worst_check_status
+    return {
+        "result": dict(reporter._counter),
+        "worst_status": worst_status.name if worst_status else None,
+    }
+
+
+class BatchRunner:
+    """Checks each family of a collection with the same profile.
+
+    Families are checked `jobs` at a time, by threads or by worker
+    processes (see EXECUTORS). The summary of each family is handed to
+    `on_family` as soon as it is finished.
+
+    Besides its JSON report in `output_dir`, each family gets a report
+    from each of the `reporters`, given as triples of a dotted reporter
+    class name, a directory and a file extension; reports are laid out
+    like the collection in each directory."""
+
+    def __init__(
+        self,
+        profile,
+        config,
+        root,
+        output_dir,
+        jobs=1,
+        executor="threads",
+        loglevels=None,
+        cache=None,
+        reporters=(),
+    ):
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor {executor!r}")
+        self.profile = profile
+        self.config = config
+        self.root = root
+        self.output_dir = output_dir
+        self.jobs = max(jobs, 1)
+        self.executor = executor
+        self.loglevels = loglevels
+        self.cache = cache
+        # Imported up front: check modules may import them concurrently.
+        self.reporters = [
+            (import_callable(*reporter_class.rsplit(".", 1)), directory, extension)
+            for reporter_class, directory, extension in reporters
+        ]
+        self.families = discover_families(root)
+
+    def _family_name(self, family):
+        name = os.path.relpath(family, self.root)
+        if name == ".":
+            name = os.path.basename(os.path.abspath(family))
+        return name
+
+    def _report_path(self, family):
+        return os.path.join(self.output_dir, self._family_name(family) + ".json")
+
+    def _other_reports(self, family):
+        name = self._family_name(family)
+        return [
+            (reporter_class, os.path.join(directory, name + extension))
+            for reporter_class, directory, extension in self.reporters
+        ]
+
+    def _check(self, family, report, reporters):
+        return _check_family_safely(
+            self.profile,
+            self.config,
+            family,
+            report,
+            self.loglevels,
+            self.cache,
+            reporters,
+        )
+
+    def run(self, on_family=None):
+        summary = {}
+        jobs = [
+            (family, self._report_path(family), self._other_reports(family))
+            for family in self.families
+        ]
+
+        def finish(job, result):
+            family, report, _ = job
+            name = self._family_name(family)
+            result["report"] = os.path.relpath(report, self.output_dir)
+            summary[name] = result
+            if on_family:
+                on_family(name, result)
+
+        if self.jobs == 1:
+            for job in jobs:
+                finish(job, self._check(*job))
+        else:
+            if self.executor == "processes":
+                executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.jobs,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_batch_worker,
+                    initargs=(
+                        self.profile,
+                        self.config,
+                        condition_modules(
+                            [CheckRunContext, TTCFont] + list(FILE_TYPES)
+                        ),
+                        self.loglevels,
+                        self.cache,
+                    ),
+                )
+                check = _check_family_in_process
+            else:
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.jobs)
+                check = self._check
+            with executor:
+                futures = {executor.submit(check, *job): job for job in jobs}
+                for future in concurrent.futures.as_completed(futures):
+                    finish(futures[future], future.result())
+
+        summary = dict(sorted(summary.items()))
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(
+            os.path.join(self.output_dir, SUMMARY_FILENAME), "w", encoding="utf-8"
+        ) as fh:
+            json.dump(summary, fh, sort_keys=True, indent=4)
+        return summary
+
+
+def _check_family_safely(profile, config, family, report, loglevels, cache, reporters):
+    # One broken family must not stop the checking of the collection.
+    try:
+        return check_family(
+            profile, config, family, report, loglevels, cache, reporters
+        )
+    except Exception as e:  # pylint: disable=broad-except
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+# State of a worker process in a process-pool batch run.
+_worker_spec = None
+
+
+def _init_batch_worker(profile, config, modules, loglevels, cache):
+    global _worker_spec  # pylint: disable=global-statement
+    for module_name, filename in modules.items():
+        import_module_or_file(module_name, filename)
+    _worker_spec = (profile, config, loglevels, cache)
+
+
+def _check_family_in_process(family, report, reporters):
+    profile, config, loglevels, cache = _worker_spec
+    return _check_family_safely(
+        profile, config, family, report, loglevels, cache, reporters
+    )
@@ -11,11 +11,41 @@ Domain specific knowledge should be encoded only in the Profile (Checks,
 Conditions) and MAYBE in *customized* reporters e.g. subclasses.
 
 """
+import functools
+import importlib
+import importlib.util
 import inspect
+import sys
 
-from functools import update_wrapper, cached_property
+from functools import update_wrapper
 from typing import Callable
 
+from fontbakery import timing
+
+
+def import_module_or_file(module_name, filename=None):
+    """Import a module by name, falling back to loading it from ``filename``
+    for modules which are not importable by name (such as the
+    ``check_definitions`` of a profile, which are loaded from files)."""
+    module = sys.modules.get(module_name)
+    if module is None:
+        try:
+            module = importlib.import_module(module_name)
+        except (ImportError, TypeError):
+            if not filename:
+                raise
+            spec = importlib.util.spec_from_file_location(module_name, filename)
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+    return module
+
+
+def import_callable(module_name, name, filename=None):
+    """Look up a module-level callable (e.g. a check) by reference.
+    This is how checks travel to worker processes."""
+    return getattr(import_module_or_file(module_name, filename), name)
+
 
 class FontbakeryCallable:
     __wrapped__: Callable
@@ -40,11 +70,11 @@ class FontbakeryCallable:
             getattr(self, "id", getattr(self, "name", super().__repr__())),
         )  # pylint: disable=consider-using-f-string
 
-    @cached_property
+    @functools.cached_property
     def args(self):
         return self.mandatoryArgs + self.optionalArgs
 
-    @cached_property
+    @functools.cached_property
     def mandatoryArgs(self):
         args = []
         # make follow_wrapped=True explicit, even though it is the default!
@@ -66,7 +96,7 @@ class FontbakeryCallable:
             args.append(name)
         return tuple(args)
 
-    @cached_property
+    @functools.cached_property
     def optionalArgs(self):
         args = []
         # make follow_wrapped=True explicit, even though it is the default!
@@ -92,6 +122,14 @@ class FontbakeryCallable:
             args.append(name)
         return tuple(args)
 
+    def __reduce__(self):
+        # Pickle by reference, so that checks can be sent to worker processes.
+        try:
+            filename = inspect.getsourcefile(self.__wrapped__)
+        except TypeError:
+            filename = None
+        return (import_callable, (self.__module__, self.__name__, filename))
+
     def __call__(self, *args, **kwds):
         """Each call to __call__ with the same arguments must return
         the same result.
@@ -216,13 +254,44 @@ class FontBakeryCheck(FontbakeryCallable):
     #  return self.id
 
 
-def condition(cls):
+class cached_property(functools.cached_property):
+    """A functools.cached_property which reports the time taken to compute
+    it when the check run is being timed. (It keeps the name, so that
+    linters still infer the type of the value it caches.)"""
+
+    # Whether computing the value makes requests over the network, in which
+    # case the results of the checks which use it are never cached.
+    network = False
+
+    def __set_name__(self, owner, name):
+        super().__set_name__(owner, name)
+        self.timing_name = f"{owner.__name__}.{name}"
+
+    def __get__(self, instance, owner=None):
+        if (
+            timing.active_recorder is None
+            or instance is None
+            or self.attrname in getattr(instance, "__dict__", {})
+        ):
+            return super().__get__(instance, owner)
+        with timing.measure("condition", self.timing_name):
+            return super().__get__(instance, owner)
+
+
+def uses_network(prop):
+    """Marks a cached_property whose value is fetched over the network."""
+    prop.network = True
+    return prop
+
+
+def condition(cls, network=False):
     if not inspect.isclass(cls):
         raise TypeError(f"Condition {cls.__name__} must be added to a class")
 
     def decorator(*args, **kwds):
         func = args[0]
         prop = cached_property(func)
+        prop.network = network
         prop.__set_name__(cls, func.__name__)
         setattr(cls, func.__name__, prop)
 
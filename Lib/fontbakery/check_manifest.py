@@ -0,0 +1,432 @@
+# This file is generated by meta_scripts/generate_check_manifest.py
+# pylint: disable=line-too-long  # This is data, not code
+
+# The module defining each check
+CHECKS = {
+    "STAT_in_statics": "fontbakery.checks.stat",
+    "STAT_strings": "fontbakery.checks.stat",
+    "adobefonts/STAT_strings": "fontbakery.checks.vendorspecific.adobefonts",
+    "adobefonts/family/consistent_upm": "fontbakery.checks.vendorspecific.adobefonts",
+    "adobefonts/nameid_1_win_english": "fontbakery.checks.vendorspecific.adobefonts",
+    "adobefonts/unsupported_tables": "fontbakery.checks.vendorspecific.adobefonts",
+    "alt_caron": "fontbakery.checks.some_other_checks",
+    "arabic_high_hamza": "fontbakery.checks.arabic",
+    "arabic_spacing_symbols": "fontbakery.checks.arabic",
+    "caps_vertically_centered": "fontbakery.checks.some_other_checks",
+    "case_mapping": "fontbakery.checks.glyphset",
+    "cjk_chws_feature": "fontbakery.checks.some_other_checks",
+    "cjk_not_enough_glyphs": "fontbakery.checks.cjk",
+    "cmap/format_12": "fontbakery.checks.cmap",
+    "color_cpal_brightness": "fontbakery.checks.color",
+    "colorfont_tables": "fontbakery.checks.color",
+    "contour_count": "fontbakery.checks.some_other_checks",
+    "designspace_has_consistent_codepoints": "fontbakery.checks.ufo",
+    "designspace_has_consistent_glyphset": "fontbakery.checks.ufo",
+    "designspace_has_consistent_groups": "fontbakery.checks.ufo",
+    "designspace_has_default_master": "fontbakery.checks.ufo",
+    "designspace_has_sources": "fontbakery.checks.ufo",
+    "dotted_circle": "fontbakery.checks.shaping",
+    "empty_glyph_on_gid1_for_colrv0": "fontbakery.checks.color",
+    "empty_letters": "fontbakery.checks.empty_letters",
+    "family/control_chars": "fontbakery.checks.glyphset",
+    "family/single_directory": "fontbakery.checks.some_other_checks",
+    "family/vertical_metrics": "fontbakery.checks.metrics",
+    "family/win_ascent_and_descent": "fontbakery.checks.metrics",
+    "file_size": "fontbakery.checks.filesize",
+    "fontbakery_version": "fontbakery.checks.fontbakery",
+    "fontbureau/ytlc_sanity": "fontbakery.checks.vendorspecific.fontbureau",
+    "fontdata_namecheck": "fontbakery.checks.namecheck",
+    "fontvalidator": "fontbakery.checks.fontval",
+    "fontwerk/names_match_default_fvar": "fontbakery.checks.vendorspecific.fontwerk",
+    "fontwerk/style_linking": "fontbakery.checks.vendorspecific.fontwerk",
+    "fontwerk/vendor_id": "fontbakery.checks.vendorspecific.fontwerk",
+    "freetype_rasterizer": "fontbakery.checks.some_other_checks",
+    "fvar_name_entries": "fontbakery.checks.varfont",
+    "glyf_nested_components": "fontbakery.checks.glyf",
+    "googlefonts/STAT": "fontbakery.checks.vendorspecific.googlefonts.varfont",
+    "googlefonts/STAT/axis_order": "fontbakery.checks.vendorspecific.googlefonts.stat",
+    "googlefonts/STAT/axisregistry": "fontbakery.checks.vendorspecific.googlefonts.axisregistry",
+    "googlefonts/article/images": "fontbakery.checks.vendorspecific.googlefonts.article",
+    "googlefonts/axes_match": "fontbakery.checks.vendorspecific.googlefonts.varfont",
+    "googlefonts/axisregistry/fvar_axis_defaults": "fontbakery.checks.vendorspecific.googlefonts.axisregistry",
+    "googlefonts/canonical_filename": "fontbakery.checks.vendorspecific.googlefonts",
+    "googlefonts/cjk_vertical_metrics": "fontbakery.checks.vendorspecific.googlefonts.vmetrics",
+    "googlefonts/cjk_vertical_metrics_regressions": "fontbakery.checks.vendorspecific.googlefonts.vmetrics",
+    "googlefonts/description/broken_links": "fontbakery.checks.vendorspecific.googlefonts.description",
+    "googlefonts/description/eof_linebreak": "fontbakery.checks.vendorspecific.googlefonts.description",
+    "googlefonts/description/family_update": "fontbakery.checks.vendorspecific.googlefonts.description",
+    "googlefonts/description/git_url": "fontbakery.checks.vendorspecific.googlefonts.description",
+    "googlefonts/description/has_article": "fontbakery.checks.vendorspecific.googlefonts.description",
+    "googlefonts/description/has_unsupported_elements": "fontbakery.checks.vendorspecific.googlefonts.description",
+    "googlefonts/description/min_length": "fontbakery.checks.vendorspecific.googlefonts.description",
+    "googlefonts/description/urls": "fontbakery.checks.vendorspecific.googlefonts.description",
+    "googlefonts/description/valid_html": "fontbakery.checks.vendorspecific.googlefonts.description",
+    "googlefonts/epar": "fontbakery.checks.vendorspecific.googlefonts.license",
+    "googlefonts/family/equal_codepoint_coverage": "fontbakery.checks.vendorspecific.googlefonts.family",
+    "googlefonts/family/has_license": "fontbakery.checks.vendorspecific.googlefonts.license",
+    "googlefonts/family/italics_have_roman_counterparts": "fontbakery.checks.vendorspecific.googlefonts.family",
+    "googlefonts/family/tnum_horizontal_metrics": "fontbakery.checks.vendorspecific.googlefonts.family",
+    "googlefonts/font_copyright": "fontbakery.checks.vendorspecific.googlefonts.copyright",
+    "googlefonts/font_names": "fontbakery.checks.vendorspecific.googlefonts.name",
+    "googlefonts/fstype": "fontbakery.checks.vendorspecific.googlefonts.os2",
+    "googlefonts/fvar_instances": "fontbakery.checks.vendorspecific.googlefonts.varfont",
+    "googlefonts/gasp": "fontbakery.checks.vendorspecific.googlefonts.hinting",
+    "googlefonts/glyph_coverage": "fontbakery.checks.vendorspecific.googlefonts.glyphset",
+    "googlefonts/glyphsets/shape_languages": "fontbakery.checks.vendorspecific.googlefonts.glyphset",
+    "googlefonts/has_ttfautohint_params": "fontbakery.checks.vendorspecific.googlefonts.hinting",
+    "googlefonts/license/OFL_body_text": "fontbakery.checks.vendorspecific.googlefonts.license",
+    "googlefonts/license/OFL_copyright": "fontbakery.checks.vendorspecific.googlefonts.license",
+    "googlefonts/meta/script_lang_tags": "fontbakery.checks.vendorspecific.googlefonts.meta",
+    "googlefonts/metadata/axisregistry_bounds": "fontbakery.checks.vendorspecific.googlefonts.axisregistry",
+    "googlefonts/metadata/axisregistry_valid_tags": "fontbakery.checks.vendorspecific.googlefonts.axisregistry",
+    "googlefonts/metadata/broken_links": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/can_render_samples": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/canonical_style_names": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/canonical_weight_value": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/category": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/category_hints": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/consistent_axis_enumeration": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/consistent_repo_urls": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/copyright": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/date_added": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/designer_profiles": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/designer_values": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/empty_designer": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/escaped_strings": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/family_directory_name": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/familyname": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/filenames": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/has_regular": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/includes_production_subsets": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/license": "fontbakery.checks.vendorspecific.googlefonts.license",
+    "googlefonts/metadata/match_filename_postscript": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/match_fullname_postscript": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/match_name_familyname": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/match_weight_postscript": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/menu_and_latin": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/minisite_url": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/nameid/family_and_full_names": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/nameid/font_name": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/nameid/post_script_name": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/os2_weightclass": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/parses": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/primary_script": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/regular_is_400": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/reserved_font_name": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/single_cjk_subset": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/subsets_order": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/undeclared_fonts": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/unique_full_name_values": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/unique_weight_style_pairs": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/unreachable_subsetting": "fontbakery.checks.vendorspecific.googlefonts.subsets",
+    "googlefonts/metadata/unsupported_subsets": "fontbakery.checks.vendorspecific.googlefonts.subsets",
+    "googlefonts/metadata/valid_filename_values": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/valid_full_name_values": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/valid_nameid25": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/metadata/valid_post_script_name_values": "fontbakery.checks.vendorspecific.googlefonts.metadata",
+    "googlefonts/name/description_max_length": "fontbakery.checks.vendorspecific.googlefonts.name",
+    "googlefonts/name/family_name_compliance": "fontbakery.checks.vendorspecific.googlefonts.name",
+    "googlefonts/name/familyname_first_char": "fontbakery.checks.vendorspecific.googlefonts.name",
+    "googlefonts/name/license": "fontbakery.checks.vendorspecific.googlefonts.license",
+    "googlefonts/name/license_url": "fontbakery.checks.vendorspecific.googlefonts.license",
+    "googlefonts/name/line_breaks": "fontbakery.checks.vendorspecific.googlefonts.name",
+    "googlefonts/name/mandatory_entries": "fontbakery.checks.vendorspecific.googlefonts.name",
+    "googlefonts/name/rfn": "fontbakery.checks.vendorspecific.googlefonts.license",
+    "googlefonts/name/version_format": "fontbakery.checks.vendorspecific.googlefonts.name",
+    "googlefonts/old_ttfautohint": "fontbakery.checks.vendorspecific.googlefonts.hinting",
+    "googlefonts/os2/use_typo_metrics": "fontbakery.checks.vendorspecific.googlefonts.os2",
+    "googlefonts/production_glyphs_similarity": "fontbakery.checks.vendorspecific.googlefonts.hosted",
+    "googlefonts/repo/dirname_matches_nameid_1": "fontbakery.checks.vendorspecific.googlefonts.repo",
+    "googlefonts/repo/fb_report": "fontbakery.checks.vendorspecific.googlefonts.repo",
+    "googlefonts/repo/sample_image": "fontbakery.checks.vendorspecific.googlefonts.repo",
+    "googlefonts/repo/upstream_yaml_has_required_fields": "fontbakery.checks.vendorspecific.googlefonts.repo",
+    "googlefonts/repo/vf_has_static_fonts": "fontbakery.checks.vendorspecific.googlefonts.repo",
+    "googlefonts/repo/zip_files": "fontbakery.checks.vendorspecific.googlefonts.repo",
+    "googlefonts/unitsperem": "fontbakery.checks.vendorspecific.googlefonts.head",
+    "googlefonts/usweightclass": "fontbakery.checks.vendorspecific.googlefonts.os2",
+    "googlefonts/varfont/bold_wght_coord": "fontbakery.checks.vendorspecific.googlefonts.varfont",
+    "googlefonts/varfont/duplicate_instance_names": "fontbakery.checks.vendorspecific.googlefonts.varfont",
+    "googlefonts/varfont/generate_static": "fontbakery.checks.vendorspecific.googlefonts.varfont",
+    "googlefonts/varfont/has_HVAR": "fontbakery.checks.vendorspecific.googlefonts.varfont",
+    "googlefonts/vendor_id": "fontbakery.checks.vendorspecific.googlefonts.os2",
+    "googlefonts/version_bump": "fontbakery.checks.vendorspecific.googlefonts.hosted",
+    "googlefonts/vertical_metrics": "fontbakery.checks.vendorspecific.googlefonts.vmetrics",
+    "googlefonts/vertical_metrics_regressions": "fontbakery.checks.vendorspecific.googlefonts.vmetrics",
+    "gpos7": "fontbakery.checks.some_other_checks",
+    "gsub/smallcaps_before_ligatures": "fontbakery.checks.some_other_checks",
+    "hinting_impact": "fontbakery.checks.hinting",
+    "inconsistencies_between_fvar_stat": "fontbakery.checks.stat",
+    "integer_ppem_if_hinted": "fontbakery.checks.hinting",
+    "interpolation_issues": "fontbakery.checks.some_other_checks",
+    "iso15008/intercharacter_spacing": "fontbakery.checks.iso15008",
+    "iso15008/interline_spacing": "fontbakery.checks.iso15008",
+    "iso15008/interword_spacing": "fontbakery.checks.iso15008",
+    "iso15008/proportions": "fontbakery.checks.iso15008",
+    "iso15008/stem_width": "fontbakery.checks.iso15008",
+    "kerning_for_non_ligated_sequences": "fontbakery.checks.kerning",
+    "legacy_accents": "fontbakery.checks.some_other_checks",
+    "ligature_carets": "fontbakery.checks.ligature_carets",
+    "linegaps": "fontbakery.checks.metrics",
+    "mandatory_avar_table": "fontbakery.checks.varfont",
+    "mandatory_glyphs": "fontbakery.checks.glyphset",
+    "math_signs_width": "fontbakery.checks.some_other_checks",
+    "microsoft/STAT_axis_values": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/STAT_table_axis_order": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/STAT_table_eliding_bit": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/copyright": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/fstype": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/fvar_STAT_axis_ranges": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/license_description": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/manufacturer": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/office_ribz_req": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/ogl2": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/trademark": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/vendor_url": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/version": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/vertical_metrics": "fontbakery.checks.vendorspecific.microsoft",
+    "microsoft/wgl4": "fontbakery.checks.vendorspecific.microsoft",
+    "missing_small_caps_glyphs": "fontbakery.checks.glyphset",
+    "name/char_restrictions": "fontbakery.checks.name",
+    "name/family_and_style_max_length": "fontbakery.checks.name",
+    "name/italic_names": "fontbakery.checks.name",
+    "name/no_copyright_on_description": "fontbakery.checks.name",
+    "name/trailing_spaces": "fontbakery.checks.some_other_checks",
+    "name_id_1": "fontbakery.checks.name",
+    "name_id_2": "fontbakery.checks.name",
+    "name_length_req": "fontbakery.checks.name",
+    "no_debugging_tables": "fontbakery.checks.tables",
+    "no_mac_entries": "fontbakery.checks.name",
+    "notofonts/cmap/alien_codepoints": "fontbakery.checks.vendorspecific.notofonts",
+    "notofonts/cmap/unexpected_subtables": "fontbakery.checks.vendorspecific.notofonts",
+    "notofonts/hmtx/comma_period": "fontbakery.checks.vendorspecific.notofonts",
+    "notofonts/hmtx/encoded_latin_digits": "fontbakery.checks.vendorspecific.notofonts",
+    "notofonts/hmtx/whitespace_advances": "fontbakery.checks.vendorspecific.notofonts",
+    "notofonts/name/designer": "fontbakery.checks.vendorspecific.notofonts",
+    "notofonts/name/manufacturer": "fontbakery.checks.vendorspecific.notofonts",
+    "notofonts/name/trademark": "fontbakery.checks.vendorspecific.notofonts",
+    "notofonts/os2/vendor": "fontbakery.checks.vendorspecific.notofonts",
+    "notofonts/unicode_range_bits": "fontbakery.checks.vendorspecific.notofonts",
+    "opentype/caret_slope": "fontbakery.checks.opentype.hhea",
+    "opentype/cff2_call_depth": "fontbakery.checks.opentype.cff",
+    "opentype/cff_ascii_strings": "fontbakery.checks.opentype.cff",
+    "opentype/cff_call_depth": "fontbakery.checks.opentype.cff",
+    "opentype/cff_deprecated_operators": "fontbakery.checks.opentype.cff",
+    "opentype/code_pages": "fontbakery.checks.opentype.os2",
+    "opentype/family/bold_italic_unique_for_nameid1": "fontbakery.checks.opentype.os2",
+    "opentype/family/consistent_family_name": "fontbakery.checks.opentype.name",
+    "opentype/family/equal_font_versions": "fontbakery.checks.opentype.head",
+    "opentype/family/max_4_fonts_per_family_name": "fontbakery.checks.opentype.name",
+    "opentype/family/panose_familytype": "fontbakery.checks.opentype.os2",
+    "opentype/family/underline_thickness": "fontbakery.checks.opentype.post",
+    "opentype/family_naming_recommendations": "fontbakery.checks.opentype.name",
+    "opentype/font_version": "fontbakery.checks.opentype.head",
+    "opentype/fsselection": "fontbakery.checks.opentype.os2",
+    "opentype/fsselection_matches_macstyle": "fontbakery.checks.opentype.os2",
+    "opentype/gdef_mark_chars": "fontbakery.checks.opentype.gdef",
+    "opentype/gdef_non_mark_chars": "fontbakery.checks.opentype.gdef",
+    "opentype/gdef_spacing_marks": "fontbakery.checks.opentype.gdef",
+    "opentype/glyf_non_transformed_duplicate_components": "fontbakery.checks.opentype.glyf",
+    "opentype/glyf_unused_data": "fontbakery.checks.opentype.glyf",
+    "opentype/gpos_kerning_info": "fontbakery.checks.opentype.gpos",
+    "opentype/italic_angle": "fontbakery.checks.opentype.post",
+    "opentype/italic_axis_in_stat": "fontbakery.checks.opentype.stat",
+    "opentype/italic_axis_in_stat_is_boolean": "fontbakery.checks.opentype.stat",
+    "opentype/italic_axis_last": "fontbakery.checks.opentype.stat",
+    "opentype/kern_table": "fontbakery.checks.opentype.kern",
+    "opentype/layout_valid_feature_tags": "fontbakery.checks.opentype.layout",
+    "opentype/layout_valid_language_tags": "fontbakery.checks.opentype.layout",
+    "opentype/layout_valid_script_tags": "fontbakery.checks.opentype.layout",
+    "opentype/loca/maxp_num_glyphs": "fontbakery.checks.opentype.loca",
+    "opentype/mac_style": "fontbakery.checks.opentype.head",
+    "opentype/maxadvancewidth": "fontbakery.checks.opentype.hhea",
+    "opentype/monospace": "fontbakery.checks.opentype.name",
+    "opentype/name/empty_records": "fontbakery.checks.opentype.name",
+    "opentype/name/match_familyname_fullfont": "fontbakery.checks.opentype.name",
+    "opentype/name/postscript_name_consistency": "fontbakery.checks.opentype.name",
+    "opentype/name/postscript_vs_cff": "fontbakery.checks.opentype.name",
+    "opentype/points_out_of_bounds": "fontbakery.checks.opentype.glyf",
+    "opentype/post_table_version": "fontbakery.checks.opentype.post",
+    "opentype/postscript_name": "fontbakery.checks.opentype.name",
+    "opentype/slant_direction": "fontbakery.checks.opentype.fvar",
+    "opentype/stat_has_axis_value_tables": "fontbakery.checks.opentype.stat",
+    "opentype/unitsperem": "fontbakery.checks.opentype.head",
+    "opentype/varfont/distinct_instance_records": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/family_axis_ranges": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/foundry_defined_tag_name": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/ital_range": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/regular_ital_coord": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/regular_opsz_coord": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/regular_slnt_coord": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/regular_wdth_coord": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/regular_wght_coord": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/same_size_instance_records": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/slnt_range": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/stat_axis_record_for_each_axis": "fontbakery.checks.opentype.stat",
+    "opentype/varfont/valid_axis_nameid": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/valid_default_instance_nameids": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/valid_postscript_nameid": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/valid_subfamily_nameid": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/wdth_valid_range": "fontbakery.checks.opentype.fvar",
+    "opentype/varfont/wght_valid_range": "fontbakery.checks.opentype.fvar",
+    "opentype/vendor_id": "fontbakery.checks.opentype.os2",
+    "opentype/weight_class_fvar": "fontbakery.checks.opentype.stat",
+    "opentype/xavgcharwidth": "fontbakery.checks.opentype.os2",
+    "os2_metrics_match_hhea": "fontbakery.checks.metrics",
+    "ots": "fontbakery.checks.sanitize",
+    "outline_alignment_miss": "fontbakery.checks.outline",
+    "outline_colinear_vectors": "fontbakery.checks.outline",
+    "outline_direction": "fontbakery.checks.outline",
+    "outline_jaggy_segments": "fontbakery.checks.outline",
+    "outline_semi_vertical": "fontbakery.checks.outline",
+    "outline_short_segments": "fontbakery.checks.outline",
+    "overlapping_path_segments": "fontbakery.checks.outline",
+    "render_own_name": "fontbakery.checks.glyphset",
+    "required_tables": "fontbakery.checks.tables",
+    "rupee": "fontbakery.checks.glyphset",
+    "sfnt_version": "fontbakery.checks.some_other_checks",
+    "shaping/collides": "fontbakery.checks.shaping",
+    "shaping/forbidden": "fontbakery.checks.shaping",
+    "shaping/regression": "fontbakery.checks.shaping",
+    "smart_dropout": "fontbakery.checks.hinting",
+    "soft_dotted": "fontbakery.checks.shaping",
+    "soft_hyphen": "fontbakery.checks.glyphset",
+    "stylisticset_description": "fontbakery.checks.stylistic_sets",
+    "superfamily/list": "fontbakery.checks.superfamily",
+    "superfamily/vertical_metrics": "fontbakery.checks.superfamily",
+    "tabular_kerning": "fontbakery.checks.tabular_glyphs",
+    "tnum_glyphs_equal_widths": "fontbakery.checks.tabular_glyphs",
+    "transformed_components": "fontbakery.checks.some_other_checks",
+    "ttx_roundtrip": "fontbakery.checks.sanitize",
+    "typenetwork/PUA_encoded_glyphs": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/composite_glyphs": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/family/duplicated_names": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/family/equal_numbers_of_glyphs": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/family/tnum_horizontal_metrics": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/family/valid_strikeout": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/family/valid_underline": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/font_is_centered_vertically": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/glyph_coverage": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/marks_width": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/name/mandatory_entries": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/usweightclass": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/varfont/axes_have_variation": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/varfont/fvar_axes_order": "fontbakery.checks.vendorspecific.typenetwork",
+    "typenetwork/vertical_metrics": "fontbakery.checks.vendorspecific.typenetwork",
+    "typoascender_exceeds_Agrave": "fontbakery.checks.metrics",
+    "typographic_family_name": "fontbakery.checks.name",
+    "ufo_consistent_curve_type": "fontbakery.checks.ufo",
+    "ufo_features_default_languagesystem": "fontbakery.checks.ufo",
+    "ufo_no_open_corners": "fontbakery.checks.ufo",
+    "ufo_recommended_fields": "fontbakery.checks.ufo",
+    "ufo_required_fields": "fontbakery.checks.ufo",
+    "ufo_unnecessary_fields": "fontbakery.checks.ufo",
+    "ufolint": "fontbakery.checks.ufo",
+    "unique_glyphnames": "fontbakery.checks.glyphnames",
+    "unreachable_glyphs": "fontbakery.checks.glyphset",
+    "unwanted_aat_tables": "fontbakery.checks.tables",
+    "unwanted_tables": "fontbakery.checks.tables",
+    "valid_glyphnames": "fontbakery.checks.glyphnames",
+    "varfont/consistent_axes": "fontbakery.checks.varfont",
+    "varfont/duplexed_axis_reflow": "fontbakery.checks.varfont",
+    "varfont/instances_in_order": "fontbakery.checks.varfont",
+    "varfont/unsupported_axes": "fontbakery.checks.varfont",
+    "vtt_volt_data": "fontbakery.checks.hinting",
+    "vttclean": "fontbakery.checks.hinting",
+    "whitespace_glyphs": "fontbakery.checks.glyphset",
+    "whitespace_ink": "fontbakery.checks.some_other_checks",
+    "whitespace_widths": "fontbakery.checks.some_other_checks",
+}
+
+# The modules defining each condition (on any of the testables)
+CONDITIONS = {
+    "VTT_hinted": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "are_ttf": ["fontbakery.checks.conditions"],
+    "article": ["fontbakery.checks.vendorspecific.googlefonts.description"],
+    "article_html": ["fontbakery.checks.vendorspecific.googlefonts.description"],
+    "best_familyname": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "bold_wght_coord": ["fontbakery.checks.conditions"],
+    "canonical_stylename": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "cff_analysis": ["fontbakery.checks.opentype.cff"],
+    "descfile": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "description": ["fontbakery.checks.vendorspecific.googlefonts.description"],
+    "description_and_article": [
+        "fontbakery.checks.vendorspecific.googlefonts.description"
+    ],
+    "description_and_article_html": [
+        "fontbakery.checks.vendorspecific.googlefonts.description"
+    ],
+    "description_html": ["fontbakery.checks.vendorspecific.googlefonts.description"],
+    "designSpace": ["fontbakery.checks.ufo"],
+    "designspace_sources": ["fontbakery.checks.ufo"],
+    "expected_os2_weight": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "family_metadata": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "family_metadata_text_content": [
+        "fontbakery.checks.vendorspecific.googlefonts.conditions"
+    ],
+    "familyname": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "familyname_with_spaces": [
+        "fontbakery.checks.vendorspecific.googlefonts.conditions"
+    ],
+    "font_familyname": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "font_familynames": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "font_metadata": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "get_cjk_glyphs": ["fontbakery.checks.conditions"],
+    "gfonts_repo_structure": [
+        "fontbakery.checks.vendorspecific.googlefonts.conditions"
+    ],
+    "glyph_metrics_stats": ["fontbakery.checks.conditions"],
+    "google_familyname": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "has_kerning_info": ["fontbakery.checks.opentype.gpos"],
+    "has_regular_style": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "is_cjk_font": ["fontbakery.checks.conditions"],
+    "is_claiming_to_be_cjk_font": [
+        "fontbakery.checks.vendorspecific.googlefonts.glyphset"
+    ],
+    "is_indic_font": ["fontbakery.checks.conditions"],
+    "is_noto": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "is_ofl": ["fontbakery.checks.vendorspecific.googlefonts.license"],
+    "italic_ttFonts": ["fontbakery.checks.vendorspecific.typenetwork"],
+    "license_contents": ["fontbakery.checks.vendorspecific.googlefonts.license"],
+    "license_filename": ["fontbakery.checks.vendorspecific.googlefonts.license"],
+    "license_path": ["fontbakery.checks.vendorspecific.googlefonts.license"],
+    "licenses": ["fontbakery.checks.vendorspecific.googlefonts.license"],
+    "ligature_glyphs": ["fontbakery.checks.ligature_carets"],
+    "ligatures": ["fontbakery.checks.kerning"],
+    "link_statuses": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "listed_on_gfonts_api": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "metadata_file": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "missing_whitespace_chars": ["fontbakery.checks.conditions"],
+    "network": ["fontbakery.checks.conditions"],
+    "outlines_dict": ["fontbakery.checks.outline"],
+    "production_metadata": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "regular_ital_coord": ["fontbakery.checks.conditions"],
+    "regular_opsz_coord": ["fontbakery.checks.conditions"],
+    "regular_remote_style": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "regular_slnt_coord": ["fontbakery.checks.conditions"],
+    "regular_ttFont": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "regular_wdth_coord": ["fontbakery.checks.conditions"],
+    "regular_wght_coord": ["fontbakery.checks.conditions"],
+    "remote_style": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "remote_styles": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "rfn_exception": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "roman_ttFonts": ["fontbakery.checks.vendorspecific.typenetwork"],
+    "shaping_suites": ["fontbakery.checks.shaping"],
+    "sibling_directories": ["fontbakery.checks.conditions"],
+    "style_with_spaces": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "stylename": ["fontbakery.checks.vendorspecific.typenetwork"],
+    "stylenames_are_canonical": [
+        "fontbakery.checks.vendorspecific.googlefonts.conditions"
+    ],
+    "superfamily": ["fontbakery.checks.conditions"],
+    "superfamily_ttFonts": ["fontbakery.checks.conditions"],
+    "tn_expected_os2_weight": ["fontbakery.checks.vendorspecific.typenetwork"],
+    "typographic_familynames": [
+        "fontbakery.checks.vendorspecific.googlefonts.conditions"
+    ],
+    "ufo_font": ["fontbakery.checks.ufo"],
+    "uharfbuzz_blob": ["fontbakery.checks.varfont"],
+    "upstream_yaml": ["fontbakery.checks.vendorspecific.googlefonts.conditions"],
+    "variable_font_filename": ["fontbakery.checks.conditions"],
+    "vmetrics": ["fontbakery.checks.metrics"],
+    "vtt_talk_sources": ["fontbakery.checks.conditions"],
+}
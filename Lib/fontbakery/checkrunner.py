@@ -13,12 +13,18 @@ Conditions) and MAYBE in *customized* reporters e.g. subclasses.
 """
 
 from collections import OrderedDict
-import concurrent.futures
+import dataclasses
+from functools import cached_property, partial
+import hashlib
 import inspect
-import threading
+import json
+import os
+import pickle
 import traceback
 from typing import Union, Tuple
 
+from fontbakery import __version__, timing
+from fontbakery.callable import import_module_or_file
 from fontbakery.configuration import Configuration
 from fontbakery.result import (
     CheckResult,
@@ -26,6 +32,8 @@ from fontbakery.result import (
     Identity,
 )
 from fontbakery.message import Message
+from fontbakery.result_cache import hash_path
+from fontbakery.testable import load_condition
 from fontbakery.utils import is_negated
 from fontbakery.status import (
     Status,
@@ -36,6 +44,167 @@ from fontbakery.status import (
 )
 
 
+EXECUTORS = ("threads", "processes")
+
+# Configuration entries which select checks, rather than affect their results.
+CACHE_IGNORED_CONFIG = ("explicit_checks", "exclude_checks", "custom_order")
+
+# The files beside a font which checks on it may read, e.g. the METADATA.pb
+# of a Google Fonts family directory; and the directories whose files they
+# may read too.
+SIDECAR_FILES = (
+    "METADATA.pb",
+    "DESCRIPTION.en_us.html",
+    "OFL.txt",
+    "UFL.txt",
+    "LICENSE.txt",
+    "upstream.yaml",
+)
+SIDECAR_DIRECTORIES = ("article",)
+
+
+def sidecar_files(path):
+    """The sidecar files which exist beside the file at `path`."""
+    directory = os.path.dirname(os.path.abspath(path))
+    paths = [os.path.join(directory, name) for name in SIDECAR_FILES]
+    for name in SIDECAR_DIRECTORIES:
+        subdirectory = os.path.join(directory, name)
+        if os.path.isdir(subdirectory):
+            paths += [entry.path for entry in os.scandir(subdirectory)]
+    return sorted(path for path in paths if os.path.isfile(path))
+
+
+def condition_modules(classes):
+    """The source files of the modules which define the conditions
+    (cached properties) of the given classes, by module name."""
+    modules = {}
+    for cls in classes:
+        for klass in cls.__mro__:
+            for attribute in vars(klass).values():
+                if isinstance(attribute, cached_property):
+                    func = attribute.func
+                    modules[func.__module__] = inspect.getsourcefile(func)
+    return modules
+
+
+def check_is_selected(check_id, explicit_checks=None, exclude_checks=None):
+    """Whether a check is selected by the (parts of) check ids given
+    to -c/--checkid and -x/--exclude-checkid."""
+    if explicit_checks and all(
+        explicit not in check_id for explicit in explicit_checks
+    ):
+        return False
+    if exclude_checks and any(excluded in check_id for excluded in exclude_checks):
+        return False
+    return True
+
+
+class ExecutionPlan:
+    """What a CheckRunner runs: the identities of all the check executions,
+    in order, and what provides each of the names (arguments and conditions)
+    their checks ask for.
+
+    Everything is resolved once, up front. The attributes of the context and
+    of each testable are listed a single time, instead of once for every
+    argument of every check execution."""
+
+    # Kinds of providers
+    CONTEXT = "context"  # an attribute of the whole collection
+    TESTABLE = "testable"  # the testable itself, e.g. "font"
+    ATTRIBUTE = "attribute"  # an attribute of the testable, e.g. "ttFont"
+
+    def __init__(self, profile, context, explicit_checks=None, exclude_checks=None):
+        self._context_attributes = frozenset(dir(context))
+        self._testable_attributes = {
+            singular: [frozenset(dir(testable)) for testable in testables]
+            for singular, testables in context.testables_by_type.items()
+        }
+        self._providers = {}
+        self.order = self._compile(profile, context, explicit_checks, exclude_checks)
+
+    def _compile(self, profile, context, explicit_checks, exclude_checks):
+        order = []
+        for section in profile.sections:
+            for check in section.checks:
+                if not check_is_selected(check.id, explicit_checks, exclude_checks):
+                    continue
+                args = set(check.args)
+                context_args = args & self._context_attributes
+
+                # Either this is a check which runs on the whole collection
+                # (i.e. all of its arguments can be called as methods on the
+                # CheckRunContext):
+                if context_args == args:
+                    # In which case, we run it once
+                    order.append(Identity(section, check, ()))
+                    continue
+                # Or it's a check which runs on each item in the collection.
+                individual_args = args - context_args
+                for singular, files in context.testables_by_type.items():
+                    attributes = self._testable_attributes[singular]
+                    if singular in args or all(
+                        individual_args <= file_attributes
+                        for file_attributes in attributes
+                    ):
+                        # In which case, we run it once for each item
+                        for i in range(len(files)):
+                            order.append(Identity(section, check, ((singular, i),)))
+
+        for identity in order:
+            names = list(identity.check.args)
+            names += [is_negated(name)[1] for name in identity.check.conditions]
+            for name in names:
+                self.provider(name, identity.iterargs)
+        return tuple(order)
+
+    def provider(self, name, iterargs):
+        """Where `name` comes from, for a check execution on `iterargs`:
+        a (kind, (singular, index)) pair, or None if nothing provides it."""
+        key = (name, iterargs)
+        if key not in self._providers:
+            self._providers[key] = self._resolve(name, iterargs)
+        return self._providers[key]
+
+    def _resolve(self, name, iterargs):
+        # Is this a property of the whole collection?
+        if name in self._context_attributes:
+            return (self.CONTEXT, (None, None))
+        # Is it a property of the file we're testing?
+        for thing, index in iterargs:
+            # Allow "font" to return the Font object itself
+            if name == thing:
+                return (self.TESTABLE, (thing, index))
+            if name in self._testable_attributes[thing][index]:
+                return (self.ATTRIBUTE, (thing, index))
+        return None
+
+    def describe(self):
+        """A summary of the plan: how many times each check runs, and what
+        provides each of its arguments."""
+        checks = OrderedDict()
+        for identity in self.order:
+            check = identity.check
+            if check.id not in checks:
+                checks[check.id] = {
+                    "section": identity.section.name,
+                    "identities": 0,
+                    "args": {},
+                }
+            checks[check.id]["identities"] += 1
+            for name in check.args:
+                provider = self.provider(name, identity.iterargs)
+                if provider is None:
+                    description = None
+                elif provider[0] == self.CONTEXT:
+                    description = "collection"
+                elif provider[0] == self.TESTABLE:
+                    description = provider[1][0]
+                else:
+                    description = f"{provider[1][0]}.{name}"
+                checks[check.id]["args"][name] = description
+        return {"identities": len(self.order), "checks": checks}
+
+
 class CheckRunner:
     def __init__(
         self,
@@ -43,6 +212,9 @@ class CheckRunner:
         context,
         config,
         jobs=0,
+        executor="threads",
+        cache=None,
+        timings=None,
     ):
         # TODO: transform all iterables that are list like to tuples
         # to make sure that they won't change anymore.
@@ -55,6 +227,13 @@ class CheckRunner:
         self._exclude_checks = config.get("exclude_checks")
         self._iterargs = OrderedDict()
         self._jobs = jobs
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor {executor!r}")
+        self._executor = executor
+        self._cache = cache
+        self.timings = timings
+        self._file_hashes = {}
+        self._source_hashes = {}
         # self._iterargs is the *count of each type of thing*.
         for singular, plural in profile.iterargs.items():
             # self._iterargs["fonts"] = len(values.fonts)
@@ -63,6 +242,7 @@ class CheckRunner:
         self.profile = profile
         self.context = context
         self.context.config = self.config  # Move later
+        self.context.cache = cache
         self.catch_errors = True
 
         for testable in self.context.testables:
@@ -112,24 +292,20 @@ class CheckRunner:
         return self.context.testables_by_type[name][index].file_displayname
 
     def _get(self, name, iterargs, condition=False):
-        # Is this a property of the whole collection?
-        if name in dir(self.context):
+        provider = self.plan.provider(name, iterargs)
+        if provider is None:
+            if condition:
+                raise ValueError(f"Undefined condition {name}")
+            raise ValueError(
+                f"This can't happen: asked for {name} but nothing provides it."
+            )
+        kind, (thing, index) = provider
+        if kind == ExecutionPlan.CONTEXT:
             return getattr(self.context, name)
-        # Is it a property of the file we're testing?
-        for thing, index in iterargs:
-            specific_thing = self.context.testables_by_type[thing][index]
-            # Allow "font" to return the Font object itself
-            if name == thing:
-                return specific_thing
-            if name not in dir(specific_thing):
-                continue
-            return getattr(specific_thing, name)
-        if condition:
-            raise ValueError(f"Undefined condition {name}")
-
-        raise ValueError(
-            f"This can't happen: asked for {name} but nothing provides it."
-        )
+        specific_thing = self.context.testables_by_type[thing][index]
+        if kind == ExecutionPlan.TESTABLE:
+            return specific_thing
+        return getattr(specific_thing, name)
 
     def _get_check_dependencies(
         self, identity: Identity
@@ -188,7 +364,137 @@ class CheckRunner:
             status = Subresult(ERROR, Message("failed-dependencies", error))
             return (status, None)
 
+    @cached_property
+    def _check_ids(self):
+        return {
+            check.id for section in self.profile.sections for check in section.checks
+        }
+
+    @cached_property
+    def _condition_modules(self):
+        """The source files of the modules which define the conditions
+        available on the context and on its testables."""
+        return condition_modules(
+            {type(thing) for thing in [self.context] + self.context.testables}
+        )
+
+    def _hash_source(self, filename):
+        if filename not in self._source_hashes:
+            self._source_hashes[filename] = hash_path(filename) if filename else None
+        return self._source_hashes[filename]
+
+    def _hash_file(self, path):
+        if path not in self._file_hashes:
+            self._file_hashes[path] = hash_path(path)
+        return self._file_hashes[path]
+
+    def _input_files(self, testables):
+        """The files which checks on the given testables may read: the
+        testables themselves, and their sidecar files."""
+        paths = set()
+        for testable in testables:
+            paths.add(os.path.abspath(testable.file))
+            paths.update(sidecar_files(testable.file))
+        return sorted(paths)
+
+    def _asked_attributes(self, check):
+        """The attributes of the context and of the testables (e.g. the
+        conditions) which the check asks for, as arguments or as conditions,
+        with whether each is one of the whole collection."""
+        names = set(check.args)
+        names |= {is_negated(condition)[1] for condition in check.conditions}
+        classes = {type(self.context): True}
+        classes.update((type(thing), False) for thing in self.context.testables)
+        for name in sorted(names):
+            load_condition(name)
+            for cls, of_collection in classes.items():
+                attribute = getattr(cls, name, None)
+                if attribute is not None:
+                    yield attribute, of_collection
+
+    def _is_cacheable(self, check):
+        """Checks which use the network (i.e. which ask for a condition
+        declared with network=True) would replay stale results."""
+        return not any(
+            getattr(attribute, "network", False)
+            for attribute, _ in self._asked_attributes(check)
+        )
+
+    def _cache_key(self, identity: Identity) -> str:
+        """Results are cached by check, by contents of the files being
+        checked and of their sidecar files (which checks on a font may
+        read too; those of the whole collection, for checks which ask for
+        conditions of the collection), by the source code of the check and
+        of the conditions, and by the configuration which applies to the
+        check."""
+        check = identity.check
+        if identity.iterargs:
+            testables = [
+                self.context.testables_by_type[thing][index]
+                for thing, index in identity.iterargs
+            ]
+        else:
+            testables = self.context.testables
+        files = [
+            (
+                os.path.abspath(testable.file),
+                testable.file_displayname,
+                self._hash_file(testable.file),
+            )
+            for testable in testables
+        ]
+        if any(of_collection for _, of_collection in self._asked_attributes(check)):
+            testables = self.context.testables
+        inputs = [
+            (path, self._hash_file(path)) for path in self._input_files(testables)
+        ]
+        sources = [
+            self._hash_source(filename)
+            for filename in sorted(
+                {inspect.getsourcefile(check.__wrapped__)}
+                | set(filter(None, self._condition_modules.values()))
+            )
+        ]
+        config = {
+            key: value
+            for key, value in self.config.items()
+            if key not in CACHE_IGNORED_CONFIG + ("overrides",)
+            and (key == check.id or key not in self._check_ids)
+        }
+        overrides = (
+            self.config.get("overrides", {}).get(check.id),
+            self.profile.overrides.get(check.id),
+        )
+        key = [check.id, files, inputs, sources, __version__, config, overrides]
+        return hashlib.sha256(
+            json.dumps(key, sort_keys=True, default=repr).encode("utf-8")
+        ).hexdigest()
+
     def _run_check(self, identity: Identity):
+        if self._cache is None or not self._is_cacheable(identity.check):
+            return self._timed_execute_check(identity)
+
+        key = self._cache_key(identity)
+        subresults = self._cache.get(key)
+        if subresults is not None:
+            result = CheckResult(identity=identity)
+            result.extend(subresults)
+            return result
+
+        result = self._timed_execute_check(identity)
+        # Errors are usually transient (or bugs), so we'd rather retry them.
+        if all(subresult.status != ERROR for subresult in result.results):
+            self._cache.put(key, result.results)
+        return result
+
+    def _timed_execute_check(self, identity: Identity):
+        if self.timings is None:
+            return self._execute_check(identity)
+        files = [self.get_iterarg(*iterarg) for iterarg in identity.iterargs]
+        with self.timings.measure("check", identity.check.id, files=files):
+            return self._execute_check(identity)
+
+    def _execute_check(self, identity: Identity):
         result = CheckResult(identity=identity)
 
         # Do we skip this check because of dependencies?
@@ -229,75 +535,137 @@ class CheckRunner:
         )
         return result
 
+    @cached_property
+    def plan(self) -> "ExecutionPlan":
+        return ExecutionPlan(
+            self.profile, self.context, self._explicit_checks, self._exclude_checks
+        )
+
     @property
     def order(self) -> Tuple[Identity, ...]:
-        _order = []
-        for section in self.profile.sections:
-            for check in section.checks:
-                if self._explicit_checks and all(
-                    explicit not in check.id for explicit in self._explicit_checks
-                ):
-                    continue
-                if self._exclude_checks and any(
-                    excluded in check.id for excluded in self._exclude_checks
-                ):
-                    continue
-                args = set(check.args)
-                context_args = set(arg for arg in args if arg in dir(self.context))
+        return self.plan.order
 
-                # Either this is a check which runs on the whole collection
-                # (i.e. all of its arguments can be called as methods on the
-                # CheckRunContext):
-                if context_args == args:
-                    # In which case, we run it once
-                    _order.append(Identity(section, check, ()))
-                    continue
-                # Or it's a check which runs on each item in the collection.
-                for singular, files in self.context.testables_by_type.items():
-                    individual_args = args - context_args
-                    if (
-                        all(
-                            arg in dir(file)
-                            for arg in individual_args
-                            for file in files
-                        )
-                        or singular in args
-                    ):
-                        # In which case, we run it once for each item
-                        for i, file in enumerate(files):
-                            _order.append(Identity(section, check, ((singular, i),)))
-        return tuple(_order)
+    @staticmethod
+    def _schedule(order):
+        """Group the execution order into batches of identities sharing the
+        same iterargs, i.e. all the checks on a given font. A batch runs on
+        a single worker, so each file is opened (and its conditions are
+        computed) only once. Checks on the whole collection run last."""
+        batches = OrderedDict()
+        collection = []
+        for index, identity in enumerate(order):
+            if identity.iterargs:
+                batches.setdefault(identity.iterargs, []).append(index)
+            else:
+                collection.append(index)
+        batches = list(batches.values())
+        if collection:
+            batches.append(collection)
+        return batches
 
     def run(self, reporters):
+        order = self.order
+        batches = self._schedule(order) if self._jobs > 1 else None
+        if batches is None:
+            run_order = order
+        else:
+            # Results are reported batch after batch, as scheduled.
+            run_order = tuple(order[index] for batch in batches for index in batch)
+
         # Tell all the reporters we're starting
         for reporter in reporters:
-            reporter.start(self.order)
-
-        reporter_lock = threading.Lock()
+            reporter.start(run_order)
 
         def distribute_result(result):
-            with reporter_lock:
+            with timing.measure("report", "distribute_result"):
                 for reporter in reporters:
                     reporter.receive_result(result)
 
-        if self._jobs > 1:
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=self._jobs
-            ) as executor:
-                for identity in self.order:
-                    future = executor.submit(self._run_check, identity)
-                    future.add_done_callback(
-                        lambda future: distribute_result(future.result())
-                    )
-        else:
-            for identity in self.order:
-                result = self._run_check(identity)
-                distribute_result(result)
+        timing.active_recorder = self.timings
+        try:
+            if batches is None:
+                for identity in order:
+                    result = self._run_check(identity)
+                    distribute_result(result)
+            else:
+                self._run_batches(order, batches, distribute_result)
+        finally:
+            timing.active_recorder = None
+
+        if self._cache is not None:
+            self._cache.evict()
 
         # Tell all the reporters we're done
         for reporter in reporters:
             reporter.end()
 
+    def _run_batch(self, order, indexes):
+        results = [(index, self._run_check(order[index]).results) for index in indexes]
+        # Threads share our timings, so there is nothing to hand over.
+        return results, None
+
+    def _run_batches(self, order, batches, distribute_result):
+        import concurrent.futures
+        import multiprocessing
+
+        if self._executor == "processes":
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._jobs,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process_worker,
+                initargs=self._worker_spec(),
+            )
+            run_batch = _run_checks_in_process
+        else:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._jobs)
+            run_batch = partial(self._run_batch, order)
+
+        with executor:
+            futures = {
+                executor.submit(run_batch, batch): position
+                for position, batch in enumerate(batches)
+            }
+            # Batches may finish in any order, but are reported in the
+            # scheduled one, so that the reports are deterministic.
+            finished = {}
+            next_position = 0
+            for future in concurrent.futures.as_completed(futures):
+                finished[futures[future]], timings = future.result()
+                if timings:
+                    self.timings.merge(timings)
+                while next_position in finished:
+                    for index, subresults in finished.pop(next_position):
+                        result = CheckResult(identity=order[index])
+                        result.extend(subresults)
+                        distribute_result(result)
+                    next_position += 1
+
+    def _worker_spec(self):
+        """Everything a worker process needs to rebuild this runner.
+
+        Testables are sent without their cached properties, so that each
+        worker opens its own files instead of receiving pickled copies."""
+        testables = [
+            dataclasses.replace(testable, context=None)
+            for testable in self.context.testables
+        ]
+        context = dataclasses.replace(
+            self.context,
+            testables=testables,
+            is_multithreaded=False,
+            in_worker_process=True,
+        )
+        # Conditions are attached to the testable classes when the modules
+        # defining them are imported, so the workers must import them too.
+        return (
+            self.profile,
+            self.config,
+            context,
+            self._condition_modules,
+            self._cache,
+            None if self.timings is None else self.timings.events is not None,
+        )
+
     def _override_status(self, subresult: Subresult, check):
         orig_status = subresult.status.name
 
@@ -329,3 +697,42 @@ overridden by the {self.profile.name} profile:
 overridden by the configuration file.
 """
         return subresult
+
+
+# State of a worker process in a process-pool run.
+_worker_runner = None
+_worker_order = None
+
+
+def _init_process_worker(profile, config, context, modules, cache, trace):
+    global _worker_runner, _worker_order  # pylint: disable=global-statement
+    for module_name, filename in modules.items():
+        import_module_or_file(module_name, filename)
+    timings = None if trace is None else timing.TimingRecorder(trace=trace)
+    timing.active_recorder = timings
+    _worker_runner = CheckRunner(profile, context, config, cache=cache, timings=timings)
+    _worker_order = _worker_runner.order
+
+
+def _picklable(subresult: Subresult) -> Subresult:
+    message = subresult.message
+    if isinstance(message.message, str):
+        return subresult
+    try:
+        pickle.dumps(message.message)
+    except Exception:
+        subresult.message = Message(message.code, str(message.message))
+    return subresult
+
+
+def _run_checks_in_process(indexes):
+    """Run a batch of the execution order in a worker process and return
+    the subresults of each identity (plus the timings measured meanwhile,
+    if the run is being timed). Only their positions in the order are
+    sent back and forth; the parent process owns the identities."""
+    results = []
+    for index in indexes:
+        result = _worker_runner._run_check(_worker_order[index])
+        results.append((index, [_picklable(subresult) for subresult in result.results]))
+    timings = _worker_runner.timings
+    return results, timings.pop() if timings is not None else None
@@ -137,30 +137,17 @@ def check_color_cpal_brightness(config, ttFont):
         "https://github.com/fonttools/fontbakery/pull/3905",
     ],
 )
-def check_empty_glyph_on_gid1_for_colrv0(ttFont):
+def check_empty_glyph_on_gid1_for_colrv0(font):
     """Put an empty glyph on GID 1 right after the .notdef glyph for COLRv0 fonts."""
     SUGGESTED_FIX = (
         "To fix this, please reorder the glyphs so that"
         " a glyph with no contours is on GID 1 right after the `.notdef` glyph."
         " This could be the space glyph."
     )
-    from fontTools.pens.areaPen import AreaPen
+    ttFont = font.ttFont
+    area = font.glyph_geometry.area(1)
 
-    # This check modifies the font file with `.draw(pen)`
-    # so here we'll work with a copy of the object so that we
-    # do not affect other checks:
-    from copy import deepcopy
-
-    ttFont_copy = deepcopy(ttFont)
-
-    glyphOrder = ttFont_copy.getGlyphOrder()
-    glyphSet = ttFont_copy.getGlyphSet()
-    pen = AreaPen(glyphSet)
-    gid1 = glyphSet[glyphOrder[1]]
-    gid1.draw(pen)
-    area = pen.value
-
-    if "COLR" in ttFont_copy.keys() and ttFont_copy["COLR"].version == 0 and area != 0:
+    if "COLR" in ttFont.keys() and ttFont["COLR"].version == 0 and area != 0:
         yield FAIL, Message(
             "gid1-has-contours",
             "This is a COLR font. As a workaround for a rendering bug in"
@@ -7,7 +7,7 @@ from fontbakery.testable import CheckRunContext, Font
 from fontbakery.utils import get_glyph_name
 
 
-@condition(CheckRunContext)
+@condition(CheckRunContext, network=True)
 def network(collection):
     return not collection.config["skip_network"]
 
@@ -208,16 +208,14 @@ def is_cjk_font(font):
 @condition(Font)
 def get_cjk_glyphs(font):
     """Return all glyphs which belong to a CJK unicode block"""
-    from fontbakery.constants import CJK_UNICODE_RANGES
-
-    results = []
-    cjk_unicodes = set()
-    for start, end in CJK_UNICODE_RANGES:
-        cjk_unicodes |= set(u for u in range(start, end + 1))
-    for uni, glyph_name in font.ttFont.getBestCmap().items():
-        if uni in cjk_unicodes:
-            results.append(glyph_name)
-    return results
+    from fontbakery.unicode_ranges import cjk_index
+
+    cjk_blocks = cjk_index()
+    return [
+        glyph_name
+        for uni, glyph_name in font.ttFont.getBestCmap().items()
+        if uni in cjk_blocks
+    ]
 
 
 @condition(Font)
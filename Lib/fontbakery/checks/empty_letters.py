@@ -30,9 +30,12 @@ def _quick_and_dirty_glyph_is_empty(font, glyph_name):
         top_dict = font["CFF "].cff.topDictIndex[0]
     char_strings = top_dict.CharStrings
     char_string = char_strings[glyph_name]
-    if len(char_string.bytecode) <= 1:
-        return True
-    return False
+    # A charstring which has been drawn holds its decompiled program
+    # instead of its bytecode (bytecode is cleared after program is set).
+    bytecode = char_string.bytecode
+    if bytecode is not None:
+        return len(bytecode) <= 1
+    return len(char_string.program) <= 1
 
 
 @check(
@@ -59,9 +62,15 @@ def _quick_and_dirty_glyph_is_empty(font, glyph_name):
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/2460",
 )
-def check_empty_letters(ttFont):
+def check_empty_letters(font):
     """Letters in font have glyphs that are not empty?"""
+    ttFont = font.ttFont
     cmap = ttFont.getBestCmap()
+    # Drawing every glyph of a family of large CJK CFF fonts is too slow,
+    # so those only get the quick test; TrueType glyphs which pass it are
+    # also looked up in the glyph geometry (e.g. for composites of empty
+    # glyphs).
+    glyph_geometry = font.glyph_geometry if "glyf" in ttFont else None
     blank_ok_set = ALL_HANGUL_SYLLABLES_CODEPOINTS - MODERN_HANGUL_SYLLABLES_CODEPOINTS
     num_blank_hangul_glyphs = 0
     passed = True
@@ -83,7 +92,11 @@ def check_empty_letters(ttFont):
     }
     for unicode_val, glyph_name in cmap.items():
         category = unicodedata.category(chr(unicode_val))
-        glyph_is_empty = _quick_and_dirty_glyph_is_empty(ttFont, glyph_name)
+        glyph_is_empty = _quick_and_dirty_glyph_is_empty(ttFont, glyph_name) or (
+            glyph_geometry is not None
+            and not glyph_geometry.is_broken(glyph_name)
+            and not glyph_geometry.has_ink(glyph_name)
+        )
 
         if glyph_is_empty and unicode_val in blank_ok_set:
             num_blank_hangul_glyphs += 1
@@ -75,13 +75,13 @@ def is_up_to_date(installed_str, latest_str):
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/2093",
 )
-def check_fontbakery_version(font, config):
+def check_fontbakery_version(font, config, http):
     """Do we have the latest version of FontBakery installed?"""
     import pip_api
     import requests
 
     try:
-        response = requests.get(
+        response = http.get(
             "https://pypi.org/pypi/fontbakery/json", timeout=config.get("timeout")
         )
 
@@ -1,10 +1,26 @@
 from pathlib import Path
-import tempfile
 
+from fontbakery.external_tools import OUTPUT_DIR, ToolResult
 from fontbakery.prelude import check, ERROR, FAIL, INFO, PASS, WARN, Message
 from fontbakery.utils import exit_with_install_instructions
 
 
+def fontvalidator_command(files):
+    command = ["FontValidator"]
+    for filename in files:
+        command += ["-file", filename]
+    return command + ["-all-tables", "-report-dir", OUTPUT_DIR, "-no-raster-tests"]
+
+
+def fontvalidator_report(result, filename):
+    """The part of the result of a batch which concerns one of its fonts."""
+    report_name = f"{Path(filename).name}.report.xml"
+    files = (
+        {report_name: result.files[report_name]} if report_name in result.files else {}
+    )
+    return ToolResult(result.returncode, result.stdout, result.stderr, files)
+
+
 @check(
     id="fontvalidator",
     rationale="""
@@ -16,7 +32,7 @@ from fontbakery.utils import exit_with_install_instructions
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/4829",
 )
-def check_fontvalidator(font, config):
+def check_fontvalidator(font, config, external_tools):
     """Checking with Microsoft Font Validator."""
 
     try:
@@ -143,25 +159,47 @@ def check_fontvalidator(font, config):
     if disabled_checks is not None:
         disabled_fval_checks = disabled_checks
 
-    report_dir = tempfile.TemporaryDirectory(prefix="fontval-")
-    import subprocess
+    # Several fonts may be validated by a single run of FontValidator
+    # (which spends a lot of its time starting up). The other fonts of the
+    # batch then find their reports ready when they are checked. Worker
+    # processes do not share their reports, and each would validate fonts
+    # checked by the others, so they validate one font at a time.
+    batch_size = check_config.get("batch_size", 1)
+    batch = [font.file]
+    if (
+        batch_size > 1
+        and font.context is not None
+        and not font.context.in_worker_process
+    ):
+        others = [f.file for f in font.context.fonts]
+        if font.file in others:
+            others = others[others.index(font.file) + 1 :]
+        names = {Path(font.file).name}
+        for other in others:
+            if len(batch) == batch_size:
+                break
+            # Reports are named after the font files
+            if Path(other).name not in names:
+                names.add(Path(other).name)
+                batch.append(other)
 
     try:
-        fval_cmd = [
-            "FontValidator",
-            "-file",
-            font.file,
-            "-all-tables",
-            "-report-dir",
-            report_dir.name,
-            "-no-raster-tests",
-        ]
-        subprocess.check_output(fval_cmd, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as e:
+        results = external_tools.run_batch(
+            fontvalidator_command, batch, fontvalidator_report
+        )
+    except (OSError, IOError) as error:
+        yield ERROR, Message(
+            "fontval-not-available",
+            "Mono runtime and/or Microsoft Font Validator are not available!",
+        )
+        raise error
+
+    result = results[font.file]
+    if result.returncode:
         # Filter uninteresting progress reports.
         filtered_output = [
             msg
-            for msg in e.output.decode().splitlines()
+            for msg in (result.stdout + result.stderr).decode().splitlines()
             if not msg.startswith(
                 ("Table Test:", "Progress: Validating glyph with index")
             )
@@ -173,12 +211,6 @@ def check_fontvalidator(font, config):
                 " Output follows :\n\n{}\n"
             ).format("\n".join(filtered_output)),
         )
-    except (OSError, IOError) as error:
-        yield ERROR, Message(
-            "fontval-not-available",
-            "Mono runtime and/or Microsoft Font Validator are not available!",
-        )
-        raise error
 
     def report_message(msg, details):
         if details:
@@ -203,36 +235,35 @@ def check_fontvalidator(font, config):
         else:
             return f"MS-FonVal: {msg}"
 
-    report_file = Path(report_dir.name) / f"{Path(font.file).name}.report.xml"
+    report_xml = result.files[f"{Path(font.file).name}.report.xml"]
 
     grouped_msgs = {}
-    with open(report_file, "rb") as xml_report:
-        doc = lxml.etree.fromstring(xml_report.read())
-        for report in doc.iterfind(".//Report"):
-            msg = report.get("Message")
-            details = report.get("Details")
-
-            disable_it = False
-            if enabled_checks is not None:
-                if not any(substring in msg for substring in enabled_checks):
-                    disable_it = True
-            else:
-                if any(substring in msg for substring in disabled_fval_checks):
-                    disable_it = True
-            if disable_it:
-                continue
-
-            if msg not in grouped_msgs:
-                grouped_msgs[msg] = {
-                    "errortype": report.get("ErrorType"),
-                    "details": [details],
-                }
-            else:
-                if details not in grouped_msgs[msg]["details"]:
-                    # avoid cluttering the output with tons of identical reports
-                    # yield INFO, 'grouped_msgs[msg]["details"]: {}'.format(
-                    # grouped_msgs[msg]["details"])
-                    grouped_msgs[msg]["details"].append(details)
+    doc = lxml.etree.fromstring(report_xml)
+    for report in doc.iterfind(".//Report"):
+        msg = report.get("Message")
+        details = report.get("Details")
+
+        disable_it = False
+        if enabled_checks is not None:
+            if not any(substring in msg for substring in enabled_checks):
+                disable_it = True
+        else:
+            if any(substring in msg for substring in disabled_fval_checks):
+                disable_it = True
+        if disable_it:
+            continue
+
+        if msg not in grouped_msgs:
+            grouped_msgs[msg] = {
+                "errortype": report.get("ErrorType"),
+                "details": [details],
+            }
+        else:
+            if details not in grouped_msgs[msg]["details"]:
+                # avoid cluttering the output with tons of identical reports
+                # yield INFO, 'grouped_msgs[msg]["details"]: {}'.format(
+                # grouped_msgs[msg]["details"])
+                grouped_msgs[msg]["details"].append(details)
 
     # ---------------------------
     # Here we start emitting the grouped log messages
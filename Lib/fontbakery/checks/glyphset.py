@@ -1,5 +1,3 @@
-from copy import deepcopy
-
 from fontbakery.constants import (
     NameID,
     PlatformID,
@@ -262,16 +260,20 @@ def check_missing_small_caps_glyphs(ttFont):
                 break
 
 
-def can_shape(ttFont, text, parameters=None):
+def can_shape(font, text, parameters=None):
     """
-    Returns true if the font can render a text string without any
-    .notdef characters.
+    Returns true if the font (a Font, or a TTFont read from a file)
+    can render a text string without any .notdef characters.
     """
-    from vharfbuzz import Vharfbuzz
+    from fontTools.ttLib import TTFont
+
+    if isinstance(font, TTFont):
+        from fontbakery.harfbuzz import HarfBuzz
 
-    filename = ttFont.reader.file.name
-    vharfbuzz = Vharfbuzz(filename)
-    buf = vharfbuzz.shape(text, parameters)
+        harfbuzz = HarfBuzz(font.reader.file.name)
+    else:
+        harfbuzz = font.harfbuzz
+    buf = harfbuzz.shaper().shape(text, parameters)
     return all(g.codepoint != 0 for g in buf.glyph_infos)
 
 
@@ -283,7 +285,7 @@ def can_shape(ttFont, text, parameters=None):
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/3159",
 )
-def check_render_own_name(ttFont):
+def check_render_own_name(font, ttFont):
     """Ensure font can render its own name."""
     menu_name = (
         ttFont["name"]
@@ -295,7 +297,7 @@ def check_render_own_name(ttFont):
         )
         .toUnicode()
     )
-    if not can_shape(ttFont, menu_name):
+    if not can_shape(font, menu_name):
         yield FAIL, Message(
             "render-own-name",
             f".notdef glyphs were found when attempting to render {menu_name}",
@@ -369,13 +371,9 @@ def check_soft_hyphen(ttFont):
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/3160",
 )
-def unreachable_glyphs(ttFont, config):
+def unreachable_glyphs(font, config):
     """Check font contains no unreachable glyphs"""
-
-    # remove_lookup_outputs() mutates the TTF; deep copy to avoid this, and so
-    # avoid issues with concurrent tests that also use ttFont.
-    # See https://github.com/fonttools/fontbakery/issues/4834
-    ttFont = deepcopy(ttFont)
+    ttFont = font.ttFont
 
     def remove_lookup_outputs(all_glyphs, lookup):
         if lookup.LookupType == 1:  # Single:
@@ -409,13 +407,6 @@ def unreachable_glyphs(ttFont, config):
             # deal with the lookups that a contextual lookup references.
             pass
 
-        if lookup.LookupType == 7:  # Extension Substitution:
-            # Extension mechanism for other substitutions
-            for xt in lookup.SubTable:
-                xt.SubTable = [xt.ExtSubTable]
-                xt.LookupType = xt.ExtSubTable.LookupType
-                remove_lookup_outputs(all_glyphs, xt)
-
         if lookup.LookupType == 8:  # Reverse chaining context single:
             # Applied in reverse order,
             # replace single glyph in chaining context
@@ -512,11 +503,9 @@ def unreachable_glyphs(ttFont, config):
                     if hasattr(paint, "Glyph"):
                         all_glyphs.discard(paint.Glyph)
 
-    if "GSUB" in ttFont and ttFont["GSUB"].table.LookupList:
-        lookups = ttFont["GSUB"].table.LookupList.Lookup
-
-        for lookup in lookups:
-            remove_lookup_outputs(all_glyphs, lookup)
+    # Extension Substitution (type 7) lookups come unwrapped
+    for lookup in font.lookups("GSUB"):
+        remove_lookup_outputs(all_glyphs, lookup)
 
     # Remove components used in TrueType table
     if "glyf" in ttFont:
@@ -1,57 +1,96 @@
+import hashlib
+from io import BytesIO
+
 from fontbakery.prelude import check, Message, FAIL, INFO, PASS
 from fontbakery.testable import Font
 from fontbakery.utils import filesize_formatting
 
 
-def hinting_stats(font: Font):
+# Dehinted sizes computed in this process, by hash of the font's contents.
+_dehinted_sizes = {}
+
+
+def dehinted_size(data, cache=None):
     """
-    Return file size differences for a hinted font compared to an dehinted version
-    of same file
+    The size of a font file (given as bytes) once its hinting is removed,
+    or None if it has neither TrueType nor CFF outlines.
+
+    The font is dehinted and saved in memory. Results are kept by hash of
+    the font's contents, for the rest of the process and, if a ResultCache
+    is given, across check runs.
     """
-    import os
-    from io import BytesIO
+    import fontTools
+    import dehinter
+
+    digest = hashlib.sha256(data).hexdigest()
+    if digest in _dehinted_sizes:
+        return _dehinted_sizes[digest]
+
+    key = hashlib.sha256(
+        f"dehinted-size {digest} {fontTools.version} {dehinter.__version__}".encode()
+    ).hexdigest()
+    size = cache.get(key) if cache is not None else None
+    if not isinstance(size, int):
+        size = _dehint(data)
+        if cache is not None and size is not None:
+            cache.put(key, size)
+    _dehinted_sizes[digest] = size
+    return size
+
+
+def _dehint(data):
     from dehinter.font import dehint
-    from fontTools.subset import main as pyftsubset
+    from fontTools import subset
     from fontTools.ttLib import TTFont
 
-    hinted_size = os.stat(font.file).st_size
-    ttFont = TTFont(font.file)  # Use our own copy since we will dehint it
-
-    if font.is_ttf:
-        dehinted_buffer = BytesIO()
+    output = BytesIO()
+    ttFont = TTFont(BytesIO(data))  # Our own copy, since we will dehint it
+    if "glyf" in ttFont:
         dehint(ttFont, verbose=False)
-        ttFont.save(dehinted_buffer)
-        dehinted_buffer.seek(0)
-        dehinted_size = len(dehinted_buffer.read())
-    elif font.is_cff or font.is_cff2:
-        ext = os.path.splitext(font.file)[1]
-        tmp = font.file.replace(ext, "-tmp-dehinted%s" % ext)
-        args = [
-            font.file,
-            "--no-hinting",
-            "--glyphs=*",
-            "--ignore-missing-glyphs",
-            "--no-notdef-glyph",
-            "--no-recommended-glyphs",
-            "--no-layout-closure",
-            "--layout-features=*",
-            "--no-desubroutinize",
-            "--name-languages=*",
-            "--glyph-names",
-            "--no-prune-unicode-ranges",
-            "--output-file=%s" % tmp,
-        ]
-        pyftsubset(args)
-
-        dehinted_size = os.stat(tmp).st_size
-        os.remove(tmp)
-
+        ttFont.save(output)
+    elif "CFF " in ttFont or "CFF2" in ttFont:
+        # Same as running pyftsubset with --no-hinting --glyphs=*
+        # --ignore-missing-glyphs --no-notdef-glyph --no-recommended-glyphs
+        # --no-layout-closure --layout-features=* --no-desubroutinize
+        # --name-languages=* --glyph-names --no-prune-unicode-ranges
+        options = subset.Options(
+            hinting=False,
+            ignore_missing_glyphs=True,
+            notdef_glyph=False,
+            recommended_glyphs=False,
+            layout_closure=False,
+            layout_features=["*"],
+            desubroutinize=False,
+            name_languages=["*"],
+            glyph_names=True,
+            prune_unicode_ranges=False,
+        )
+        options.flavor = ttFont.flavor
+        subsetter = subset.Subsetter(options=options)
+        subsetter.populate(glyphs=ttFont.getGlyphOrder())
+        subsetter.subset(ttFont)
+        subset.save_font(ttFont, output, options)
     else:
         return None
+    return len(output.getvalue())
+
+
+def hinting_stats(font: Font):
+    """
+    Return file size differences for a hinted font compared to an dehinted version
+    of same file
+    """
+    with open(font.file, "rb") as fh:
+        data = fh.read()
+    cache = font.context.cache if font.context is not None else None
+
+    dehinted = dehinted_size(data, cache)
+    if dehinted is None:
+        return None
 
     return {
-        "dehinted_size": dehinted_size,
-        "hinted_size": hinted_size,
+        "dehinted_size": dehinted,
+        "hinted_size": len(data),
     }
 
 
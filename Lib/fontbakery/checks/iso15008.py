@@ -4,10 +4,10 @@ Checks for suitability for in-car displays (ISO 15008).
 from beziers.line import Line
 from beziers.path import BezierPath
 from beziers.point import Point
-from fontTools.pens.boundsPen import BoundsPen
 
+from fontbakery.lookups import substituted_glyphs
 from fontbakery.prelude import check, FAIL, Message
-from fontbakery.utils import exit_with_install_instructions
+from fontbakery.utils import drawable_glyph_set, exit_with_install_instructions
 
 DISCLAIMER = """
         (Note that passing this check does not guarantee compliance with ISO-15008.)
@@ -15,7 +15,7 @@ DISCLAIMER = """
 
 
 def xheight_intersections(ttFont, glyph):
-    glyphset = ttFont.getGlyphSet()
+    glyphset = drawable_glyph_set(ttFont)
     if glyph not in glyphset:
         return []
 
@@ -36,7 +36,7 @@ def xheight_intersections(ttFont, glyph):
 
 
 def stem_width(ttFont):
-    glyphset = ttFont.getGlyphSet()
+    glyphset = drawable_glyph_set(ttFont)
     if "l" not in glyphset:
         return None
 
@@ -55,10 +55,20 @@ def pair_kerning(font, left, right):
     except ImportError:
         exit_with_install_instructions("iso15008")
 
-    with open(font.file, "rb") as fontfile:
-        fontdata = fontfile.read()
-    face = hb.Face(fontdata)
-    font = hb.Font(face)
+    kerning = font.kerning_index
+    if kerning.complete:
+        # Pair adjustments only: no need to shape the pair, unless GSUB may
+        # replace either glyph with another one before it is kerned.
+        cmap = font.ttFont.getBestCmap()
+        pair = (cmap.get(ord(left)), cmap.get(ord(right)))
+        substituted = substituted_glyphs(font.ttFont)
+        if substituted is not None and not any(
+            glyph is None or glyph in substituted for glyph in pair
+        ):
+            return kerning.kern(*pair)
+
+    face = font.harfbuzz.face
+    font = font.harfbuzz.font()
     scale = face.upem
     font.scale = (scale, scale)
     buf = hb.Buffer()
@@ -90,10 +100,10 @@ def pair_kerning(font, left, right):
         "https://github.com/fonttools/fontbakery/issues/3250",
     ],
 )
-def check_iso15008_proportions(ttFont):
+def check_iso15008_proportions(font):
     """Check if 0.65 => (H width / H height) => 0.80"""
-    glyphset = ttFont.getGlyphSet()
-    if "H" not in glyphset:
+    glyph_geometry = font.glyph_geometry
+    if "H" not in glyph_geometry:
         yield FAIL, Message(
             "glyph-not-present",
             "There was no 'H' glyph in the font,"
@@ -101,9 +111,7 @@ def check_iso15008_proportions(ttFont):
         )
         return
 
-    pen = BoundsPen(glyphset)
-    glyphset["H"].draw(pen)
-    (xMin, yMin, xMax, yMax) = pen.bounds
+    (xMin, yMin, xMax, yMax) = glyph_geometry.bounds("H")
     proportion = (xMax - xMin) / (yMax - yMin)
     if not 0.65 <= proportion <= 0.80:
         yield FAIL, Message(
@@ -199,10 +207,7 @@ def check_iso15008_intercharacter_spacing(font, ttFont):
         )
 
     # For v, however, a simple LSB/RSB is adequate.
-    glyphset = ttFont.getGlyphSet()
-    pen = BoundsPen(glyphset)
-    glyphset["v"].draw(pen)
-    (xMin, yMin, xMax, yMax) = pen.bounds
+    (xMin, yMin, xMax, yMax) = font.glyph_geometry.bounds("v")
     v_advance = ttFont["hmtx"]["v"][0]
 
     v_lsb = xMin
@@ -249,15 +254,7 @@ def check_iso15008_intercharacter_spacing(font, ttFont):
 )
 def check_iso15008_interword_spacing(font, ttFont):
     """Check if spacing between words is adequate for display use"""
-
-    # This check modifies the font file with `.draw(pen)`
-    # so here we'll work with a copy of the object so that we
-    # do not affect other checks:
-    from copy import deepcopy
-
-    ttFont_copy = deepcopy(ttFont)
-
-    l_intersections = xheight_intersections(ttFont_copy, "l")
+    l_intersections = xheight_intersections(ttFont, "l")
     if len(l_intersections) < 2:
         yield FAIL, Message(
             "glyph-not-present",
@@ -265,21 +262,18 @@ def check_iso15008_interword_spacing(font, ttFont):
         )
         return
 
-    l_advance = ttFont_copy["hmtx"]["l"][0]
+    l_advance = ttFont["hmtx"]["l"][0]
     l_rsb = l_advance - l_intersections[-1].point.x
 
-    glyphset = ttFont_copy.getGlyphSet()
-    pen = BoundsPen(glyphset)
-    glyphset["m"].draw(pen)
-    (xMin, yMin, xMax, yMax) = pen.bounds
-    m_advance = ttFont_copy["hmtx"]["m"][0]
+    (xMin, yMin, xMax, yMax) = font.glyph_geometry.bounds("m")
+    m_advance = ttFont["hmtx"]["m"][0]
     m_lsb = xMin
     m_rsb = m_advance - (m_lsb + xMax - xMin)
 
-    n_lsb = ttFont_copy["hmtx"]["n"][1]
+    n_lsb = ttFont["hmtx"]["n"][1]
 
     l_m = l_rsb + pair_kerning(font, "l", "m") + m_lsb
-    space_width = ttFont_copy["hmtx"]["space"][0]
+    space_width = ttFont["hmtx"]["space"][0]
     # Add spacing caused by normal sidebearings
     space_width += m_rsb + n_lsb
 
@@ -308,10 +302,11 @@ def check_iso15008_interword_spacing(font, ttFont):
         "https://github.com/fonttools/fontbakery/issues/3254",
     ],
 )
-def check_iso15008_interline_spacing(ttFont):
+def check_iso15008_interline_spacing(font):
     """Check if spacing between lines is adequate for display use"""
-    glyphset = ttFont.getGlyphSet()
-    if "h" not in glyphset or "g" not in glyphset:
+    ttFont = font.ttFont
+    glyph_geometry = font.glyph_geometry
+    if "h" not in glyph_geometry or "g" not in glyph_geometry:
         yield FAIL, Message(
             "glyph-not-present",
             "There was no 'g'/'h' glyph in the font,"
@@ -319,13 +314,8 @@ def check_iso15008_interline_spacing(ttFont):
         )
         return
 
-    pen = BoundsPen(glyphset)
-    glyphset["h"].draw(pen)
-    (_, _, _, h_yMax) = pen.bounds
-
-    pen = BoundsPen(glyphset)
-    glyphset["g"].draw(pen)
-    (_, g_yMin, _, _) = pen.bounds
+    (_, _, _, h_yMax) = glyph_geometry.bounds("h")
+    (_, g_yMin, _, _) = glyph_geometry.bounds("g")
 
     linegap = (
         (g_yMin - ttFont["OS/2"].sTypoDescender)
@@ -42,19 +42,9 @@ def ligatures(font):
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/1145",
 )
-def check_kerning_for_non_ligated_sequences(ttFont, config, ligatures):
+def check_kerning_for_non_ligated_sequences(font, config, ligatures):
     """Is there kerning info for non-ligated sequences?"""
 
-    def look_for_nonligated_kern_info(table):
-        for pairpos in table.SubTable:
-            for i, glyph in enumerate(pairpos.Coverage.glyphs):
-                if not hasattr(pairpos, "PairSet"):
-                    continue
-                for pairvalue in pairpos.PairSet[i].PairValueRecord:
-                    kern_pair = (glyph, pairvalue.SecondGlyph)
-                    if kern_pair in ligature_pairs:
-                        ligature_pairs.remove(kern_pair)
-
     def ligatures_sequences(pairs):
         return [f"{first} + {second}" for first, second in pairs]
 
@@ -80,13 +70,10 @@ def check_kerning_for_non_ligated_sequences(ttFont, config, ligatures):
                 pairs = make_pairs(first, components)
                 ligature_pairs.update(pairs)
 
-        ligature_pairs = sorted(ligature_pairs)
-
-        for record in ttFont["GSUB"].table.FeatureList.FeatureRecord:
-            if record.FeatureTag == "kern":
-                for index in record.Feature.LookupListIndex:
-                    lookup = ttFont["GSUB"].table.LookupList.Lookup[index]
-                    look_for_nonligated_kern_info(lookup)
+        kerning = font.kerning_index
+        ligature_pairs = [
+            pair for pair in sorted(ligature_pairs) if not kerning.has_pair(*pair)
+        ]
 
         if ligature_pairs:
             yield WARN, Message(
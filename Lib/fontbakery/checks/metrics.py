@@ -1,5 +1,4 @@
 import os
-from fontTools.pens.boundsPen import BoundsPen
 from fontbakery.prelude import check, condition, Message, PASS, FAIL, WARN, SKIP
 from fontbakery.testable import CheckRunContext
 
@@ -279,39 +278,30 @@ def check_linegaps(ttFont):
     experimental="Since 2024/Jul/17",
     proposal="https://github.com/fonttools/fontbakery/issues/3170",
 )
-def check_typoascender_exceeds_Agrave(ttFont):
+def check_typoascender_exceeds_Agrave(font):
     """Checking that the typoAscender exceeds the yMax of the /Agrave."""
+    ttFont = font.ttFont
 
-    # This check modifies the font file with `.draw(pen)`
-    # so here we'll work with a copy of the object so that we
-    # do not affect other checks:
-    from copy import deepcopy
-
-    ttFont_copy = deepcopy(ttFont)
-
-    if "OS/2" not in ttFont_copy:
+    if "OS/2" not in ttFont:
         yield FAIL, Message("lacks-OS/2", "Font file lacks OS/2 table")
         return
 
-    glyphset = ttFont_copy.getGlyphSet()
+    glyph_geometry = font.glyph_geometry
 
-    if "Agrave" not in glyphset and "uni00C0" not in glyphset:
+    if "Agrave" in glyph_geometry:
+        bounds = glyph_geometry.bounds("Agrave")
+    elif "uni00C0" in glyph_geometry:
+        bounds = glyph_geometry.bounds("uni00C0")
+    else:
         yield SKIP, Message(
             "lacks-Agrave",
             "Font file lacks the /Agrave, so it can’t be compared with typoAscender",
         )
         return
 
-    pen = BoundsPen(glyphset)
-
-    try:
-        glyphset["Agrave"].draw(pen)
-    except KeyError:
-        glyphset["uni00C0"].draw(pen)
-
-    yMax = pen.bounds[-1]
+    yMax = bounds[-1]
 
-    typoAscender = ttFont_copy["OS/2"].sTypoAscender
+    typoAscender = ttFont["OS/2"].sTypoAscender
 
     if typoAscender < yMax:
         yield WARN, Message(
@@ -10,7 +10,7 @@ from fontbakery.prelude import check, Message, ERROR, INFO, PASS
     conditions=["network", "familyname"],
     proposal="https://github.com/fonttools/fontbakery/issues/494",
 )
-def check_fontdata_namecheck(ttFont, familyname):
+def check_fontdata_namecheck(ttFont, familyname, http):
     """Familyname must be unique according to namecheck.fontdata.com"""
     import requests
 
@@ -20,7 +20,7 @@ def check_fontdata_namecheck(ttFont, familyname):
         # Since October 2019, it seems that we need to fake our user-agent
         # in order to get correct query results
         FAKE = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1)"
-        response = requests.post(
+        response = http.post(
             NAMECHECK_URL,
             params={"q": familyname},
             headers={"User-Agent": FAKE},
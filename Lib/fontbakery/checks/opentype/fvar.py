@@ -669,7 +669,7 @@ def check_varfont_family_axis_ranges(ttFonts):
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3910",
 )
-def check_slant_direction(ttFont, uharfbuzz_blob):
+def check_slant_direction(font, ttFont):
     """Checking direction of slnt axis angles."""
     import uharfbuzz as hb
     from fontbakery.utils import PointsPen, axis
@@ -678,8 +678,7 @@ def check_slant_direction(ttFont, uharfbuzz_blob):
         yield PASS, "Font has no slnt axis"
         return
 
-    hb_face = hb.Face(uharfbuzz_blob)
-    hb_font = hb.Font(hb_face)
+    hb_font = font.harfbuzz.font()
     buf = hb.Buffer()
     buf.add_str("H")
     features = {"kern": True, "liga": True}
@@ -123,19 +123,17 @@ def opentype_post_table_version(ttFont):
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
 )
-def check_italic_angle(ttFont, style):
+def check_italic_angle(font, style):
     """Checking post.italicAngle value."""
     import math
     from beziers.path import BezierPath, Line, Point
-    from fontTools.pens.boundsPen import BoundsPen
-    from copy import deepcopy
 
-    # This check modifies the font file with `.draw(boundspen)`
-    # so here we'll work with a copy of the object so that we
-    # do not affect other checks:
-    ttFont_copy = deepcopy(ttFont)
+    ttFont = font.ttFont
+    # Once the glyph geometry is known, drawing from the ttFont (here, to
+    # get the Bezier paths) no longer modifies it.
+    glyph_geometry = font.glyph_geometry
 
-    value = ttFont_copy["post"].italicAngle
+    value = ttFont["post"].italicAngle
 
     # Calculating italic angle from the font's glyph outlines
     def x_leftmost_intersection(paths, y):
@@ -163,26 +161,21 @@ def check_italic_angle(ttFont, style):
     bad_glyphs = []
     for glyph_name in GLYPHS_TO_CHECK:
         # Get bounds
-        glyphset = ttFont_copy.getGlyphSet()
-        if glyph_name not in glyphset:
+        if glyph_name not in glyph_geometry:
             continue
-        boundspen = BoundsPen(glyphset)
-        glyphset[glyph_name].draw(boundspen)
-        if not boundspen.bounds:
+        if not glyph_geometry.bounds(glyph_name):
             bad_glyphs.append(glyph_name)
             continue
 
     calculated_italic_angle = None
     for glyph_name in GLYPHS_TO_CHECK:
         try:
-            paths = BezierPath.fromFonttoolsGlyph(ttFont_copy, glyph_name)
+            paths = BezierPath.fromFonttoolsGlyph(ttFont, glyph_name)
         except KeyError:
             continue
 
         # Get bounds
-        boundspen = BoundsPen(ttFont_copy.getGlyphSet())
-        ttFont_copy.getGlyphSet()[glyph_name].draw(boundspen)
-        bounds = boundspen.bounds
+        bounds = glyph_geometry.bounds(glyph_name)
         if not bounds:
             continue
         (xMin, yMin, xMax, yMax) = bounds
@@ -279,14 +272,14 @@ def check_italic_angle(ttFont, style):
 
     # Checking if italicAngle matches font style:
     if "Italic" in style:
-        if ttFont_copy["post"].italicAngle == 0:
+        if ttFont["post"].italicAngle == 0:
             passed = False
             yield FAIL, Message(
                 "zero-italic",
                 "Font is italic, so post.italicAngle should be non-zero.",
             )
     else:
-        if ttFont_copy["post"].italicAngle != 0:
+        if ttFont["post"].italicAngle != 0:
             passed = False
             yield FAIL, Message(
                 "non-zero-upright",
@@ -1,7 +1,7 @@
 from collections import defaultdict
 import math
 
-from beziers.path import BezierPath
+from beziers.utils.pens import BezierPathCreatingPen
 
 from fontbakery.callable import condition, check
 from fontbakery.testable import Font
@@ -28,10 +28,15 @@ def outlines_dict(font):
             return f"{glyphname} (U+{reversed_cmap[glyphname]:04X})"
         return glyphname
 
+    glyphset = font.glyph_set()
+
+    def paths(glyphname):
+        pen = BezierPathCreatingPen(glyphset)
+        glyphset[glyphname].draw(pen)
+        return pen.paths
+
     return {
-        (glyphname, display_name(glyphname)): BezierPath.fromFonttoolsGlyph(
-            ttFont, glyphname
-        )
+        (glyphname, display_name(glyphname)): paths(glyphname)
         for glyphname in ttFont.getGlyphOrder()
     }
 
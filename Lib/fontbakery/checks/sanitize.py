@@ -1,4 +1,7 @@
-import os
+from contextlib import contextmanager
+import io
+import logging
+import threading
 
 from fontbakery.prelude import (
     check,
@@ -8,6 +11,7 @@ from fontbakery.prelude import (
     INFO,
 )
 from fontbakery.testable import TTCFont
+from fontbakery.timing import measure
 
 
 @check(
@@ -23,26 +27,62 @@ from fontbakery.testable import TTCFont
        """,
     proposal="https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
 )
-def check_ots(font):
+def check_ots(font, external_tools):
     """Checking with ots-sanitize."""
     import ots
 
-    try:
-        process = ots.sanitize(font.file, check=True, capture_output=True)
-
-    except ots.CalledProcessError as e:
+    result = external_tools.run(
+        [ots.OTS_SANITIZE, font.file], [font.file], version=f"ots {ots.__version__}"
+    )
+    if result.returncode:
         yield FAIL, Message(
             "ots-sanitize-error",
-            f"ots-sanitize returned an error code ({e.returncode})."
-            f" Output follows:\n\n{e.stderr.decode()}{e.stdout.decode()}",
+            f"ots-sanitize returned an error code ({result.returncode})."
+            f" Output follows:\n\n{result.stderr.decode()}{result.stdout.decode()}",
         )
-    else:
-        if process.stderr:
-            yield WARN, Message(
-                "ots-sanitize-warn",
-                "ots-sanitize passed this file, however warnings were printed:\n\n"
-                f"{process.stderr.decode()}",
-            )
+    elif result.stderr:
+        yield WARN, Message(
+            "ots-sanitize-warn",
+            "ots-sanitize passed this file, however warnings were printed:\n\n"
+            f"{result.stderr.decode()}",
+        )
+
+
+class _ThreadLogHandler(logging.Handler):
+    """Collects the log messages emitted by the current thread, formatted
+    the way the ttx command line prints them."""
+
+    def __init__(self):
+        super().__init__(logging.WARNING)
+        from fontTools.misc.loggingTools import LevelFormatter
+
+        self.setFormatter(LevelFormatter())
+        self.thread = threading.get_ident()
+        self.lines = []
+
+    def emit(self, record):
+        if record.thread == self.thread:
+            self.lines.extend(self.format(record).splitlines())
+
+
+@contextmanager
+def _ttx_messages():
+    """Capture what fontTools logs while converting a font (as `ttx -q`
+    would print it), including any unhandled exception."""
+    handler = _ThreadLogHandler()
+    logger = logging.getLogger("fontTools")
+    logger.addHandler(handler)
+    try:
+        yield handler.lines
+    except Exception:  # pylint: disable=broad-except
+        logging.getLogger("fontTools.ttx").exception("Unhandled exception has occurred")
+        handler.lines.append(_FAILED)
+    finally:
+        logger.removeHandler(handler)
+
+
+# Marks a conversion which did not complete
+_FAILED = object()
 
 
 @check(
@@ -59,34 +99,21 @@ def check_ots(font):
 )
 def check_ttx_roundtrip(font):
     """Checking with fontTools.ttx"""
-    from fontTools import ttx
-    import subprocess
-    import sys
-    import tempfile
-
-    font_file = font.file
-    if isinstance(font, TTCFont):
-        ttFont = ttx.TTFont(font.file, fontNumber=font.index)
-        ttf_fd, font_file = tempfile.mkstemp()
-        os.close(ttf_fd)
-        ttFont.save(font_file)
-
-    xml_fd, xml_file = tempfile.mkstemp()
-    os.close(xml_fd)
-
-    export_process = subprocess.Popen(
-        # TTX still emits warnings & errors even when -q (quiet) is passed
-        [sys.executable, "-m", "fontTools.ttx", "-qo", xml_file, font.file],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        universal_newlines=True,
-    )
-    (export_stdout, export_stderr) = export_process.communicate()
-    export_error_msgs = []
-    for line in export_stdout.splitlines() + export_stderr.splitlines():
-        if line not in export_error_msgs:
-            export_error_msgs.append(line)
+    from fontTools.ttLib import TTFont
+
+    # Convert the font to XML and back, in memory, as
+    # `ttx -q font.ttf && ttx -q font.ttx` would do.
+    xml = io.BytesIO()
+    with measure("tool", "ttx", file=font.file), _ttx_messages() as export_log:
+        ttFont = TTFont(
+            font.file,
+            0,
+            fontNumber=font.index if isinstance(font, TTCFont) else -1,
+        )
+        ttFont.saveXML(xml)
+        ttFont.close()
 
+    export_error_msgs = list(dict.fromkeys(m for m in export_log if m is not _FAILED))
     if export_error_msgs:
         yield (
             INFO,
@@ -98,16 +125,14 @@ def check_ttx_roundtrip(font):
         for msg in export_error_msgs:
             yield FAIL, msg.strip()
 
-    import_process = subprocess.Popen(
-        # TTX still emits warnings & errors even when -q (quiet) is passed
-        [sys.executable, "-m", "fontTools.ttx", "-qo", os.devnull, xml_file],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        universal_newlines=True,
-    )
-    (import_stdout, import_stderr) = import_process.communicate()
+    xml.seek(0)
+    with measure("tool", "ttx", file=font.file), _ttx_messages() as import_log:
+        ttFont = TTFont()
+        ttFont.importXML(xml)
+        ttFont.save(io.BytesIO())
 
-    if import_process.returncode != 0:
+    import_error_msgs = list(dict.fromkeys(m for m in import_log if m is not _FAILED))
+    if _FAILED in import_log:
         yield FAIL, (
             "TTX had some problem parsing the generated XML file."
             " This most likely mean there's some problem in the font."
@@ -118,14 +143,9 @@ def check_ttx_roundtrip(font):
             " causes TTX to generate corrupt XML files in those cases."
             " So, check the entries of the name table and remove any control"
             " chars that you find there. The full ttx error message was:\n"
-            f"======\n{import_stderr or import_stdout}\n======"
+            f"======\n{chr(10).join(import_error_msgs)}\n======"
         )
 
-    import_error_msgs = []
-    for line in import_stdout.splitlines() + import_stderr.splitlines():
-        if line not in import_error_msgs:
-            import_error_msgs.append(line)
-
     if import_error_msgs:
         yield INFO, (
             "While importing an XML file and converting it back to TTF,"
@@ -133,9 +153,3 @@ def check_ttx_roundtrip(font):
         )
         for msg in import_error_msgs:
             yield FAIL, msg.strip()
-
-    # and then we need to cleanup our mess...
-    if os.path.exists(xml_file):
-        os.remove(xml_file)
-    if font_file != font.file and os.path.exists(font_file):
-        os.remove(font_file)
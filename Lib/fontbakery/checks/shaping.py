@@ -14,24 +14,111 @@
 # limitations under the License.
 
 import json
+from collections import defaultdict
 from difflib import ndiff
 from pathlib import Path
 from os.path import basename
 
 from fontTools.unicodedata import ot_tag_to_script
 
-from fontbakery.prelude import check, FAIL, PASS, SKIP, WARN, Message
+from fontbakery.harfbuzz import BatchShaper, HarfBuzz
+from fontbakery.message import artifact_placeholder
+from fontbakery.prelude import check, condition, FAIL, PASS, SKIP, WARN, Message
+from fontbakery.testable import CheckRunContext
 from fontbakery.utils import exit_with_install_instructions
 
 shaping_basedir = Path("qa", "shaping_tests")
 
 
+# How many failing examples of each shaping file are drawn in the reports,
+# unless the configuration says otherwise (shaping: max_drawn_examples).
+MAX_DRAWN_EXAMPLES = 10
+
+
 def fix_svg(svg):
     svg = svg.replace("<svg", '<svg style="height:100px;margin:10px;"')
     svg = svg.replace("\n", " ")
     return svg
 
 
+class BufferDrawing:
+    """A shaped buffer, kept as glyph IDs and positions (along with the font
+    file and variation location it was shaped with), and drawn as SVG only
+    when a report displays it."""
+
+    def __init__(self, vharfbuzz, buf):
+        self.filename = vharfbuzz.filename
+        # The HarfBuzz face of the checked font. It is not pickled (into the
+        # result cache, or back from a worker process), in which case the
+        # file is read again to draw the buffer.
+        self.face = vharfbuzz.hbfont.face
+        self.coordinates = tuple(vharfbuzz.hbfont.get_var_coords_design())
+        self.glyphs = [
+            (
+                info.codepoint,
+                info.cluster,
+                pos.x_offset,
+                pos.y_offset,
+                pos.x_advance,
+                pos.y_advance,
+            )
+            for info, pos in zip(buf.glyph_infos, buf.glyph_positions)
+        ]
+
+    def __getstate__(self):
+        return {**self.__dict__, "face": None}
+
+    def render(self):
+        from vharfbuzz import FakeBuffer, FakeItem
+
+        # A shaper of its own, as it is set to the drawing's location
+        vharfbuzz = HarfBuzz(self.filename, self.face).shaper()
+        vharfbuzz.hbfont.set_var_coords_design(list(self.coordinates))
+        buf = FakeBuffer()
+        buf.glyph_infos = []
+        buf.glyph_positions = []
+        for codepoint, cluster, *position in self.glyphs:
+            info, pos = FakeItem(), FakeItem()
+            info.codepoint, info.cluster = codepoint, cluster
+            pos.x_offset, pos.y_offset, pos.x_advance, pos.y_advance = position
+            pos.position = position
+            buf.glyph_infos.append(info)
+            buf.glyph_positions.append(pos)
+        try:
+            return fix_svg(vharfbuzz.buf_to_svg(buf))
+        except (KeyError, TypeError):
+            # The expected glyphs may not be found in the font
+            return ""
+
+
+class CollisionsDrawing:
+    """The collisions found by Collidoscope in a shaped string, drawn as SVG
+    only when a report displays them (or when the drawing is pickled, as
+    the Collidoscope object is not)."""
+
+    def __init__(self, collidoscope, glyphs, collisions):
+        self.collidoscope = collidoscope
+        self.glyphs = glyphs
+        self.collisions = collisions
+        self.svg = None
+
+    def __getstate__(self):
+        return {"svg": self.render()}
+
+    def render(self):
+        if self.svg is None:
+            self.svg = fix_svg(
+                self.collidoscope.draw_overlaps(self.glyphs, self.collisions)
+            )
+        return self.svg
+
+
+def drawn_note(report_items, max_drawn):
+    if len(report_items) <= max_drawn:
+        return ""
+    return f"\n\n(Only the first {max_drawn} failures are drawn.)"
+
+
 def create_report_item(
     vharfbuzz,
     message,
@@ -40,7 +127,11 @@ def create_report_item(
     buf2=None,
     note=None,
     extra_data=None,
+    artifacts=None,
 ):
+    """A report item for a failing test. When given a list of `artifacts`,
+    the buffers are diffed and drawn (adding the drawings to the list);
+    otherwise, they are only serialized."""
     from vharfbuzz import FakeBuffer
 
     message = f"* {message}"
@@ -72,21 +163,23 @@ def create_report_item(
         )
         message += f"      Got     : {serialized_buf1}\n"
 
+    if artifacts is None:
+        return message
+
     # Report a diff table
     if serialized_buf1 and serialized_buf2:
         diff = list(ndiff([serialized_buf1], [serialized_buf2]))
         if diff and diff[-1][0] == "?":
             message += f"               {diff[-1][1:]}\n"
 
-    # Now draw it as SVG
+    # Now draw it as SVG (when the report is displayed)
     if buf1:
-        message += f"  Got: {fix_svg(vharfbuzz.buf_to_svg(buf1))}"
+        artifacts.append(BufferDrawing(vharfbuzz, buf1))
+        message += f"  Got: {artifact_placeholder(len(artifacts) - 1)}"
 
     if buf2 and isinstance(buf2, FakeBuffer):
-        try:
-            message += f" Expected: {fix_svg(vharfbuzz.buf_to_svg(buf2))}"
-        except KeyError:
-            pass
+        artifacts.append(BufferDrawing(vharfbuzz, buf2))
+        message += f" Expected: {artifact_placeholder(len(artifacts) - 1)}"
 
     return message
 
@@ -106,56 +199,122 @@ def get_shaping_parameters(test, configuration):
     return params
 
 
+class ShapingTest(dict):
+    """A test of a shaping suite, as written in its JSON file, along with
+    the settings which the suite's defaults resolve for it."""
+
+    def __init__(self, test, configuration):
+        super().__init__(test)
+        self.parameters = get_shaping_parameters(test, configuration)
+        self.input_type = get_from_test_with_default(
+            test, configuration, "input_type", "string"
+        )
+        self.allowed_collisions = get_from_test_with_default(
+            test, configuration, "allowedcollisions", []
+        )
+        self.exclude = frozenset(test.get("exclude", []))
+        self.only = frozenset(test.get("only") or [])
+
+
+class ShapingSuite:
+    """A shaping test file, parsed once per check run.
+
+    `error` is the Message to report instead of running the suite when the
+    file is not a valid suite. Otherwise, `tests_for()` gives the tests
+    which apply to a font file, in the order of the suite."""
+
+    def __init__(self, path):
+        self.path = path
+        self.error = None
+        self.configuration = {}
+        self.tests = []
+        try:
+            doc = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as e:
+            self.error = Message("shaping-invalid-json", f"{path}: Invalid JSON: {e}.")
+            return
+
+        self.configuration = doc.get("configuration", {})
+        if "tests" not in doc:
+            self.error = Message(
+                "shaping-missing-tests", f"{path}: JSON file must have a 'tests' key."
+            )
+            return
+        self.tests = [ShapingTest(test, self.configuration) for test in doc["tests"]]
+
+        # Tests restricted to some fonts by an "only" list are indexed by
+        # font; the other ones (including those missing an input, which
+        # must be reported whichever the font) apply to every font.
+        self._everywhere = []
+        self._only = defaultdict(list)
+        for index, test in enumerate(self.tests):
+            if test.only and "input" in test:
+                for name in test.only:
+                    self._only[name].append(index)
+            else:
+                self._everywhere.append(index)
+
+    def tests_for(self, filename):
+        """The tests which apply to the font file of the given name."""
+        indices = self._everywhere
+        if filename in self._only:
+            indices = sorted(indices + self._only[filename])
+        tests = [self.tests[i] for i in indices]
+        return [
+            test
+            for test in tests
+            if "input" not in test or filename not in test.exclude
+        ]
+
+
+@condition(CheckRunContext)
+def shaping_suites(context):
+    """The shaping test suites of the test directory set in the
+    configuration, or None if there is no such directory."""
+    test_directory = context.config.get("shaping", {}).get("test_directory")
+    if not test_directory:
+        return None
+    return [ShapingSuite(path) for path in Path(test_directory).glob("*.json")]
+
+
 # This is a very generic "do something with shaping" test runner.
 # It'll be given concrete meaning later.
 def run_a_set_of_shaping_tests(
-    config, ttFont, run_a_test, test_filter, generate_report, preparation=None
+    config,
+    font,
+    shaping_suites,
+    run_a_test,
+    test_filter,
+    generate_report,
+    preparation=None,
 ):
     try:
-        from vharfbuzz import Vharfbuzz
-
-        filename = Path(ttFont.reader.file.name)
-        vharfbuzz = Vharfbuzz(filename)
+        filename = Path(font.file)
+        vharfbuzz = font.harfbuzz.shaper()
     except ImportError:
         exit_with_install_instructions("shaping")
 
-    shaping_file_found = False
+    ttFont = font.ttFont
+
     ran_a_test = False
     extra_data = None
-    if "shaping" not in config:
-        yield SKIP, "Shaping test directory not defined in configuration file"
-        return
-
-    shaping_basedir = config["shaping"].get("test_directory")
-    if not shaping_basedir:
+    if shaping_suites is None:
         yield SKIP, "Shaping test directory not defined in configuration file"
         return
 
-    for shaping_file in Path(shaping_basedir).glob("*.json"):
-        shaping_file_found = True
-        try:
-            shaping_input_doc = json.loads(shaping_file.read_text(encoding="utf-8"))
-        except Exception as e:
-            yield FAIL, Message(
-                "shaping-invalid-json", f"{shaping_file}: Invalid JSON: {e}."
-            )
-            return
-
-        configuration = shaping_input_doc.get("configuration", {})
-        try:
-            shaping_tests = shaping_input_doc["tests"]
-        except KeyError:
-            yield FAIL, Message(
-                "shaping-missing-tests",
-                f"{shaping_file}: JSON file must have a 'tests' key.",
-            )
+    max_drawn = config["shaping"].get("max_drawn_examples", MAX_DRAWN_EXAMPLES)
+    for suite in shaping_suites:
+        shaping_file = suite.path
+        if suite.error:
+            yield FAIL, suite.error
             return
 
+        configuration = suite.configuration
         if preparation:
             extra_data = preparation(ttFont, configuration)
 
         failed_shaping_tests = []
-        for test in shaping_tests:
+        for test in suite.tests_for(basename(filename)):
             if not test_filter(test, configuration):
                 continue
 
@@ -166,14 +325,6 @@ def run_a_set_of_shaping_tests(
                 )
                 return
 
-            exclude_fonts = test.get("exclude", [])
-            if basename(filename) in exclude_fonts:
-                continue
-
-            only_fonts = test.get("only")
-            if only_fonts and basename(filename) not in only_fonts:
-                continue
-
             run_a_test(
                 filename,
                 vharfbuzz,
@@ -189,10 +340,10 @@ def run_a_set_of_shaping_tests(
                 yield PASS, f"{shaping_file}: No regression detected"
             else:
                 yield from generate_report(
-                    vharfbuzz, shaping_file, failed_shaping_tests
+                    vharfbuzz, shaping_file, failed_shaping_tests, max_drawn
                 )
 
-    if not shaping_file_found:
+    if not shaping_suites:
         yield SKIP, "No test files found."
 
     if not ran_a_test:
@@ -214,11 +365,12 @@ def run_a_set_of_shaping_tests(
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3223",
 )
-def check_shaping_regression(config, ttFont):
+def check_shaping_regression(config, font, shaping_suites):
     """Check that texts shape as per expectation"""
     yield from run_a_set_of_shaping_tests(
         config,
-        ttFont,
+        font,
+        shaping_suites,
         run_shaping_regression,
         lambda test, configuration: "expectation" in test,
         generate_shaping_regression_report,
@@ -229,8 +381,7 @@ def run_shaping_regression(
     filename, vharfbuzz, test, configuration, failed_shaping_tests, extra_data
 ):
     shaping_text = test["input"]
-    parameters = get_shaping_parameters(test, configuration)
-    output_buf = vharfbuzz.shape(shaping_text, parameters)
+    output_buf = vharfbuzz.shape(shaping_text, test.parameters)
     expectation = test["expectation"]
     if isinstance(expectation, dict):
         expectation = expectation.get(filename.name, expectation["default"])
@@ -242,9 +393,13 @@ def run_shaping_regression(
         failed_shaping_tests.append((test, expectation, output_buf, output_serialized))
 
 
-def generate_shaping_regression_report(vharfbuzz, shaping_file, failed_shaping_tests):
+def generate_shaping_regression_report(
+    vharfbuzz, shaping_file, failed_shaping_tests, max_drawn
+):
     report_items = []
-    for test, expected, output_buf, output_serialized in failed_shaping_tests:
+    artifacts = []
+    for index, failure in enumerate(failed_shaping_tests):
+        test, expected, output_buf, _output_serialized = failure
         extra_data = {
             k: test[k]
             for k in ["script", "language", "direction", "features", "variations"]
@@ -264,11 +419,16 @@ def generate_shaping_regression_report(vharfbuzz, shaping_file, failed_shaping_t
             buf2=buf2,
             note=test.get("note"),
             extra_data=extra_data,
+            artifacts=artifacts if index < max_drawn else None,
         )
         report_items.append(report_item)
 
     header = f"{shaping_file}: Expected and actual shaping not matching"
-    yield FAIL, Message("shaping-regression", header + "\n" + "\n".join(report_items))
+    yield FAIL, Message(
+        "shaping-regression",
+        header + "\n" + "\n".join(report_items) + drawn_note(report_items, max_drawn),
+        artifacts,
+    )
 
 
 @check(
@@ -286,11 +446,12 @@ def generate_shaping_regression_report(vharfbuzz, shaping_file, failed_shaping_t
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3223",
 )
-def check_shaping_forbidden(config, ttFont):
+def check_shaping_forbidden(config, font, shaping_suites):
     """Check that no forbidden glyphs are found while shaping"""
     yield from run_a_set_of_shaping_tests(
         config,
-        ttFont,
+        font,
+        shaping_suites,
         run_forbidden_glyph_test,
         lambda test, configuration: "forbidden_glyphs" in configuration,
         forbidden_glyph_test_results,
@@ -302,11 +463,7 @@ def run_forbidden_glyph_test(
 ):
     from stringbrewer import StringBrewer
 
-    is_stringbrewer = (
-        get_from_test_with_default(test, configuration, "input_type", "string")
-        == "pattern"
-    )
-    parameters = get_shaping_parameters(test, configuration)
+    is_stringbrewer = test.input_type == "pattern"
     forbidden_glyphs = configuration["forbidden_glyphs"]
     if is_stringbrewer:
         sb = StringBrewer(
@@ -316,25 +473,54 @@ def run_forbidden_glyph_test(
     else:
         strings = [test["input"]]
 
+    # Shape the (possibly many) strings in a batch, comparing glyph IDs, and
+    # only shape the offending ones again with vharfbuzz, for the report.
+    import uharfbuzz as hb
+
+    hbfont = vharfbuzz.hbfont
+    forbidden_ids = {}
+    for forbidden in forbidden_glyphs:
+        glyph_id = hbfont.glyph_from_string(forbidden)
+        if glyph_id is not None and hbfont.glyph_to_string(glyph_id) == forbidden:
+            forbidden_ids[glyph_id] = forbidden
+    if not forbidden_ids:
+        return
+
+    shaper = BatchShaper(hb.Font(hbfont.face), test.parameters)
     for shaping_text in strings:
-        output_buf = vharfbuzz.shape(shaping_text, parameters)
-        output_serialized = vharfbuzz.serialize_buf(output_buf, glyphsonly=True)
-        glyph_names = output_serialized.split("|")
-        for forbidden in forbidden_glyphs:
-            if forbidden in glyph_names:
+        glyph_ids = set(shaper.glyph_ids(shaping_text))
+        found = [
+            name for glyph_id, name in forbidden_ids.items() if glyph_id in glyph_ids
+        ]
+        if found:
+            output_buf = vharfbuzz.shape(shaping_text, test.parameters)
+            for forbidden in found:
                 failed_shaping_tests.append((shaping_text, output_buf, forbidden))
 
 
-def forbidden_glyph_test_results(vharfbuzz, shaping_file, failed_shaping_tests):
+def forbidden_glyph_test_results(
+    vharfbuzz, shaping_file, failed_shaping_tests, max_drawn
+):
     report_items = []
-    for shaping_text, buf, forbidden in failed_shaping_tests:
+    artifacts = []
+    for index, (shaping_text, buf, forbidden) in enumerate(failed_shaping_tests):
         msg = f"{shaping_text} produced '{forbidden}'"
         report_items.append(
-            create_report_item(vharfbuzz, msg, text=shaping_text, buf1=buf)
+            create_report_item(
+                vharfbuzz,
+                msg,
+                text=shaping_text,
+                buf1=buf,
+                artifacts=artifacts if index < max_drawn else None,
+            )
         )
 
     header = f"{shaping_file}: Forbidden glyphs found while shaping"
-    yield FAIL, Message("shaping-forbidden", header + ".\n" + "\n".join(report_items))
+    yield FAIL, Message(
+        "shaping-forbidden",
+        header + ".\n" + "\n".join(report_items) + drawn_note(report_items, max_drawn),
+        artifacts,
+    )
 
 
 @check(
@@ -351,11 +537,12 @@ def forbidden_glyph_test_results(vharfbuzz, shaping_file, failed_shaping_tests):
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3223",
 )
-def check_shaping_collides(config, ttFont):
+def check_shaping_collides(config, font, shaping_suites):
     """Check that no collisions are found while shaping"""
     yield from run_a_set_of_shaping_tests(
         config,
-        ttFont,
+        font,
+        shaping_suites,
         run_collides_glyph_test,
         lambda test, configuration: "collidoscope" in test
         or "collidoscope" in configuration,
@@ -384,7 +571,7 @@ def setup_glyph_collides(ttFont, configuration):
         collidoscope_configuration,
         direction=configuration.get("direction", "LTR"),
     )
-    return {"collidoscope": col}
+    return {"collidoscope": col, "reported_bumps": set()}
 
 
 def run_collides_glyph_test(
@@ -396,14 +583,8 @@ def run_collides_glyph_test(
         exit_with_install_instructions("shaping")
 
     col = extra_data["collidoscope"]
-    is_stringbrewer = (
-        get_from_test_with_default(test, configuration, "input_type", "string")
-        == "pattern"
-    )
-    parameters = get_shaping_parameters(test, configuration)
-    allowed_collisions = get_from_test_with_default(
-        test, configuration, "allowedcollisions", []
-    )
+    is_stringbrewer = test.input_type == "pattern"
+    allowed_collisions = test.allowed_collisions
     if is_stringbrewer:
         sb = StringBrewer(
             recipe=test["input"], ingredients=configuration["ingredients"]
@@ -413,35 +594,51 @@ def run_collides_glyph_test(
         strings = [test["input"]]
 
     for shaping_text in strings:
-        output_buf = vharfbuzz.shape(shaping_text, parameters)
+        output_buf = vharfbuzz.shape(shaping_text, test.parameters)
         glyphs = col.get_glyphs(shaping_text, buf=output_buf)
         collisions = col.has_collisions(glyphs)
         bumps = [f"{c.glyph1}/{c.glyph2}" for c in collisions]
         bumps = [b for b in bumps if b not in allowed_collisions]
         if bumps:
-            draw = fix_svg(col.draw_overlaps(glyphs, collisions))
-            failed_shaping_tests.append((shaping_text, bumps, draw, output_buf))
-
-
-def collides_glyph_test_results(vharfbuzz, shaping_file, failed_shaping_tests):
+            # Only the first string with a given set of bumps is reported
+            # (and drawn, if the report displays it); the others are only
+            # counted.
+            drawing = None
+            if tuple(bumps) not in extra_data["reported_bumps"]:
+                extra_data["reported_bumps"].add(tuple(bumps))
+                drawing = CollisionsDrawing(col, glyphs, collisions)
+            failed_shaping_tests.append((shaping_text, bumps, drawing, output_buf))
+
+
+def collides_glyph_test_results(
+    vharfbuzz, shaping_file, failed_shaping_tests, max_drawn
+):
     report_items = []
-    seen_bumps = {}
-    for shaping_text, bumps, draw, buf in failed_shaping_tests:
+    artifacts = []
+    for shaping_text, bumps, drawing, buf in failed_shaping_tests:
         # Make HTML report here.
-        if tuple(bumps) in seen_bumps:
+        if drawing is None:  # Already reported these bumps
             continue
-        seen_bumps[tuple(bumps)] = True
-        report_item = create_report_item(
-            vharfbuzz,
+        message = (
             f"{',' .join(bumps)} collision found in"
-            f" e.g. <span class='tf'>{shaping_text}</span> <div>{draw}</div>",
-            buf1=buf,
+            f" e.g. <span class='tf'>{shaping_text}</span>"
+        )
+        drawn = len(report_items) < max_drawn
+        if drawn:
+            artifacts.append(drawing)
+            message += f" <div>{artifact_placeholder(len(artifacts) - 1)}</div>"
+        report_item = create_report_item(
+            vharfbuzz, message, buf1=buf, artifacts=artifacts if drawn else None
         )
         report_items.append(report_item)
     header = (
         f"{shaping_file}: {len(failed_shaping_tests)} collisions found while shaping"
     )
-    yield FAIL, Message("shaping-collides", header + ".\n" + "\n".join(report_items))
+    yield FAIL, Message(
+        "shaping-collides",
+        header + ".\n" + "\n".join(report_items) + drawn_note(report_items, max_drawn),
+        artifacts,
+    )
 
 
 def is_complex_shaper_font(ttFont):
@@ -574,11 +771,11 @@ def check_dotted_circle(ttFont, config):
     ],  # use Shaperglot, which uses youseedee, which downloads Unicode files
     proposal="https://github.com/fonttools/fontbakery/issues/4059",
 )
-def check_soft_dotted(ttFont):
+def check_soft_dotted(font, ttFont):
     """Ensure soft_dotted characters lose their dot when combined with marks that
     replace the dot."""
     try:
-        from vharfbuzz import Vharfbuzz
+        from vharfbuzz import Vharfbuzz  # noqa:F401 pylint:disable=W0611
     except ImportError:
         exit_with_install_instructions("shaping")
 
@@ -643,8 +840,10 @@ def check_soft_dotted(ttFont):
         return
 
     # Use harfbuzz to check if soft dotted glyphs are substituted
-    filename = ttFont.reader.file.name
-    vharfbuzz = Vharfbuzz(filename)
+    shaper = font.harfbuzz.batch_shaper()
+    glyph_ids = {
+        codepoint: ttFont.getGlyphID(glyphname) for codepoint, glyphname in cmap.items()
+    }
     fail_unchanged_strings = []
     warn_unchanged_strings = []
     for sequence in sorted(
@@ -655,21 +854,15 @@ def check_soft_dotted(ttFont):
             mark_above_chars,
         )
     ):
-        soft, non_above, above = sequence
-        if non_above:
-            unchanged = f"{cmap[soft]}|{cmap[non_above]}|{cmap[above]}"
-            text = f"{chr(soft)}{chr(non_above)}{chr(above)}"
-        else:
-            unchanged = f"{cmap[soft]}|{cmap[above]}"
-            text = f"{chr(soft)}{chr(above)}"
+        codepoints = [c for c in sequence if c]
+        text = "".join(chr(c) for c in codepoints)
 
         # Only check a few strings that we WARN about.
         if text not in ortho_soft_dotted_strings and len(warn_unchanged_strings) >= 20:
             continue
 
-        buf = vharfbuzz.shape(text)
-        output = vharfbuzz.serialize_buf(buf, glyphsonly=True)
-        if output == unchanged:
+        unchanged = [glyph_ids[c] for c in codepoints]
+        if shaper.glyph_ids(text).tolist() == unchanged:
             if text in ortho_soft_dotted_strings:
                 fail_unchanged_strings.append(text)
             else:
@@ -9,13 +9,12 @@ from fontbakery.prelude import (
     WARN,
     SKIP,
 )
-from fontbakery.glyphdata import desired_glyph_data
 from fontbakery.checks.opentype.layout import feature_tags
 from fontbakery.utils import (
     bullet_list,
+    drawable_glyph_set,
     get_font_glyph_data,
     get_glyph_name,
-    glyph_has_ink,
     iterate_lookup_list_with_extensions,
     pretty_print_list,
 )
@@ -106,19 +105,14 @@ def check_family_single_directory(fonts):
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/4139",
 )
-def check_caps_vertically_centered(ttFont):
+def check_caps_vertically_centered(font):
     """Check if uppercase glyphs are vertically centered."""
-
-    from copy import deepcopy
-    from fontTools.pens.boundsPen import BoundsPen
-
-    ttFont_copy = deepcopy(ttFont)
-
+    ttFont = font.ttFont
     SOME_UPPERCASE_GLYPHS = ["A", "B", "C", "D", "E", "H", "I", "M", "O", "S", "T", "X"]
-    glyphSet = ttFont_copy.getGlyphSet()
+    glyph_geometry = font.glyph_geometry
 
     for glyphname in SOME_UPPERCASE_GLYPHS:
-        if glyphname not in glyphSet.keys():
+        if glyphname not in glyph_geometry:
             yield SKIP, Message(
                 "lacks-ascii",
                 "The implementation of this check relies on a few samples"
@@ -129,13 +123,11 @@ def check_caps_vertically_centered(ttFont):
     highest_point_list = []
     lowest_point_list = []
     for glyphName in SOME_UPPERCASE_GLYPHS:
-        pen = BoundsPen(glyphSet)
-        glyphSet[glyphName].draw(pen)
-        _, lowest_point, _, highest_point = pen.bounds
+        _, lowest_point, _, highest_point = glyph_geometry.bounds(glyphName)
         highest_point_list.append(highest_point)
         lowest_point_list.append(lowest_point)
 
-    upm = ttFont_copy["head"].unitsPerEm
+    upm = ttFont["head"].unitsPerEm
     line_spacing_factor = 1.20
     error_margin = (line_spacing_factor * upm) * 0.18
     average_cap_height = sum(highest_point_list) / len(highest_point_list)
@@ -165,7 +157,7 @@ def check_caps_vertically_centered(ttFont):
        """,
     proposal="https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
 )
-def check_whitespace_ink(ttFont):
+def check_whitespace_ink(font):
     """Whitespace glyphs have ink?"""
     # This checks that certain glyphs are empty.
     # Some, but not all, are Unicode whitespace.
@@ -211,8 +203,8 @@ def check_whitespace_ink(ttFont):
 
     passed = True
     for codepoint in sorted(NON_DRAWING):
-        g = get_glyph_name(ttFont, codepoint)
-        if g is not None and glyph_has_ink(ttFont, g):
+        g = get_glyph_name(font.ttFont, codepoint)
+        if g is not None and font.glyph_geometry.has_ink(g):
             passed = False
             yield FAIL, Message(
                 "has-ink",
@@ -309,7 +301,7 @@ def check_legacy_accents(ttFont):
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
 )
-def check_contour_count(ttFont, config):
+def check_contour_count(font, config):
     """Check if each glyph has the recommended amount of contours.
 
     This check is useful to assure glyphs aren't incorrectly constructed.
@@ -337,6 +329,8 @@ def check_contour_count(ttFont, config):
             or (codepoint >= 0x100000 and codepoint <= 0x10FFFD)
         )
 
+    from fontbakery.glyphdata import desired_glyph_data
+
     # rearrange data structure:
     desired_glyph_data_by_codepoint = {}
     desired_glyph_data_by_glyphname = {}
@@ -357,7 +351,8 @@ def check_contour_count(ttFont, config):
         for f in desired_glyph_data_by_glyphname
     }
 
-    font_glyph_data = get_font_glyph_data(ttFont)
+    ttFont = font.ttFont
+    font_glyph_data = get_font_glyph_data(ttFont, font.glyph_geometry)
 
     if font_glyph_data is None:
         yield FAIL, Message("lacks-cmap", "This font lacks cmap data.")
@@ -733,7 +728,9 @@ def check_interpolation_issues(ttFont, config):
     }
 
     locs = new_locs
-    glyphsets = [ttFont.getGlyphSet(location=loc, normalized=True) for loc in locs]
+    glyphsets = [
+        drawable_glyph_set(ttFont, location=loc, normalized=True) for loc in locs
+    ]
 
     # Name glyphsets by their full location. Different versions of fonttools
     # have differently-typed default names, and so this optional argument must
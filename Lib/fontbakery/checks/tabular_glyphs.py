@@ -1,3 +1,4 @@
+from fontbakery.lookups import substituted_glyphs
 from fontbakery.prelude import check, Message, FAIL, SKIP, PASS
 
 
@@ -56,14 +57,9 @@ def format_glyphs_by_width(glyphs_by_width):
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/4657",
 )
-def check_tnum_glyphs_equal_widths(ttFont):
+def check_tnum_glyphs_equal_widths(font, ttFont):
     """Widths of tabular number glyphs."""
-    import uharfbuzz as hb
-
-    filename = ttFont.reader.file.name
-    hbBlob = hb.Blob.from_file_path(filename)
-    hbFace = hb.Face(hbBlob)
-    hbFont = hb.Font(hbFace)
+    hbFont = font.harfbuzz.font()
 
     check_text = "0123456789"
     if TEST_STR is not None:  # type: ignore # noqa:F821 pylint:disable=E0602
@@ -140,9 +136,8 @@ def check_tnum_glyphs_equal_widths(ttFont):
     proposal="https://github.com/fonttools/fontbakery/issues/4440",
     experimental="Since 2024/Jun/04",
 )
-def check_tabular_kerning(ttFont):
+def check_tabular_kerning(font, ttFont):
     """Check tabular widths don't have kerning."""
-    from vharfbuzz import Vharfbuzz
     import uharfbuzz as hb
     import unicodedata
 
@@ -166,7 +161,7 @@ def check_tabular_kerning(ttFont):
     ]
     GID_OFFSET = 0xF0000
 
-    vhb = Vharfbuzz(ttFont.reader.file.name)
+    vhb = font.harfbuzz.shaper()
     best_cmap = ttFont.getBestCmap()
     unicode_for_glyphs = {v: k for k, v in best_cmap.items()}
 
@@ -339,6 +334,24 @@ def check_tabular_kerning(ttFont):
         yield SKIP, "Font has no tabular numerals"
         return
 
+    # Shaping every pair is slow, so pairs are only shaped if the kerning
+    # index says they are kerned, or if it cannot tell: when the "kern"
+    # feature has other lookups than pair adjustments, or when GSUB may
+    # replace either glyph of the pair with another one.
+    kerning_index = font.kerning_index
+    substituted = substituted_glyphs(ttFont)
+    glyph_ids = ttFont.getReverseGlyphMap()
+
+    def may_kern(a, b):
+        return (
+            not kerning_index.complete
+            or substituted is None
+            or not (a in glyph_ids and b in glyph_ids)
+            or a in substituted
+            or b in substituted
+            or kerning_index.kern(a, b) != 0
+        )
+
     # Actually check for kerning
     if has_feature(ttFont, "kern"):
         for sets in (
@@ -348,6 +361,8 @@ def check_tabular_kerning(ttFont):
             combinations = unique_combinations(sets[0], sets[1])
             for x, y in combinations:
                 for a, b in ((x, y), (y, x)):
+                    if not may_kern(a, b):
+                        continue
                     kerning = get_kerning([a, b])
                     if kerning != 0:
                         # Check if either a or b are digraphs that themselves
@@ -74,27 +74,25 @@ def designspace_sources(designspace):
     proposal="https://github.com/fonttools/fontbakery/pull/1736",
     experimental="Since 2024/Aug/09",
 )
-def check_ufolint(ufo):
+def check_ufolint(ufo, external_tools):
     """Run ufolint on UFO source directory."""
 
     # IMPORTANT: This check cannot use the 'ufo_font' condition because it makes it
     # skip malformed UFOs (e.g. if metainfo.plist file is missing).
 
-    import subprocess
-
-    ufolint_cmd = ["ufolint", ufo.file]
-
     try:
-        subprocess.check_output(ufolint_cmd, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as e:
+        result = external_tools.run(["ufolint", ufo.file], [ufo.file])
+    except OSError:
+        yield ERROR, Message("ufolint-unavailable", "ufolint is not available!")
+        return
+
+    if result.returncode:
         yield FAIL, Message(
             "ufolint-fail",
             ("ufolint failed the UFO source. Output follows :" "\n\n{}\n").format(
-                e.output.decode()
+                (result.stdout + result.stderr).decode()
             ),
         )
-    except OSError:
-        yield ERROR, Message("ufolint-unavailable", "ufolint is not available!")
     else:
         yield PASS, "ufolint passed the UFO source."
 
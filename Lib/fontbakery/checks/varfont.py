@@ -93,7 +93,7 @@ def check_varfont_consistent_axes(VFs):
 )
 def check_varfont_duplexed_axis_reflow(font, ttFont, config):
     """Ensure VFs with duplexed axes do not vary horizontal advance."""
-    from fontbakery.utils import all_kerning, pretty_print_list
+    from fontbakery.utils import pretty_print_list
 
     DUPLEXED_AXES = {"GRAD", "ROND"}
     relevant_axes = set(font.axes_by_tag.keys()) & DUPLEXED_AXES
@@ -142,8 +142,8 @@ def check_varfont_duplexed_axis_reflow(font, ttFont, config):
 
         # Some regions vary *something* along the axis. But what?
         if effective_regions:
-            kerning = all_kerning(ttFont)
-            for left, right, v1, v2 in kerning:
+            kerning = font.kerning_index.variable_class_pairs()
+            for lefts, rights, v1, v2 in kerning:
                 if v1 and hasattr(v1, "XAdvDevice") and v1.XAdvDevice:
                     variation = [v1.XAdvDevice.StartSize, v1.XAdvDevice.EndSize]
                     regions = varstore.VarData[variation[0]].VarRegionIndex
@@ -160,7 +160,7 @@ def check_varfont_duplexed_axis_reflow(font, ttFont, config):
                                 f"Kerning rules cause variation in"
                                 f" horizontal advance on a duplexed axis "
                                 f" ({relevant_axes_display})"
-                                f" (e.g. {left}/{right})",
+                                f" (e.g. {lefts[0]}/{rights[0]})",
                             )
                             break
 
@@ -222,9 +222,7 @@ def check_mandatory_avar_table(ttFont):
 
 @condition(Font)
 def uharfbuzz_blob(font):
-    import uharfbuzz as hb
-
-    return hb.Blob.from_file_path(font.file)
+    return font.harfbuzz.blob
 
 
 @check(
@@ -201,7 +201,7 @@ def best_familyname(font):
     return font.ttFont["name"].getBestFamilyName()
 
 
-@condition(Font)
+@condition(Font, network=True)
 def listed_on_gfonts_api(font):
     if not font.context.network or not font.google_familyname:
         return
@@ -275,14 +275,13 @@ def rfn_exception(font):
             return True
 
 
-@condition(Font)
+@condition(Font, network=True)
 def remote_styles(font):
     """Get a dictionary of TTFont objects of all font files of
     a given family as currently hosted at Google Fonts.
     """
     from fontbakery.utils import download_file
     import json
-    import requests
 
     if not font.context.network or not font.listed_on_gfonts_api:
         return None
@@ -291,7 +290,7 @@ def remote_styles(font):
     dl_url = "https://fonts.google.com/download/list?family={}"
     family_name = font.google_familyname
     url = dl_url.format(family_name.replace(" ", "%20"))
-    data = json.loads(requests.get(url, timeout=10).text[5:])
+    data = json.loads(font.context.http.get(url, timeout=10).text[5:])
     remote_fonts = []
     for item in data["manifest"]["fileRefs"]:
         filename = item["filename"]
@@ -300,7 +299,7 @@ def remote_styles(font):
             continue
         if not filename.endswith(("otf", "ttf")):
             continue
-        file_obj = download_file(dl_url)
+        file_obj = download_file(dl_url, font.context.http)
         if file_obj:
             remote_fonts.append(TTFont(file_obj))
 
@@ -319,7 +318,7 @@ def remote_styles(font):
     return rstyles
 
 
-@condition(Font)
+@condition(Font, network=True)
 def remote_style(font):
     font_style = font.ttFont["name"].getBestSubFamilyName()
     remote_styles = font.remote_styles
@@ -328,7 +327,7 @@ def remote_style(font):
     return remote_styles.get(font_style)
 
 
-@condition(Font)
+@condition(Font, network=True)
 def regular_remote_style(font):
     from fontbakery.checks.conditions import get_instance_axis_value
 
@@ -466,16 +465,60 @@ def gfonts_repo_structure(self):
     return abspath.split(os.path.sep)[-3] in ["ufl", "ofl", "apache"]
 
 
-@condition(CheckRunContext)
+def is_email_link(link):
+    return link.startswith("mailto:") and "@" in link and "." in link.split("@")[1]
+
+
+def html_links(doc):
+    """The target of each link of an HTML document, without duplicates."""
+    links = []
+    for a_href in doc.iterfind(".//a[@href]"):
+        link = a_href.get("href")
+        if link not in links:
+            links.append(link)
+    return links
+
+
+def copyright_link(copyright_str):
+    """The URL mentioned by the copyright field of METADATA.pb, if any."""
+    if "mailto:" in copyright_str or "http" not in copyright_str:
+        return None
+    link = "http" + copyright_str.split("http")[1]
+    for endchar in [" ", ")"]:
+        if endchar in link:
+            link = link.split(endchar)[0]
+    return link
+
+
+@condition(CheckRunContext, network=True)
+def link_statuses(context):
+    """The LinkStatus of each link of the DESCRIPTION and ARTICLE files,
+    and of the copyright fields of METADATA.pb, of all the fonts checked.
+    The links are gathered from the whole family and checked at once, so
+    that the checks on each font find them already checked."""
+    if not context.network:
+        return {}
+
+    urls = []
+    for font in context.fonts:
+        for doc in font.description_and_article_html.values():
+            urls.extend(link for link in html_links(doc) if not is_email_link(link))
+        if font.family_metadata:
+            for font_metadata in font.family_metadata.fonts:
+                urls.append(copyright_link(font_metadata.copyright))
+    return context.link_checker.check(
+        [url for url in dict.fromkeys(urls) if url is not None]
+    )
+
+
+@condition(CheckRunContext, network=True)
 def production_metadata(context):
     """Get the Google Fonts production metadata"""
     if not context.network:
         return
 
-    import requests
-
     meta_url = "http://fonts.google.com/metadata/fonts"
-    return requests.get(meta_url, timeout=context.config.get("timeout")).json()
+    return context.http.get(meta_url, timeout=context.config.get("timeout")).json()
 
 
 @condition(Font)
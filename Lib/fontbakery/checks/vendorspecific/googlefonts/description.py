@@ -90,7 +90,7 @@ def github_gfonts_description(font: Font, network, config):
         f"/{LICENSE_DIRECTORY[license_file]}/{familyname}/DESCRIPTION.en_us.html"
     )
     try:
-        return requests.get(url, timeout=config.get("timeout")).text
+        return font.context.http.get(url, timeout=config.get("timeout")).text
     except requests.RequestException:
         return None
 
@@ -234,41 +234,39 @@ def check_description_has_unsupported_elements(
         "https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
     ],
 )
-def check_description_broken_links(description_and_article_html, font):
+def check_description_broken_links(description_and_article_html, font, link_statuses):
     """Does DESCRIPTION file contain broken links?"""
-    import requests
+    from fontbakery.checks.vendorspecific.googlefonts.conditions import (
+        html_links,
+        is_email_link,
+    )
 
     for source, doc in description_and_article_html.items():
-        broken_links = []
-        unique_links = []
-        for a_href in doc.iterfind(".//a[@href]"):
-            link = a_href.get("href")
-
-            # avoid requesting the same URL more then once
-            if link in unique_links:
-                continue
-
-            if link.startswith("mailto:") and "@" in link and "." in link.split("@")[1]:
+        links = []
+        for link in html_links(doc):
+            if is_email_link(link):
                 yield FAIL, Message("email", f"Found an email address: {link}")
-                continue
+            else:
+                links.append(link)
 
-            unique_links.append(link)
-            try:
-                response = requests.head(link, allow_redirects=True, timeout=10)
-                code = response.status_code
-                # Status 429: "Too Many Requests" is acceptable
-                # because it means the website is probably ok and
-                # we're just perhaps being too agressive in probing the server!
-                if code not in [requests.codes.ok, requests.codes.too_many_requests]:
-                    broken_links.append(f"{link} (status code: {code})")
-            except requests.exceptions.Timeout:
+        statuses = dict(link_statuses)
+        missing = [link for link in links if link not in statuses]
+        if missing:
+            statuses.update(font.context.link_checker.check(missing))
+
+        broken_links = []
+        for link in links:
+            status = statuses[link]
+            if status.timed_out:
                 yield WARN, Message(
                     "timeout",
                     f"Timedout while attempting to access: '{link}'."
                     f" Please verify if that's a broken link.",
                 )
-            except requests.exceptions.RequestException:
+            elif status.status_code is None:
                 broken_links.append(link)
+            elif not status.ok:
+                broken_links.append(f"{link} (status code: {status.status_code})")
 
         if broken_links:
             broken_links_list = "\n\t".join(broken_links)
@@ -53,43 +53,27 @@ def check_version_bump(ttFont, api_gfonts_ttFont, github_gfonts_ttFont):
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
 )
-def check_production_glyphs_similarity(ttFont, api_gfonts_ttFont, config):
+def check_production_glyphs_similarity(font, api_gfonts_ttFont, config):
     """Glyphs are similiar to Google Fonts version?"""
-
-    # This check modifies the font file with `.draw(pen)`
-    # so here we'll work with a copy of the object so that we
-    # do not affect other checks:
-    from copy import deepcopy
-
-    ttFont_copy = deepcopy(ttFont)
-    api_gfonts_ttFont_copy = deepcopy(api_gfonts_ttFont)
-
+    from fontbakery.glyph_geometry import GlyphGeometry
     from fontbakery.utils import pretty_print_list
 
-    def glyphs_surface_area(a_ttFont):
-        """Calculate the surface area of a glyph's ink"""
-        from fontTools.pens.areaPen import AreaPen
-
-        glyphs = {}
-        glyph_set = a_ttFont.getGlyphSet()
-        area_pen = AreaPen(glyph_set)
-
-        for glyph in glyph_set.keys():
-            glyph_set[glyph].draw(area_pen)
-
-            area = area_pen.value
-            area_pen.value = 0
-            glyphs[glyph] = area
-        return glyphs
+    def glyphs_surface_area(glyph_geometry):
+        """The surface area of each glyph's ink"""
+        return {
+            glyph: glyph_geometry.area(gid)
+            for gid, glyph in enumerate(glyph_geometry.glyph_order)
+        }
 
+    ttFont = font.ttFont
     bad_glyphs = []
-    these_glyphs = glyphs_surface_area(ttFont_copy)
-    gfonts_glyphs = glyphs_surface_area(api_gfonts_ttFont_copy)
+    these_glyphs = glyphs_surface_area(font.glyph_geometry)
+    gfonts_glyphs = glyphs_surface_area(GlyphGeometry(api_gfonts_ttFont))
 
     shared_glyphs = set(these_glyphs) & set(gfonts_glyphs)
 
-    this_upm = ttFont_copy["head"].unitsPerEm
-    gfonts_upm = api_gfonts_ttFont_copy["head"].unitsPerEm
+    this_upm = ttFont["head"].unitsPerEm
+    gfonts_upm = api_gfonts_ttFont["head"].unitsPerEm
 
     for glyph in shared_glyphs:
         # Normalize area difference against comparison's upm
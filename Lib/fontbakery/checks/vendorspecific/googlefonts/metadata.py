@@ -118,10 +118,13 @@ def check_metadata_date_added(family_metadata):
         field of the METADATA.pb file are valid.
     """,
 )
-def check_metadata_broken_links(family_metadata):
+def check_metadata_broken_links(family_metadata, font, link_statuses):
     """Does METADATA.pb copyright field contain broken links?"""
-    import requests
+    from fontbakery.checks.vendorspecific.googlefonts.conditions import (
+        copyright_link,
+    )
 
+    link_checker = font.context.link_checker
     broken_links = []
     unique_links = []
     for font_metadata in family_metadata.fonts:
@@ -135,57 +138,49 @@ def check_metadata_broken_links(family_metadata):
             yield FAIL, Message("email", f"Found an email address: {copyright_str}")
             continue
 
-        if "http" in copyright_str:
-            link = "http" + copyright_str.split("http")[1]
-
-            for endchar in [" ", ")"]:
-                if endchar in link:
-                    link = link.split(endchar)[0]
+        link = copyright_link(copyright_str)
+        # avoid requesting the same URL more then once
+        if link is None or link in unique_links:
+            continue
 
-            # avoid requesting the same URL more then once
-            if link in unique_links:
-                continue
+        unique_links.append(link)
+        if link in link_statuses:
+            status = link_statuses[link]
+        else:
+            status = link_checker.check([link])[link]
 
-            unique_links.append(link)
-            try:
-                response = requests.head(link, allow_redirects=True, timeout=10)
-                code = response.status_code
-                # Status 429: "Too Many Requests" is acceptable
-                # because it means the website is probably ok and
-                # we're just perhaps being too agressive in probing the server!
-                if code not in [requests.codes.ok, requests.codes.too_many_requests]:
-                    # special case handling for github.com/$user/$repo/$something
-                    chunks = link.split("/")
-                    good = False
-                    if len(chunks) == 6 and chunks[2].endswith("github.com"):
-                        protocol, _, domain, user, repo, something = chunks
-                        for branch in ["main", "master"]:
-                            alternate_link = f"{protocol}//{domain}/{user}/{repo}/tree/{branch}/{something}"  # noqa:E501 pylint:disable=C0301
-                            response = requests.head(
-                                alternate_link, allow_redirects=True, timeout=10
-                            )
-                            code = response.status_code
-                            if code in [
-                                requests.codes.ok,
-                                requests.codes.too_many_requests,
-                            ]:
-                                yield WARN, Message(
-                                    "bad-github-url",
-                                    f"Could not fetch '{link}'.\n\n"
-                                    f"But '{alternate_link}' seems to be good."
-                                    f" Please consider using that instead.\n",
-                                )
-                                good = True
-                    if not good:
-                        broken_links.append(("{} (status code: {})").format(link, code))
-            except requests.exceptions.Timeout:
-                yield WARN, Message(
-                    "timeout",
-                    f"Timed out while attempting to access: '{link}'."
-                    f" Please verify if that's a broken link.",
+        if status.timed_out:
+            yield WARN, Message(
+                "timeout",
+                f"Timed out while attempting to access: '{link}'."
+                f" Please verify if that's a broken link.",
+            )
+        elif status.status_code is None:
+            broken_links.append("ouch! " + link)
+        elif not status.ok:
+            # special case handling for github.com/$user/$repo/$something
+            chunks = link.split("/")
+            good = False
+            if len(chunks) == 6 and chunks[2].endswith("github.com"):
+                protocol, _, domain, user, repo, something = chunks
+                alternate_links = [
+                    f"{protocol}//{domain}/{user}/{repo}/tree/{branch}/{something}"
+                    for branch in ["main", "master"]
+                ]
+                alternate_statuses = link_checker.check(alternate_links)
+                for alternate_link in alternate_links:
+                    if alternate_statuses[alternate_link].ok:
+                        yield WARN, Message(
+                            "bad-github-url",
+                            f"Could not fetch '{link}'.\n\n"
+                            f"But '{alternate_link}' seems to be good."
+                            f" Please consider using that instead.\n",
+                        )
+                        good = True
+            if not good:
+                broken_links.append(
+                    ("{} (status code: {})").format(link, status.status_code)
                 )
-            except requests.exceptions.RequestException:
-                broken_links.append("ouch! " + link)
 
     if len(broken_links) > 0:
         broken_links_list = "\n\t".join(broken_links)
@@ -1399,7 +1394,7 @@ def check_metadata_escaped_strings(metadata_file):
     conditions=["network", "family_metadata", "not is_noto"],
     proposal="https://github.com/fonttools/fontbakery/issues/3083",
 )
-def check_metadata_designer_profiles(family_metadata, config):
+def check_metadata_designer_profiles(family_metadata, config, http):
     """METADATA.pb: Designers are listed correctly on the Google Fonts catalog?"""
     DESIGNER_INFO_RAW_URL = (
         "https://raw.githubusercontent.com/google/fonts/master/catalog/designers/{}/"
@@ -1454,7 +1449,7 @@ def check_metadata_designer_profiles(family_metadata, config):
             continue
 
         url = DESIGNER_INFO_RAW_URL.format(normalized_name) + "info.pb"
-        response = requests.get(url, timeout=config.get("timeout"))
+        response = http.get(url, timeout=config.get("timeout"))
 
         # https://github.com/fonttools/fontbakery/pull/3892#issuecomment-1248758859
         # For debugging purposes:
@@ -1499,7 +1494,7 @@ def check_metadata_designer_profiles(family_metadata, config):
             avatar_url = (
                 DESIGNER_INFO_RAW_URL.format(normalized_name) + info.avatar.file_name
             )
-            response = requests.get(avatar_url, timeout=config.get("timeout"))
+            response = http.get(avatar_url, timeout=config.get("timeout"))
             if response.status_code != requests.codes.OK:
                 yield FAIL, Message(
                     "bad-avatar-filename",
@@ -1577,7 +1572,7 @@ def check_metadata_family_directory_name(family_metadata, family_directory):
         "https://github.com/fonttools/fontbakery/issues/3605",
     ],
 )
-def check_metadata_can_render_samples(ttFont, family_metadata):
+def check_metadata_can_render_samples(font, family_metadata):
     """Check samples can be rendered."""
     try:
         from gflanguages import LoadLanguages
@@ -1611,7 +1606,7 @@ def check_metadata_can_render_samples(ttFont, family_metadata):
             # For more info, see https://github.com/fonttools/fontbakery/issues/3990
             sample_text = sample_text.replace("\n", "").replace("\u200b", "")
 
-            if not can_shape(ttFont, sample_text):
+            if not can_shape(font, sample_text):
                 yield FAIL, Message(
                     "sample-text",
                     f'Font can\'t render "{lang}" sample text:\n' f'"{sample_text}"\n',
@@ -448,10 +448,9 @@ def check_office_ribz_req(ttFont):
 
 
 def check_repertoire(ttFont, character_repertoire, name, error_status=FAIL):
-    charset = set(ttFont["cmap"].getBestCmap())
-    missing = character_repertoire - charset
+    missing = character_repertoire - ttFont["cmap"].getBestCmap()
     if missing:
-        missing_formatted = ", ".join(f"0x{v:04X}" for v in sorted(missing))
+        missing_formatted = ", ".join(f"0x{v:04X}" for v in missing)
         yield error_status, (
             f"character repertoire not complete for {name}; missing: {missing_formatted}"
         )
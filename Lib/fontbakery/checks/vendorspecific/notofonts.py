@@ -183,18 +183,19 @@ def check_unicode_range_bits(ttFont):
     """Ensure UnicodeRange bits are properly set."""
     from fontbakery.constants import UNICODERANGE_DATA
     from fontbakery.utils import (
+        chars_by_unicoderange_bit,
         compute_unicoderange_bits,
         unicoderange_bit_name,
-        chars_in_range,
     )
 
-    expected_unicoderange = compute_unicoderange_bits(ttFont)
+    chars_by_bit = chars_by_unicoderange_bit(ttFont)
+    expected_unicoderange = compute_unicoderange_bits(ttFont, chars_by_bit)
     difference = unicoderange(ttFont) ^ expected_unicoderange
     if difference:
         for bit in range(128):
             if difference & (1 << bit):
                 range_name = unicoderange_bit_name(bit)
-                num_chars = len(chars_in_range(ttFont, bit))
+                num_chars = len(chars_by_bit.get(bit, []))
                 range_size = sum(
                     entry[3] - entry[2] + 1 for entry in UNICODERANGE_DATA[bit]
                 )
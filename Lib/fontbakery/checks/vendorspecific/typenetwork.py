@@ -4,6 +4,7 @@ Checks for Type Network <https://typenetwork.com/>
 import unicodedata
 import string
 
+from fontbakery.codepoints import codepoint_set
 from fontbakery.testable import Font, CheckRunContext
 from fontbakery.prelude import check, condition, Message, PASS, FAIL, WARN, SKIP, INFO
 from fontbakery.utils import (
@@ -35,390 +36,11 @@ def check_glyph_coverage(ttFont, font_codepoints, config):
     except ImportError:
         exit_with_install_instructions("typenetwork")
 
-    TN_latin_set = {
-        0x0020: (" ", "SPACE"),
-        0x0021: ("!", "EXCLAMATION MARK"),
-        0x0022: ('"', "QUOTATION MARK"),
-        0x0023: ("#", "NUMBER SIGN"),
-        0x0024: ("$", "DOLLAR SIGN"),
-        0x0025: ("%", "PERCENT SIGN"),
-        0x0026: ("&", "AMPERSAND"),
-        0x0027: ("'", "APOSTROPHE"),
-        0x0028: ("(", "LEFT PARENTHESIS"),
-        0x0029: (")", "RIGHT PARENTHESIS"),
-        0x002A: ("*", "ASTERISK"),
-        0x002B: ("+", "PLUS SIGN"),
-        0x002C: (",", "COMMA"),
-        0x002D: ("-", "HYPHEN-MINUS"),
-        0x002E: (".", "FULL STOP"),
-        0x002F: ("/", "SOLIDUS"),
-        0x0030: ("0", "DIGIT ZERO"),
-        0x0031: ("1", "DIGIT ONE"),
-        0x0032: ("2", "DIGIT TWO"),
-        0x0033: ("3", "DIGIT THREE"),
-        0x0034: ("4", "DIGIT FOUR"),
-        0x0035: ("5", "DIGIT FIVE"),
-        0x0036: ("6", "DIGIT SIX"),
-        0x0037: ("7", "DIGIT SEVEN"),
-        0x0038: ("8", "DIGIT EIGHT"),
-        0x0039: ("9", "DIGIT NINE"),
-        0x003A: (":", "COLON"),
-        0x003B: (";", "SEMICOLON"),
-        0x003C: ("<", "LESS-THAN SIGN"),
-        0x003D: ("=", "EQUALS SIGN"),
-        0x003E: (">", "GREATER-THAN SIGN"),
-        0x003F: ("?", "QUESTION MARK"),
-        0x0040: ("@", "COMMERCIAL AT"),
-        0x0041: ("A", "LATIN CAPITAL LETTER A"),
-        0x0042: ("B", "LATIN CAPITAL LETTER B"),
-        0x0043: ("C", "LATIN CAPITAL LETTER C"),
-        0x0044: ("D", "LATIN CAPITAL LETTER D"),
-        0x0045: ("E", "LATIN CAPITAL LETTER E"),
-        0x0046: ("F", "LATIN CAPITAL LETTER F"),
-        0x0047: ("G", "LATIN CAPITAL LETTER G"),
-        0x0048: ("H", "LATIN CAPITAL LETTER H"),
-        0x0049: ("I", "LATIN CAPITAL LETTER I"),
-        0x004A: ("J", "LATIN CAPITAL LETTER J"),
-        0x004B: ("K", "LATIN CAPITAL LETTER K"),
-        0x004C: ("L", "LATIN CAPITAL LETTER L"),
-        0x004D: ("M", "LATIN CAPITAL LETTER M"),
-        0x004E: ("N", "LATIN CAPITAL LETTER N"),
-        0x004F: ("O", "LATIN CAPITAL LETTER O"),
-        0x0050: ("P", "LATIN CAPITAL LETTER P"),
-        0x0051: ("Q", "LATIN CAPITAL LETTER Q"),
-        0x0052: ("R", "LATIN CAPITAL LETTER R"),
-        0x0053: ("S", "LATIN CAPITAL LETTER S"),
-        0x0054: ("T", "LATIN CAPITAL LETTER T"),
-        0x0055: ("U", "LATIN CAPITAL LETTER U"),
-        0x0056: ("V", "LATIN CAPITAL LETTER V"),
-        0x0057: ("W", "LATIN CAPITAL LETTER W"),
-        0x0058: ("X", "LATIN CAPITAL LETTER X"),
-        0x0059: ("Y", "LATIN CAPITAL LETTER Y"),
-        0x005A: ("Z", "LATIN CAPITAL LETTER Z"),
-        0x005B: ("[", "LEFT SQUARE BRACKET"),
-        0x005C: ("\\", "REVERSE SOLIDUS"),
-        0x005D: ("]", "RIGHT SQUARE BRACKET"),
-        0x005E: ("^", "ASCII CIRCUMFLEX ACCENT"),
-        0x005F: ("_", "LOW LINE"),
-        0x0060: ("`", "GRAVE ACCENT"),
-        0x0061: ("a", "LATIN SMALL LETTER A"),
-        0x0062: ("b", "LATIN SMALL LETTER B"),
-        0x0063: ("c", "LATIN SMALL LETTER C"),
-        0x0064: ("d", "LATIN SMALL LETTER D"),
-        0x0065: ("e", "LATIN SMALL LETTER E"),
-        0x0066: ("f", "LATIN SMALL LETTER F"),
-        0x0067: ("g", "LATIN SMALL LETTER G"),
-        0x0068: ("h", "LATIN SMALL LETTER H"),
-        0x0069: ("i", "LATIN SMALL LETTER I"),
-        0x006A: ("j", "LATIN SMALL LETTER J"),
-        0x006B: ("k", "LATIN SMALL LETTER K"),
-        0x006C: ("l", "LATIN SMALL LETTER L"),
-        0x006D: ("m", "LATIN SMALL LETTER M"),
-        0x006E: ("n", "LATIN SMALL LETTER N"),
-        0x006F: ("o", "LATIN SMALL LETTER O"),
-        0x0070: ("p", "LATIN SMALL LETTER P"),
-        0x0071: ("q", "LATIN SMALL LETTER Q"),
-        0x0072: ("r", "LATIN SMALL LETTER R"),
-        0x0073: ("s", "LATIN SMALL LETTER S"),
-        0x0074: ("t", "LATIN SMALL LETTER T"),
-        0x0075: ("u", "LATIN SMALL LETTER U"),
-        0x0076: ("v", "LATIN SMALL LETTER V"),
-        0x0077: ("w", "LATIN SMALL LETTER W"),
-        0x0078: ("x", "LATIN SMALL LETTER X"),
-        0x0079: ("y", "LATIN SMALL LETTER Y"),
-        0x007A: ("z", "LATIN SMALL LETTER Z"),
-        0x007B: ("{", "LEFT CURLY BRACKET"),
-        0x007C: ("|", "VERTICAL LINE"),
-        0x007D: ("}", "RIGHT CURLY BRACKET"),
-        0x007E: ("~", "TILDE"),
-        0x00A0: (" ", "NO-BREAK SPACE"),
-        0x00A1: ("¡", "INVERTED EXCLAMATION MARK"),
-        0x00A2: ("¢", "CENT SIGN"),
-        0x00A3: ("£", "POUND SIGN"),
-        0x00A4: ("¤", "CURRENCY SIGN"),
-        0x00A5: ("¥", "YEN SIGN"),
-        0x00A6: ("¦", "BROKEN BAR"),
-        0x00A7: ("§", "SECTION SIGN"),
-        0x00A8: ("¨", "DIAERESIS"),
-        0x00A9: ("©", "COPYRIGHT SIGN"),
-        0x00AA: ("ª", "FEMININE ORDINAL INDICATOR"),
-        0x00AB: ("«", "LEFT-POINTING DOUBLE ANGLE QUOTATION MARK"),
-        0x00AC: ("¬", "NOT SIGN"),
-        0x00AE: ("®", "REGISTERED SIGN"),
-        0x00AF: ("¯", "MACRON"),
-        0x00B0: ("°", "DEGREE SIGN"),
-        0x00B1: ("±", "PLUS-MINUS SIGN"),
-        0x00B2: ("²", "SUPERSCRIPT TWO"),
-        0x00B3: ("³", "SUPERSCRIPT THREE"),
-        0x00B4: ("´", "ACUTE ACCENT"),
-        0x00B6: ("¶", "PILCROW SIGN"),
-        0x00B7: ("·", "MIDDLE DOT"),
-        0x00B8: ("¸", "CEDILLA"),
-        0x00B9: ("¹", "SUPERSCRIPT ONE"),
-        0x00BA: ("º", "MASCULINE ORDINAL INDICATOR"),
-        0x00BB: ("»", "RIGHT-POINTING DOUBLE ANGLE QUOTATION MARK"),
-        0x00BC: ("¼", "VULGAR FRACTION ONE QUARTER"),
-        0x00BD: ("½", "VULGAR FRACTION ONE HALF"),
-        0x00BE: ("¾", "VULGAR FRACTION THREE QUARTERS"),
-        0x00BF: ("¿", "INVERTED QUESTION MARK"),
-        0x00C0: ("À", "LATIN CAPITAL LETTER A WITH GRAVE"),
-        0x00C1: ("Á", "LATIN CAPITAL LETTER A WITH ACUTE"),
-        0x00C2: ("Â", "LATIN CAPITAL LETTER A WITH CIRCUMFLEX"),
-        0x00C3: ("Ã", "LATIN CAPITAL LETTER A WITH TILDE"),
-        0x00C4: ("Ä", "LATIN CAPITAL LETTER A WITH DIAERESIS"),
-        0x00C5: ("Å", "LATIN CAPITAL LETTER A WITH RING ABOVE"),
-        0x00C6: ("Æ", "LATIN CAPITAL LETTER AE"),
-        0x00C7: ("Ç", "LATIN CAPITAL LETTER C WITH CEDILLA"),
-        0x00C8: ("È", "LATIN CAPITAL LETTER E WITH GRAVE"),
-        0x00C9: ("É", "LATIN CAPITAL LETTER E WITH ACUTE"),
-        0x00CA: ("Ê", "LATIN CAPITAL LETTER E WITH CIRCUMFLEX"),
-        0x00CB: ("Ë", "LATIN CAPITAL LETTER E WITH DIAERESIS"),
-        0x00CC: ("Ì", "LATIN CAPITAL LETTER I WITH GRAVE"),
-        0x00CD: ("Í", "LATIN CAPITAL LETTER I WITH ACUTE"),
-        0x00CE: ("Î", "LATIN CAPITAL LETTER I WITH CIRCUMFLEX"),
-        0x00CF: ("Ï", "LATIN CAPITAL LETTER I WITH DIAERESIS"),
-        0x00D0: ("Ð", "LATIN CAPITAL LETTER ETH"),
-        0x00D1: ("Ñ", "LATIN CAPITAL LETTER N WITH TILDE"),
-        0x00D2: ("Ò", "LATIN CAPITAL LETTER O WITH GRAVE"),
-        0x00D3: ("Ó", "LATIN CAPITAL LETTER O WITH ACUTE"),
-        0x00D4: ("Ô", "LATIN CAPITAL LETTER O WITH CIRCUMFLEX"),
-        0x00D5: ("Õ", "LATIN CAPITAL LETTER O WITH TILDE"),
-        0x00D6: ("Ö", "LATIN CAPITAL LETTER O WITH DIAERESIS"),
-        0x00D7: ("×", "MULTIPLICATION SIGN"),
-        0x00D8: ("Ø", "LATIN CAPITAL LETTER O WITH STROKE"),
-        0x00D9: ("Ù", "LATIN CAPITAL LETTER U WITH GRAVE"),
-        0x00DA: ("Ú", "LATIN CAPITAL LETTER U WITH ACUTE"),
-        0x00DB: ("Û", "LATIN CAPITAL LETTER U WITH CIRCUMFLEX"),
-        0x00DC: ("Ü", "LATIN CAPITAL LETTER U WITH DIAERESIS"),
-        0x00DD: ("Ý", "LATIN CAPITAL LETTER Y WITH ACUTE"),
-        0x00DE: ("Þ", "LATIN CAPITAL LETTER THORN"),
-        0x00DF: ("ß", "LATIN SMALL LETTER SHARP S"),
-        0x00E0: ("à", "LATIN SMALL LETTER A WITH GRAVE"),
-        0x00E1: ("á", "LATIN SMALL LETTER A WITH ACUTE"),
-        0x00E2: ("â", "LATIN SMALL LETTER A WITH CIRCUMFLEX"),
-        0x00E3: ("ã", "LATIN SMALL LETTER A WITH TILDE"),
-        0x00E4: ("ä", "LATIN SMALL LETTER A WITH DIAERESIS"),
-        0x00E5: ("å", "LATIN SMALL LETTER A WITH RING ABOVE"),
-        0x00E6: ("æ", "LATIN SMALL LETTER AE"),
-        0x00E7: ("ç", "LATIN SMALL LETTER C WITH CEDILLA"),
-        0x00E8: ("è", "LATIN SMALL LETTER E WITH GRAVE"),
-        0x00E9: ("é", "LATIN SMALL LETTER E WITH ACUTE"),
-        0x00EA: ("ê", "LATIN SMALL LETTER E WITH CIRCUMFLEX"),
-        0x00EB: ("ë", "LATIN SMALL LETTER E WITH DIAERESIS"),
-        0x00EC: ("ì", "LATIN SMALL LETTER I WITH GRAVE"),
-        0x00ED: ("í", "LATIN SMALL LETTER I WITH ACUTE"),
-        0x00EE: ("î", "LATIN SMALL LETTER I WITH CIRCUMFLEX"),
-        0x00EF: ("ï", "LATIN SMALL LETTER I WITH DIAERESIS"),
-        0x00F0: ("ð", "LATIN SMALL LETTER ETH"),
-        0x00F1: ("ñ", "LATIN SMALL LETTER N WITH TILDE"),
-        0x00F2: ("ò", "LATIN SMALL LETTER O WITH GRAVE"),
-        0x00F3: ("ó", "LATIN SMALL LETTER O WITH ACUTE"),
-        0x00F4: ("ô", "LATIN SMALL LETTER O WITH CIRCUMFLEX"),
-        0x00F5: ("õ", "LATIN SMALL LETTER O WITH TILDE"),
-        0x00F6: ("ö", "LATIN SMALL LETTER O WITH DIAERESIS"),
-        0x00F7: ("÷", "DIVISION SIGN"),
-        0x00F8: ("ø", "LATIN SMALL LETTER O WITH STROKE"),
-        0x00F9: ("ù", "LATIN SMALL LETTER U WITH GRAVE"),
-        0x00FA: ("ú", "LATIN SMALL LETTER U WITH ACUTE"),
-        0x00FB: ("û", "LATIN SMALL LETTER U WITH CIRCUMFLEX"),
-        0x00FC: ("ü", "LATIN SMALL LETTER U WITH DIAERESIS"),
-        0x00FD: ("ý", "LATIN SMALL LETTER Y WITH ACUTE"),
-        0x00FE: ("þ", "LATIN SMALL LETTER THORN"),
-        0x00FF: ("ÿ", "LATIN SMALL LETTER Y WITH DIAERESIS"),
-        0x0100: ("Ā", "LATIN CAPITAL LETTER A WITH MACRON"),
-        0x0101: ("ā", "LATIN SMALL LETTER A WITH MACRON"),
-        0x0102: ("Ă", "LATIN CAPITAL LETTER A WITH BREVE"),
-        0x0103: ("ă", "LATIN SMALL LETTER A WITH BREVE"),
-        0x0104: ("Ą", "LATIN CAPITAL LETTER A WITH OGONEK"),
-        0x0105: ("ą", "LATIN SMALL LETTER A WITH OGONEK"),
-        0x0106: ("Ć", "LATIN CAPITAL LETTER C WITH ACUTE"),
-        0x0107: ("ć", "LATIN SMALL LETTER C WITH ACUTE"),
-        0x0108: ("Ĉ", "LATIN CAPITAL LETTER C WITH CIRCUMFLEX"),
-        0x0109: ("ĉ", "LATIN SMALL LETTER C WITH CIRCUMFLEX"),
-        0x010A: ("Ċ", "LATIN CAPITAL LETTER C WITH DOT ABOVE"),
-        0x010B: ("ċ", "LATIN SMALL LETTER C WITH DOT ABOVE"),
-        0x010C: ("Č", "LATIN CAPITAL LETTER C WITH CARON"),
-        0x010D: ("č", "LATIN SMALL LETTER C WITH CARON"),
-        0x010E: ("Ď", "LATIN CAPITAL LETTER D WITH CARON"),
-        0x010F: ("ď", "LATIN SMALL LETTER D WITH CARON"),
-        0x0110: ("Đ", "LATIN CAPITAL LETTER D WITH STROKE"),
-        0x0111: ("đ", "LATIN SMALL LETTER D WITH STROKE"),
-        0x0112: ("Ē", "LATIN CAPITAL LETTER E WITH MACRON"),
-        0x0113: ("ē", "LATIN SMALL LETTER E WITH MACRON"),
-        0x0114: ("Ĕ", "LATIN CAPITAL LETTER E WITH BREVE"),
-        0x0115: ("ĕ", "LATIN SMALL LETTER E WITH BREVE"),
-        0x0116: ("Ė", "LATIN CAPITAL LETTER E WITH DOT ABOVE"),
-        0x0117: ("ė", "LATIN SMALL LETTER E WITH DOT ABOVE"),
-        0x0118: ("Ę", "LATIN CAPITAL LETTER E WITH OGONEK"),
-        0x0119: ("ę", "LATIN SMALL LETTER E WITH OGONEK"),
-        0x011A: ("Ě", "LATIN CAPITAL LETTER E WITH CARON"),
-        0x011B: ("ě", "LATIN SMALL LETTER E WITH CARON"),
-        0x011C: ("Ĝ", "LATIN CAPITAL LETTER G WITH CIRCUMFLEX"),
-        0x011D: ("ĝ", "LATIN SMALL LETTER G WITH CIRCUMFLEX"),
-        0x011E: ("Ğ", "LATIN CAPITAL LETTER G WITH BREVE"),
-        0x011F: ("ğ", "LATIN SMALL LETTER G WITH BREVE"),
-        0x0120: ("Ġ", "LATIN CAPITAL LETTER G WITH DOT ABOVE"),
-        0x0121: ("ġ", "LATIN SMALL LETTER G WITH DOT ABOVE"),
-        0x0122: ("Ģ", "LATIN CAPITAL LETTER G WITH CEDILLA"),
-        0x0123: ("ģ", "LATIN SMALL LETTER G WITH CEDILLA"),
-        0x0124: ("Ĥ", "LATIN CAPITAL LETTER H WITH CIRCUMFLEX"),
-        0x0125: ("ĥ", "LATIN SMALL LETTER H WITH CIRCUMFLEX"),
-        0x0126: ("Ħ", "LATIN CAPITAL LETTER H WITH STROKE"),
-        0x0127: ("ħ", "LATIN SMALL LETTER H WITH STROKE"),
-        0x0128: ("Ĩ", "LATIN CAPITAL LETTER I WITH TILDE"),
-        0x0129: ("ĩ", "LATIN SMALL LETTER I WITH TILDE"),
-        0x012A: ("Ī", "LATIN CAPITAL LETTER I WITH MACRON"),
-        0x012B: ("ī", "LATIN SMALL LETTER I WITH MACRON"),
-        0x012C: ("Ĭ", "LATIN CAPITAL LETTER I WITH BREVE"),
-        0x012D: ("ĭ", "LATIN SMALL LETTER I WITH BREVE"),
-        0x012E: ("Į", "LATIN CAPITAL LETTER I WITH OGONEK"),
-        0x012F: ("į", "LATIN SMALL LETTER I WITH OGONEK"),
-        0x0130: ("İ", "LATIN CAPITAL LETTER I WITH DOT ABOVE"),
-        0x0131: ("ı", "LATIN SMALL LETTER DOTLESS I"),
-        0x0132: ("Ĳ", "LATIN CAPITAL LIGATURE IJ"),
-        0x0133: ("ĳ", "LATIN SMALL LIGATURE IJ"),
-        0x0134: ("Ĵ", "LATIN CAPITAL LETTER J WITH CIRCUMFLEX"),
-        0x0135: ("ĵ", "LATIN SMALL LETTER J WITH CIRCUMFLEX"),
-        0x0136: ("Ķ", "LATIN CAPITAL LETTER K WITH CEDILLA"),
-        0x0137: ("ķ", "LATIN SMALL LETTER K WITH CEDILLA"),
-        0x0139: ("Ĺ", "LATIN CAPITAL LETTER L WITH ACUTE"),
-        0x013A: ("ĺ", "LATIN SMALL LETTER L WITH ACUTE"),
-        0x013B: ("Ļ", "LATIN CAPITAL LETTER L WITH CEDILLA"),
-        0x013C: ("ļ", "LATIN SMALL LETTER L WITH CEDILLA"),
-        0x013D: ("Ľ", "LATIN CAPITAL LETTER L WITH CARON"),
-        0x013E: ("ľ", "LATIN SMALL LETTER L WITH CARON"),
-        0x013F: ("Ŀ", "LATIN CAPITAL LETTER L WITH MIDDLE DOT"),
-        0x0140: ("ŀ", "LATIN SMALL LETTER L WITH MIDDLE DOT"),
-        0x0141: ("Ł", "LATIN CAPITAL LETTER L WITH STROKE"),
-        0x0142: ("ł", "LATIN SMALL LETTER L WITH STROKE"),
-        0x0143: ("Ń", "LATIN CAPITAL LETTER N WITH ACUTE"),
-        0x0144: ("ń", "LATIN SMALL LETTER N WITH ACUTE"),
-        0x0145: ("Ņ", "LATIN CAPITAL LETTER N WITH CEDILLA"),
-        0x0146: ("ņ", "LATIN SMALL LETTER N WITH CEDILLA"),
-        0x0147: ("Ň", "LATIN CAPITAL LETTER N WITH CARON"),
-        0x0148: ("ň", "LATIN SMALL LETTER N WITH CARON"),
-        0x014A: ("Ŋ", "LATIN CAPITAL LETTER ENG"),
-        0x014B: ("ŋ", "LATIN SMALL LETTER ENG"),
-        0x014C: ("Ō", "LATIN CAPITAL LETTER O WITH MACRON"),
-        0x014D: ("ō", "LATIN SMALL LETTER O WITH MACRON"),
-        0x014E: ("Ŏ", "LATIN CAPITAL LETTER O WITH BREVE"),
-        0x014F: ("ŏ", "LATIN SMALL LETTER O WITH BREVE"),
-        0x0150: ("Ő", "LATIN CAPITAL LETTER O WITH DOUBLE ACUTE"),
-        0x0151: ("ő", "LATIN SMALL LETTER O WITH DOUBLE ACUTE"),
-        0x0152: ("Œ", "LATIN CAPITAL LIGATURE OE"),
-        0x0153: ("œ", "LATIN SMALL LIGATURE OE"),
-        0x0154: ("Ŕ", "LATIN CAPITAL LETTER R WITH ACUTE"),
-        0x0155: ("ŕ", "LATIN SMALL LETTER R WITH ACUTE"),
-        0x0156: ("Ŗ", "LATIN CAPITAL LETTER R WITH CEDILLA"),
-        0x0157: ("ŗ", "LATIN SMALL LETTER R WITH CEDILLA"),
-        0x0158: ("Ř", "LATIN CAPITAL LETTER R WITH CARON"),
-        0x0159: ("ř", "LATIN SMALL LETTER R WITH CARON"),
-        0x015A: ("Ś", "LATIN CAPITAL LETTER S WITH ACUTE"),
-        0x015B: ("ś", "LATIN SMALL LETTER S WITH ACUTE"),
-        0x015C: ("Ŝ", "LATIN CAPITAL LETTER S WITH CIRCUMFLEX"),
-        0x015D: ("ŝ", "LATIN SMALL LETTER S WITH CIRCUMFLEX"),
-        0x015E: ("Ş", "LATIN CAPITAL LETTER S WITH CEDILLA"),
-        0x015F: ("ş", "LATIN SMALL LETTER S WITH CEDILLA"),
-        0x0160: ("Š", "LATIN CAPITAL LETTER S WITH CARON"),
-        0x0161: ("š", "LATIN SMALL LETTER S WITH CARON"),
-        0x0164: ("Ť", "LATIN CAPITAL LETTER T WITH CARON"),
-        0x0165: ("ť", "LATIN SMALL LETTER T WITH CARON"),
-        0x0166: ("Ŧ", "LATIN CAPITAL LETTER T WITH STROKE"),
-        0x0167: ("ŧ", "LATIN SMALL LETTER T WITH STROKE"),
-        0x0168: ("Ũ", "LATIN CAPITAL LETTER U WITH TILDE"),
-        0x0169: ("ũ", "LATIN SMALL LETTER U WITH TILDE"),
-        0x016A: ("Ū", "LATIN CAPITAL LETTER U WITH MACRON"),
-        0x016B: ("ū", "LATIN SMALL LETTER U WITH MACRON"),
-        0x016C: ("Ŭ", "LATIN CAPITAL LETTER U WITH BREVE"),
-        0x016D: ("ŭ", "LATIN SMALL LETTER U WITH BREVE"),
-        0x016E: ("Ů", "LATIN CAPITAL LETTER U WITH RING ABOVE"),
-        0x016F: ("ů", "LATIN SMALL LETTER U WITH RING ABOVE"),
-        0x0170: ("Ű", "LATIN CAPITAL LETTER U WITH DOUBLE ACUTE"),
-        0x0171: ("ű", "LATIN SMALL LETTER U WITH DOUBLE ACUTE"),
-        0x0172: ("Ų", "LATIN CAPITAL LETTER U WITH OGONEK"),
-        0x0173: ("ų", "LATIN SMALL LETTER U WITH OGONEK"),
-        0x0174: ("Ŵ", "LATIN CAPITAL LETTER W WITH CIRCUMFLEX"),
-        0x0175: ("ŵ", "LATIN SMALL LETTER W WITH CIRCUMFLEX"),
-        0x0176: ("Ŷ", "LATIN CAPITAL LETTER Y WITH CIRCUMFLEX"),
-        0x0177: ("ŷ", "LATIN SMALL LETTER Y WITH CIRCUMFLEX"),
-        0x0178: ("Ÿ", "LATIN CAPITAL LETTER Y WITH DIAERESIS"),
-        0x0179: ("Ź", "LATIN CAPITAL LETTER Z WITH ACUTE"),
-        0x017A: ("ź", "LATIN SMALL LETTER Z WITH ACUTE"),
-        0x017B: ("Ż", "LATIN CAPITAL LETTER Z WITH DOT ABOVE"),
-        0x017C: ("ż", "LATIN SMALL LETTER Z WITH DOT ABOVE"),
-        0x017D: ("Ž", "LATIN CAPITAL LETTER Z WITH CARON"),
-        0x017E: ("ž", "LATIN SMALL LETTER Z WITH CARON"),
-        0x01FC: ("Ǽ", "LATIN CAPITAL LETTER AE WITH ACUTE"),
-        0x01FD: ("ǽ", "LATIN SMALL LETTER AE WITH ACUTE"),
-        0x01FE: ("Ǿ", "LATIN CAPITAL LETTER O WITH STROKE AND ACUTE"),
-        0x01FF: ("ǿ", "LATIN SMALL LETTER O WITH STROKE AND ACUTE"),
-        0x0218: ("Ș", "LATIN CAPITAL LETTER S WITH COMMA BELOW"),
-        0x0219: ("ș", "LATIN SMALL LETTER S WITH COMMA BELOW"),
-        0x021A: ("Ț", "LATIN CAPITAL LETTER T WITH COMMA BELOW"),
-        0x021B: ("ț", "LATIN SMALL LETTER T WITH COMMA BELOW"),
-        0x0237: ("ȷ", "LATIN SMALL LETTER DOTLESS J"),
-        0x02C6: ("ˆ", "CIRCUMFLEX ACCENT"),
-        0x02C7: ("ˇ", "CARON"),
-        0x02D8: ("˘", "BREVE"),
-        0x02D9: ("˙", "DOT ABOVE"),
-        0x02DA: ("˚", "RING ABOVE"),
-        0x02DB: ("˛", "OGONEK"),
-        0x02DC: ("˜", "TILDE"),
-        0x02DD: ("˝", "DOUBLE ACUTE ACCENT"),
-        0x1E80: ("Ẁ", "LATIN CAPITAL LETTER W WITH GRAVE"),
-        0x1E81: ("ẁ", "LATIN SMALL LETTER W WITH GRAVE"),
-        0x1E82: ("Ẃ", "LATIN CAPITAL LETTER W WITH ACUTE"),
-        0x1E83: ("ẃ", "LATIN SMALL LETTER W WITH ACUTE"),
-        0x1E84: ("Ẅ", "LATIN CAPITAL LETTER W WITH DIAERESIS"),
-        0x1E85: ("ẅ", "LATIN SMALL LETTER W WITH DIAERESIS"),
-        0x1E9E: ("ẞ", "LATIN CAPITAL LETTER SHARP S"),
-        0x1EF2: ("Ỳ", "LATIN CAPITAL LETTER Y WITH GRAVE"),
-        0x1EF3: ("ỳ", "LATIN SMALL LETTER Y WITH GRAVE"),
-        0x2013: ("–", "EN DASH"),
-        0x2014: ("—", "EM DASH"),
-        0x2018: ("‘", "LEFT SINGLE QUOTATION MARK"),
-        0x2019: ("’", "RIGHT SINGLE QUOTATION MARK"),
-        0x201A: ("‚", "SINGLE LOW-9 QUOTATION MARK"),
-        0x201C: ("“", "LEFT DOUBLE QUOTATION MARK"),
-        0x201D: ("”", "RIGHT DOUBLE QUOTATION MARK"),
-        0x201E: ("„", "DOUBLE LOW-9 QUOTATION MARK"),
-        0x2020: ("†", "DAGGER"),
-        0x2021: ("‡", "DOUBLE DAGGER"),
-        0x2022: ("•", "BULLET"),
-        0x2026: ("…", "HORIZONTAL ELLIPSIS"),
-        0x2030: ("‰", "PER MILLE SIGN"),
-        0x2039: ("‹", "SINGLE LEFT-POINTING ANGLE QUOTATION MARK"),
-        0x203A: ("›", "SINGLE RIGHT-POINTING ANGLE QUOTATION MARK"),
-        0x2044: ("⁄", "FRACTION SLASH"),
-        0x20AC: ("€", "EURO SIGN"),
-        0x2122: ("™", "TRADE MARK SIGN"),
-        0x2248: ("≈", "ALMOST EQUAL TO"),
-        0x2260: ("≠", "NOT EQUAL TO"),
-        0x2264: ("≤", "LESS-THAN OR EQUAL TO"),
-        0x2265: ("≥", "GREATER-THAN OR EQUAL TO"),
-        0x2212: ("−", "MINUS SIGN"),
-        # 0x00B5: ("µ", "MICRO SIGN"),
-        # 0x0394: ("Δ", "GREEK CAPITAL LETTER DELTA"),
-        # 0x03A9: ("Ω", "GREEK CAPITAL LETTER OMEGA"),
-        # 0x03BC: ("μ", "GREEK SMALL LETTER MU"),
-        # 0x03C0: ("π", "GREEK SMALL LETTER PI"),
-        # 0x2126: ("Ω", "OHM SIGN"),
-        # 0x2202: ("∂", "PARTIAL DIFFERENTIAL"),
-        # 0x2206: ("∆", "INCREMENT"),
-        # 0x220F: ("∏", "N-ARY PRODUCT"),
-        # 0x2211: ("∑", "N-ARY SUMMATION"),
-        # 0x221A: ("√", "SQUARE ROOT"),
-        # 0x221E: ("∞", "INFINITY"),
-        # 0x222B: ("∫", "INTEGRAL"),
-        # 0x25CA: ("◊", "LOZENGE"),
-        # 0xFB01: ("ﬁ", "LATIN SMALL LIGATURE FI"),
-        # 0xFB02: ("ﬂ", "LATIN SMALL LIGATURE FL"),
-    }
-
-    required_codepoints = set(TN_latin_set)
-    diff = required_codepoints - font_codepoints
+    # The minimal Latin character set is stored in
+    # fontbakery/data/codepoint_sets.bin
+    diff = codepoint_set("TYPENETWORK_LATIN") - font_codepoints
     missing = []
-    for c in sorted(diff):
+    for c in diff:
         try:
             missing.append("uni%04X %s (%s)\n" % (c, chr(c), unicodedata2.name(chr(c))))
         except ValueError:
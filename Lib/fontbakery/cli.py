@@ -3,12 +3,14 @@
 # $ fontbakery check-profile fontbakery.profiles.googlefonts -h
 import argparse
 from collections import OrderedDict
+import importlib
+import json
 import os
 import sys
 import signal
 
 from fontbakery import __version__
-from fontbakery.checkrunner import CheckRunner
+from fontbakery.checkrunner import CheckRunner, EXECUTORS
 from fontbakery.status import (
     DEBUG,
     ERROR,
@@ -27,12 +29,8 @@ from fontbakery.fonts_profile import (
     setup_context,
     ITERARGS,
 )
-from fontbakery.reporters.terminal import TerminalReporter
-from fontbakery.reporters.serialize import JSONReporter
-from fontbakery.reporters.badge import BadgeReporter
-from fontbakery.reporters.ghmarkdown import GHMarkdownReporter
-from fontbakery.reporters.html import HTMLReporter
-from fontbakery.utils import get_theme
+from fontbakery.result_cache import DEFAULT_MAX_SIZE, ResultCache
+from fontbakery.timing import TimingRecorder
 
 
 CLI_PROFILES = [
@@ -59,6 +57,8 @@ DEFAULT_ERROR_CODE_ON = FAIL
 
 
 class AddReporterAction(argparse.Action):
+    # Reporters are given by the dotted name of their class, which is only
+    # imported when the reporter is used (some need heavy dependencies).
     def __init__(self, option_strings, dest, nargs=None, **kwargs):
         self.cls = kwargs["cls"]
         del kwargs["cls"]
@@ -75,6 +75,164 @@ def signal_handler(sig, frame):
     sys.exit(-1)
 
 
+# The reporters which can be added from the command line: their option,
+# dotted class name, metavar and help, and the extension of their reports
+# on each family of a batch run.
+REPORTERS = [
+    (
+        "--json",
+        "fontbakery.reporters.serialize.JSONReporter",
+        "JSON_FILE",
+        "Write a json formatted report to JSON_FILE.",
+        ".json",
+    ),
+    (
+        "--ndjson",
+        "fontbakery.reporters.serialize.NDJSONReporter",
+        "NDJSON_FILE",
+        "Write each check result to NDJSON_FILE as soon as it is\n"
+        "available, one json document per line.",
+        ".ndjson",
+    ),
+    (
+        "--badges",
+        "fontbakery.reporters.badge.BadgeReporter",
+        "DIRECTORY",
+        "Write a set of shields.io badge files to DIRECTORY.",
+        "",
+    ),
+    (
+        "--ghmarkdown",
+        "fontbakery.reporters.ghmarkdown.GHMarkdownReporter",
+        "MD_FILE",
+        "Write a GitHub-Markdown formatted report to MD_FILE.",
+        ".md",
+    ),
+    (
+        "--html",
+        "fontbakery.reporters.html.HTMLReporter",
+        "HTML_FILE",
+        "Write a HTML report to HTML_FILE.",
+        ".html",
+    ),
+]
+
+
+def positive_int(value):
+    int_value = int(value)
+    if int_value < 0:
+        raise argparse.ArgumentTypeError(
+            f'Invalid value "{value}" must be' f" zero or a positive integer value."
+        )
+    return int_value
+
+
+def log_levels_get(key):
+    if key in log_levels:
+        return log_levels[key]
+    valid_keys = ", ".join(log_levels.keys())
+    raise argparse.ArgumentTypeError(f'Key "{key}" must be one of: {valid_keys}.')
+
+
+def add_report_arguments(argument_parser, batch=False):
+    """Add the options which select what is reported, and where, and the
+    result cache options. These are shared by the check-* subcommands and
+    batch, where each report option names the directory of the reports of
+    all the families. Returns the logging and reports argument groups."""
+    logging_group = argument_parser.add_argument_group(
+        "Logging", "Options which control the amount and order of output"
+    )
+
+    valid_keys = ", ".join(log_levels.keys())
+
+    logging_group.add_argument(
+        "-v",
+        "--verbose",
+        dest="loglevels",
+        const=PASS,
+        action="append_const",
+        help="Shortcut for '-l PASS'.\n",
+    )
+
+    logging_group.add_argument(
+        "-l",
+        "--loglevel",
+        dest="loglevels",
+        type=log_levels_get,
+        action="append",
+        metavar="LOGLEVEL",
+        help=f"Report checks with a result of this status or higher.\n"
+        f"One of: {valid_keys}.\n"
+        f"(default: {DEFAULT_LOG_LEVEL.name})",
+    )
+
+    logging_group.add_argument(
+        "-m",
+        "--loglevel-messages",
+        default=None,
+        type=log_levels_get,
+        help=f"Report log messages of this status or higher.\n"
+        f"Messages are all status lines within a check.\n"
+        f"One of: {valid_keys}.\n"
+        f"(default: LOGLEVEL)",
+    )
+
+    report_group = argument_parser.add_argument_group(
+        "Reports", "Options which control report generation"
+    )
+
+    for option, reporter_class, metavar, help_text, _ in REPORTERS:
+        if batch:
+            metavar = "DIRECTORY"
+            help_text = (
+                f"Also write each family's {option[2:]} report to DIRECTORY,\n"
+                "mirroring the layout of the collection."
+            )
+        report_group.add_argument(
+            option,
+            default=False,
+            action=AddReporterAction,
+            cls=reporter_class,
+            metavar=metavar,
+            help=help_text,
+        )
+
+    cache_group = argument_parser.add_argument_group(
+        "Cache", "Options related to the caching of check results"
+    )
+
+    cache_group.add_argument(
+        "--cache-dir",
+        default=None,
+        metavar="DIRECTORY",
+        help="Keep the results of the checks in DIRECTORY and reuse them\n"
+        "when checking files which have not changed since a previous run.\n"
+        "Results are keyed by the contents of the checked files and of\n"
+        "their sidecar files (e.g. METADATA.pb). Checks which use the\n"
+        "network are never cached.",
+    )
+
+    cache_group.add_argument(
+        "--cache-size",
+        default=DEFAULT_MAX_SIZE // (1024 * 1024),
+        type=positive_int,
+        metavar="MEGABYTES",
+        help="Maximum size of the --cache-dir; the least recently used\n"
+        "results are dropped beyond it. (default: %(default)s)",
+    )
+
+    return logging_group, report_group
+
+
+def default_loglevels(loglevels):
+    """The statuses to report: those given, or those from DEFAULT_LOG_LEVEL up."""
+    return loglevels or [
+        status
+        for status in log_levels.values()
+        if status.weight >= DEFAULT_LOG_LEVEL.weight
+    ]
+
+
 def ArgumentParser():
     argument_parser = argparse.ArgumentParser(
         description="Check TTF files against a profile.",
@@ -104,6 +262,24 @@ def ArgumentParser():
             )
         add_profile_arguments(subparser)
 
+    add_batch_arguments(
+        subparsers.add_parser(
+            "batch",
+            help="Check every family of a font collection in a single process.",
+            formatter_class=argparse.RawTextHelpFormatter,
+        )
+    )
+    subcommands.append("batch")
+
+    add_serve_arguments(
+        subparsers.add_parser(
+            "serve",
+            help="Keep the checks loaded and run check jobs sent over a socket.",
+            formatter_class=argparse.RawTextHelpFormatter,
+        )
+    )
+    subcommands.append("serve")
+
     argument_parser.subcommands = subcommands
     return argument_parser
 
@@ -117,6 +293,15 @@ def add_profile_arguments(argument_parser):
         help="List the checks available in the selected profile.",
     )
 
+    argument_parser.add_argument(
+        "--plan",
+        default=False,
+        action="store_true",
+        help="Do not run the checks; print the execution plan (how many times\n"
+        "each selected check would run on the given files, and what provides\n"
+        "each of its arguments) as JSON.",
+    )
+
     argument_parser.add_argument(
         "--configuration",
         dest="configfile",
@@ -143,48 +328,7 @@ def add_profile_arguments(argument_parser):
         ),
     )
 
-    logging_group = argument_parser.add_argument_group(
-        "Logging", "Options which control the amount and order of output"
-    )
-
-    valid_keys = ", ".join(log_levels.keys())
-
-    def log_levels_get(key):
-        if key in log_levels:
-            return log_levels[key]
-        raise argparse.ArgumentTypeError(f'Key "{key}" must be one of: {valid_keys}.')
-
-    logging_group.add_argument(
-        "-v",
-        "--verbose",
-        dest="loglevels",
-        const=PASS,
-        action="append_const",
-        help="Shortcut for '-l PASS'.\n",
-    )
-
-    logging_group.add_argument(
-        "-l",
-        "--loglevel",
-        dest="loglevels",
-        type=log_levels_get,
-        action="append",
-        metavar="LOGLEVEL",
-        help=f"Report checks with a result of this status or higher.\n"
-        f"One of: {valid_keys}.\n"
-        f"(default: {DEFAULT_LOG_LEVEL.name})",
-    )
-
-    logging_group.add_argument(
-        "-m",
-        "--loglevel-messages",
-        default=None,
-        type=log_levels_get,
-        help=f"Report log messages of this status or higher.\n"
-        f"Messages are all status lines within a check.\n"
-        f"One of: {valid_keys}.\n"
-        f"(default: LOGLEVEL)",
-    )
+    logging_group, report_group = add_report_arguments(argument_parser)
 
     logging_group.add_argument(
         "--succinct",
@@ -291,10 +435,10 @@ def add_profile_arguments(argument_parser):
         help="Use a color theme with light colors.",
     )
 
-    network_group = argument_parser.add_argument_group(
+    network_options = argument_parser.add_argument_group(
         "Network", "Network related options"
     )
-    network_group = network_group.add_mutually_exclusive_group()
+    network_group = network_options.add_mutually_exclusive_group()
 
     network_group.add_argument(
         "--timeout",
@@ -310,54 +454,41 @@ def add_profile_arguments(argument_parser):
         help="Skip network checks",
     )
 
-    report_group = argument_parser.add_argument_group(
-        "Reports", "Options which control report generation"
-    )
-
-    report_group.add_argument(
-        "--json",
-        default=False,
-        action=AddReporterAction,
-        cls=JSONReporter,
-        metavar="JSON_FILE",
-        help="Write a json formatted report to JSON_FILE.",
+    network_options.add_argument(
+        "--network-cache",
+        default=None,
+        metavar="DIRECTORY",
+        help="Record the responses to the requests made by network checks\n"
+        "in DIRECTORY, and reuse them while they are fresh.",
     )
 
-    report_group.add_argument(
-        "--badges",
+    network_options.add_argument(
+        "--network-replay",
         default=False,
-        action=AddReporterAction,
-        cls=BadgeReporter,
-        metavar="DIRECTORY",
-        help="Write a set of shields.io badge files to DIRECTORY.",
+        action="store_true",
+        help="Answer the requests made by network checks only with the\n"
+        "responses recorded in the --network-cache directory, without\n"
+        "accessing the network.",
     )
 
     report_group.add_argument(
-        "--ghmarkdown",
-        default=False,
-        action=AddReporterAction,
-        cls=GHMarkdownReporter,
-        metavar="MD_FILE",
-        help="Write a GitHub-Markdown formatted report to MD_FILE.",
+        "--profile-checks",
+        default=None,
+        metavar="JSON_FILE",
+        help="Measure the time taken by each check and by the first\n"
+        "evaluation of each condition. The slowest ones are listed on\n"
+        "the terminal and all of them are written to JSON_FILE.",
     )
 
     report_group.add_argument(
-        "--html",
-        default=False,
-        action=AddReporterAction,
-        cls=HTMLReporter,
-        metavar="HTML_FILE",
-        help="Write a HTML report to HTML_FILE.",
+        "--trace",
+        default=None,
+        metavar="TRACE_FILE",
+        help="Write a timeline of the run (checks, conditions, table\n"
+        "decompilation, external tools) to TRACE_FILE, in the Chrome\n"
+        "trace-event format (see chrome://tracing or ui.perfetto.dev).",
     )
 
-    def positive_int(value):
-        int_value = int(value)
-        if int_value < 0:
-            raise argparse.ArgumentTypeError(
-                f'Invalid value "{value}" must be' f" zero or a positive integer value."
-            )
-        return int_value
-
     argument_parser.add_argument(
         "-J",
         "--jobs",
@@ -366,8 +497,8 @@ def add_profile_arguments(argument_parser):
         metavar="JOBS",
         dest="multiprocessing",
         help=f"Use multi-processing to run the checks. The argument is the number\n"
-        f"of worker processes. A sensible number is the cpu count of your\n"
-        f"system, detected: {os.cpu_count()}."
+        f"of workers (see --executor). A sensible number is the cpu count of\n"
+        f"your system, detected: {os.cpu_count()}."
         f" As an automated shortcut see -j/--auto-jobs.\n"
         f"Use 1 to run in single-processing mode (default %(default)s).",
     )
@@ -381,6 +512,15 @@ def add_profile_arguments(argument_parser):
         " as number of worker processes\n"
         "in multi-processing. This is equivalent to : `--jobs %(const)s`",
     )
+    argument_parser.add_argument(
+        "--executor",
+        default="threads",
+        choices=EXECUTORS,
+        help="How the -J/--jobs workers run the checks:\n"
+        "'threads' share the parsed fonts within a single process, while\n"
+        "'processes' open the fonts in each worker process and scale\n"
+        "CPU-bound checks across cores. (default: %(default)s)",
+    )
     argument_parser.add_argument(
         "-e",
         "--error-code-on",
@@ -389,7 +529,7 @@ def add_profile_arguments(argument_parser):
         default=DEFAULT_ERROR_CODE_ON,
         help="Threshold for emitting process error code 1. (Useful for"
         " deciding the criteria for breaking a continuous integration job)\n"
-        f"One of: {valid_keys}.\n"
+        f"One of: {', '.join(log_levels.keys())}.\n"
         f"(default: {DEFAULT_ERROR_CODE_ON.name})",
     )
 
@@ -402,6 +542,206 @@ def add_profile_arguments(argument_parser):
     return argument_parser
 
 
+def add_batch_arguments(argument_parser):
+    argument_parser.add_argument(
+        "profile",
+        help=f"One of: {', '.join(CLI_PROFILES)};\n"
+        "or the file/module name of a fontbakery 'profile'.",
+        metavar="PROFILE",
+    )
+    argument_parser.add_argument(
+        "collection",
+        help="Directory holding the families to check, one directory per\n"
+        "family (e.g. a checkout of https://github.com/google/fonts): each\n"
+        "directory with a METADATA.pb file or font files, along with its\n"
+        "subdirectories (such as static/).",
+        metavar="COLLECTION",
+    )
+    argument_parser.add_argument(
+        "-O",
+        "--output-dir",
+        default=None,
+        metavar="DIRECTORY",
+        help="Write a JSON report for each family to DIRECTORY, mirroring the\n"
+        "layout of the collection, plus a summary.json of all of them.\n"
+        "(default: COLLECTION/check_results)",
+    )
+    argument_parser.add_argument(
+        "--configuration",
+        dest="configfile",
+        help="Read configuration file (TOML/YAML).\n",
+    )
+    argument_parser.add_argument(
+        "-c",
+        "--checkid",
+        action="append",
+        help="Explicit check-ids (or parts of their name) to be executed.",
+    )
+    argument_parser.add_argument(
+        "-x",
+        "--exclude-checkid",
+        action="append",
+        help="Exclude check-ids (or parts of their name) from execution.",
+    )
+    argument_parser.add_argument(
+        "--skip-network",
+        default=False,
+        action="store_true",
+        help="Skip network checks",
+    )
+    argument_parser.add_argument(
+        "-J",
+        "--jobs",
+        default=1,
+        type=positive_int,
+        metavar="JOBS",
+        dest="multiprocessing",
+        help="Number of families to check in parallel (default %(default)s).",
+    )
+    argument_parser.add_argument(
+        "-j",
+        "--auto-jobs",
+        const=os.cpu_count(),
+        action="store_const",
+        dest="multiprocessing",
+        help="Check as many families in parallel as there are CPUs" " (= %(const)s).",
+    )
+    argument_parser.add_argument(
+        "--executor",
+        default="processes",
+        choices=EXECUTORS,
+        help="How the -J/--jobs workers check the families." " (default: %(default)s)",
+    )
+    argument_parser.add_argument(
+        "-e",
+        "--error-code-on",
+        default=DEFAULT_ERROR_CODE_ON.name,
+        choices=list(log_levels),
+        help="Threshold for emitting process error code 1." " (default: %(default)s)",
+    )
+    argument_parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Be quiet, don’t report anything on the terminal.",
+    )
+    add_report_arguments(argument_parser, batch=True)
+    return argument_parser
+
+
+def run_batch(args):
+    from fontbakery.batch import BatchRunner
+
+    if args.profile in CLI_PROFILES:
+        args.profile = "fontbakery.profiles." + args.profile
+    if args.configfile:
+        configuration = Configuration.from_config_file(args.configfile)
+    else:
+        configuration = Configuration()
+    configuration.maybe_override(
+        Configuration(
+            explicit_checks=args.checkid,
+            exclude_checks=args.exclude_checkid,
+            skip_network=args.skip_network,
+        )
+    )
+    profile = profile_factory(
+        get_module(args.profile),
+        explicit_checks=configuration["explicit_checks"],
+        exclude_checks=configuration["exclude_checks"],
+    )
+
+    cache = None
+    if args.cache_dir:
+        cache = ResultCache(args.cache_dir, max_size=args.cache_size * 1024 * 1024)
+
+    output_dir = args.output_dir or os.path.join(args.collection, "check_results")
+    extensions = {reporter_class: ext for _, reporter_class, _, _, ext in REPORTERS}
+    runner = BatchRunner(
+        profile,
+        configuration,
+        args.collection,
+        output_dir,
+        jobs=args.multiprocessing,
+        executor=args.executor,
+        loglevels=default_loglevels(args.loglevels),
+        cache=cache,
+        reporters=[
+            (reporter_class, directory, extensions[reporter_class])
+            for reporter_class, directory in getattr(args, "reporters", [])
+        ],
+    )
+
+    def report(name, result):
+        if args.quiet:
+            return
+        if "error" in result:
+            print(f"{name}: {result['error']}")
+        else:
+            counts = ", ".join(
+                f"{status}: {count}"
+                for status, count in sorted(result["result"].items())
+                if count and status in log_levels
+            )
+            print(f"{name}: {result['worst_status']} ({counts})")
+
+    summary = runner.run(on_family=report)
+    if not args.quiet:
+        print(f'Checked {len(summary)} families; the reports are in "{output_dir}"')
+
+    error_code_on = log_levels[args.error_code_on]
+    return (
+        1
+        if any(
+            "error" in result
+            or (
+                result["worst_status"]
+                and log_levels[result["worst_status"]].weight >= error_code_on.weight
+            )
+            for result in summary.values()
+        )
+        else 0
+    )
+
+
+def add_serve_arguments(argument_parser):
+    listen_group = argument_parser.add_mutually_exclusive_group(required=True)
+    listen_group.add_argument(
+        "--socket",
+        default=None,
+        metavar="PATH",
+        help="Listen for check jobs on the Unix socket PATH.",
+    )
+    listen_group.add_argument(
+        "--port",
+        default=None,
+        type=int,
+        help="Listen for check jobs on PORT of localhost.",
+    )
+    argument_parser.add_argument(
+        "--preload",
+        action="append",
+        default=[],
+        metavar="PROFILE",
+        help="Build PROFILE before accepting jobs, instead of on its first\n"
+        "job. Use this option multiple times to preload several profiles.",
+    )
+    return argument_parser
+
+
+def serve(args):
+    from fontbakery.daemon import CheckServer, make_server
+
+    check_server = CheckServer()
+    check_server.preload(args.preload)
+    server = make_server(check_server, socket_path=args.socket, port=args.port)
+    address = args.socket or f"127.0.0.1:{server.server_address[1]}"
+    print(f"FontBakery {__version__} is waiting for check jobs on {address}")
+    with server:
+        server.serve_forever()
+    return 0
+
+
 class ArgumentParserError(Exception):
     pass
 
@@ -423,6 +763,12 @@ def main():
     elif args.command is None:
         argument_parser.print_usage()
         sys.exit(2)
+    elif args.command == "batch":
+        return run_batch(args)
+    elif args.command == "serve":
+        return serve(args)
+
+    from fontbakery.utils import get_theme
 
     theme = get_theme(args)
 
@@ -431,13 +777,6 @@ def main():
             "check-", ""
         ).replace("-", "_")
 
-    profile = profile_factory(get_module(args.profile))
-
-    if args.list_checks:
-        # the most verbose loglevel wins
-        loglevel = min(args.loglevels) if args.loglevels else DEFAULT_LOG_LEVEL
-        list_checks(profile, theme, verbose=loglevel > DEFAULT_LOG_LEVEL)
-
     if args.configfile:
         configuration = Configuration.from_config_file(args.configfile)
     else:
@@ -463,28 +802,60 @@ def main():
             exclude_checks=exclude_checks,
             full_lists=args.full_lists,
             skip_network=args.skip_network,
+            network_cache=args.network_cache,
+            network_replay=args.network_replay or None,
         )
     )
 
+    if configuration.get("network_replay") and not configuration.get("network_cache"):
+        argument_parser.error("--network-replay requires a --network-cache directory")
+
+    # Only the checks selected by -c/-x (and the configuration) are loaded.
+    profile = profile_factory(
+        get_module(args.profile),
+        explicit_checks=configuration["explicit_checks"],
+        exclude_checks=configuration["exclude_checks"],
+    )
+
+    if args.list_checks:
+        # the most verbose loglevel wins
+        loglevel = min(args.loglevels) if args.loglevels else DEFAULT_LOG_LEVEL
+        list_checks(profile, theme, verbose=loglevel > DEFAULT_LOG_LEVEL)
+
     is_async = args.multiprocessing != 0
 
+    cache = None
+    if args.cache_dir:
+        cache = ResultCache(args.cache_dir, max_size=args.cache_size * 1024 * 1024)
+
     context = setup_context(args.files)
     context.is_multithreaded = is_async
     try:
         runner = CheckRunner(
-            profile, jobs=args.multiprocessing, context=context, config=configuration
+            profile,
+            jobs=args.multiprocessing,
+            executor=args.executor,
+            context=context,
+            config=configuration,
+            cache=cache,
+            timings=(
+                TimingRecorder(trace=bool(args.trace))
+                if args.profile_checks or args.trace
+                else None
+            ),
         )
     except ValueValidationError as e:
         print(e)
         argument_parser.print_usage()
         sys.exit(1)
 
-    if not args.loglevels:
-        args.loglevels = [
-            status
-            for status in log_levels.values()
-            if status.weight >= DEFAULT_LOG_LEVEL.weight
-        ]
+    if args.plan:
+        print(json.dumps(runner.plan.describe(), indent=4))
+        return 0
+
+    args.loglevels = default_loglevels(args.loglevels)
+
+    from fontbakery.reporters.terminal import TerminalReporter
 
     tr = TerminalReporter(
         is_async=is_async,
@@ -495,6 +866,8 @@ def main():
         theme=theme,
         print_progress=not args.no_progress,
         quiet=args.quiet,
+        show_timings=bool(args.profile_checks),
+        keep_results=False,
     )
     reporters = [tr]
 
@@ -502,6 +875,9 @@ def main():
         args.reporters = []
 
     for reporter_class, output_file in args.reporters:
+        if isinstance(reporter_class, str):
+            module_name, class_name = reporter_class.rsplit(".", 1)
+            reporter_class = getattr(importlib.import_module(module_name), class_name)
         reporters.append(
             reporter_class(
                 is_async=is_async,
@@ -519,6 +895,16 @@ def main():
     for reporter in reporters:
         reporter.write()
 
+    if args.profile_checks:
+        runner.timings.write(args.profile_checks)
+        if not args.quiet:
+            print(f'A timing profile has been saved to "{args.profile_checks}"')
+
+    if args.trace:
+        runner.timings.write_trace(args.trace)
+        if not args.quiet:
+            print(f'A trace of the check run has been saved to "{args.trace}"')
+
     # Fail and error let the command fail
     return (
         1
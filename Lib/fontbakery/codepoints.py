@@ -0,0 +1,186 @@
+"""
+FontBakery codepoints provides a compact, immutable set of Unicode
+codepoints, for the character repertoires which checks compare fonts with,
+and loads those repertoires from a binary data file.
+"""
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+import struct
+import sys
+
+CODEPOINT_SETS_FILE = "data/codepoint_sets.bin"
+_MAGIC = b"FBCP\x01"
+
+
+class CodepointSet:
+    """An immutable set of codepoints, stored as the boundaries of its runs
+    of consecutive codepoints: (start, end, start, end, ...), sorted, with
+    exclusive ends.
+
+    Repertoires are mostly made of such runs, so they take a few integers
+    instead of a Python int and a hash table entry per codepoint; and
+    set operations are a single merge of the boundaries."""
+
+    __slots__ = ("_bounds",)
+
+    def __init__(self, codepoints=()):
+        if isinstance(codepoints, CodepointSet):
+            self._bounds = codepoints._bounds
+            return
+        bounds = array("I")
+        for codepoint in sorted(set(codepoints)):
+            if bounds and bounds[-1] == codepoint:
+                bounds[-1] = codepoint + 1
+            else:
+                bounds.extend((codepoint, codepoint + 1))
+        self._bounds = bounds
+
+    @classmethod
+    def _from_bounds(cls, bounds):
+        result = cls.__new__(cls)
+        result._bounds = bounds
+        return result
+
+    @classmethod
+    def from_ranges(cls, ranges):
+        """A set made of inclusive (first, last) ranges."""
+        bounds = array("I")
+        for first, last in sorted(ranges):
+            if bounds and first <= bounds[-1]:
+                bounds[-1] = max(bounds[-1], last + 1)
+            else:
+                bounds.extend((first, last + 1))
+        return cls._from_bounds(bounds)
+
+    def ranges(self):
+        """The runs of consecutive codepoints, as inclusive (first, last)
+        ranges."""
+        bounds = self._bounds
+        return [(bounds[i], bounds[i + 1] - 1) for i in range(0, len(bounds), 2)]
+
+    def __len__(self):
+        bounds = self._bounds
+        return sum(bounds[i + 1] - bounds[i] for i in range(0, len(bounds), 2))
+
+    def __iter__(self):
+        bounds = self._bounds
+        for i in range(0, len(bounds), 2):
+            yield from range(bounds[i], bounds[i + 1])
+
+    def __contains__(self, codepoint):
+        return bisect_right(self._bounds, codepoint) % 2 == 1
+
+    def __eq__(self, other):
+        if isinstance(other, CodepointSet):
+            return self._bounds == other._bounds
+        if isinstance(other, (set, frozenset)):
+            return len(self) == len(other) and all(c in other for c in self)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._bounds.tobytes())
+
+    def __repr__(self):
+        ranges = ", ".join(
+            f"U+{first:04X}" if first == last else f"U+{first:04X}..U+{last:04X}"
+            for first, last in self.ranges()
+        )
+        return f"CodepointSet({ranges})"
+
+    def _combine(self, other, keep):
+        # Sweep over the boundaries of both sets, tracking whether we are
+        # inside each of them, and start or end a run of the result
+        # whenever `keep` changes its mind.
+        if not isinstance(other, CodepointSet):
+            other = CodepointSet(other)
+        a, b = self._bounds, other._bounds
+        i = j = 0
+        in_a = in_b = inside = False
+        bounds = array("I")
+        while i < len(a) or j < len(b):
+            if j == len(b) or (i < len(a) and a[i] <= b[j]):
+                point = a[i]
+            else:
+                point = b[j]
+            if i < len(a) and a[i] == point:
+                in_a = not in_a
+                i += 1
+            if j < len(b) and b[j] == point:
+                in_b = not in_b
+                j += 1
+            if keep(in_a, in_b) != inside:
+                inside = not inside
+                bounds.append(point)
+        return CodepointSet._from_bounds(bounds)
+
+    def union(self, other):
+        return self._combine(other, lambda a, b: a or b)
+
+    def intersection(self, other):
+        return self._combine(other, lambda a, b: a and b)
+
+    def difference(self, other):
+        return self._combine(other, lambda a, b: a and not b)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def issubset(self, other):
+        return not self.difference(other)
+
+    def coverage(self, codepoints):
+        """The fraction of this set which is in `codepoints`
+        (e.g. the cmap of a font)."""
+        if not self:
+            return 1.0
+        return len(self.intersection(codepoints)) / len(self)
+
+
+def dump_codepoint_sets(sets):
+    """The binary representation of a mapping of names to CodepointSets."""
+    data = bytearray(_MAGIC)
+    for name, codepoints in sets.items():
+        encoded_name = name.encode("ascii")
+        bounds = array("I", codepoints._bounds)
+        if sys.byteorder == "big":
+            bounds.byteswap()
+        data += struct.pack("<B", len(encoded_name)) + encoded_name
+        data += struct.pack("<I", len(bounds)) + bounds.tobytes()
+    return bytes(data)
+
+
+def load_codepoint_sets(data):
+    """The mapping of names to CodepointSets stored in `data`."""
+    if not data.startswith(_MAGIC):
+        raise ValueError("Not a codepoint sets file")
+    sets = {}
+    offset = len(_MAGIC)
+    while offset < len(data):
+        (name_length,) = struct.unpack_from("<B", data, offset)
+        offset += 1
+        name = data[offset : offset + name_length].decode("ascii")
+        offset += name_length
+        (count,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        bounds = array("I")
+        bounds.frombytes(data[offset : offset + 4 * count])
+        if sys.byteorder == "big":
+            bounds.byteswap()
+        offset += 4 * count
+        sets[name] = CodepointSet._from_bounds(bounds)
+    return sets
+
+
+@lru_cache(maxsize=1)
+def _shipped_codepoint_sets():
+    from pkg_resources import resource_filename
+
+    with open(resource_filename("fontbakery", CODEPOINT_SETS_FILE), "rb") as fh:
+        return load_codepoint_sets(fh.read())
+
+
+def codepoint_set(name):
+    """One of the character repertoires shipped with FontBakery."""
+    return _shipped_codepoint_sets()[name]
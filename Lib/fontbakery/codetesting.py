@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 from functools import cached_property
+import inspect
 from typing import Iterable, Optional
 
 import defcon
@@ -60,6 +61,9 @@ def make_mock(basecls, name):
             return prop.func(self)
         if isinstance(prop, property):
             return prop.fget(self)
+        if inspect.isfunction(prop):
+            # A method: bind it to the mock
+            return prop.__get__(self)
         return prop
 
     cls.__init__ = __init__
@@ -0,0 +1,154 @@
+"""
+FontBakery daemon keeps profiles and check modules loaded in a long-running
+process, and checks files on request, so that frequent callers (e.g. a font
+build farm) do not pay for the Python startup and the loading of the checks
+on every run.
+
+Jobs are submitted over a Unix socket, or a TCP socket bound to localhost,
+as a single line of JSON:
+
+    {"profile": "googlefonts",
+     "files": ["/path/to/Family-Regular.ttf", ...],
+     "checks": ["..."], "exclude_checks": ["..."],
+     "config": {...}}
+
+Only "files" is required; "profile" defaults to "universal", "checks" and
+"exclude_checks" select checks like -c/-x on the command line, and "config"
+holds the contents of a configuration file. The results are streamed back
+as they become available, in the format of the NDJSON reporter: one line
+of JSON per check result, followed by a summary line. A job which cannot
+be run gets a single {"error": ...} line instead.
+
+Each job gets its own CheckRunContext, so concurrent jobs never share any
+condition; only the (read-only) profiles are shared.
+"""
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+
+from fontbakery.checkrunner import CheckRunner
+from fontbakery.configuration import Configuration
+from fontbakery.fonts_profile import get_module, profile_factory, setup_context
+from fontbakery.reporters.serialize import NDJSONReporter
+from fontbakery.status import PASS
+
+DEFAULT_PROFILE = "universal"
+
+
+class _StreamReporter(NDJSONReporter):
+    """An NDJSON reporter writing to the connection of a job."""
+
+    def __init__(self, stream, **kwargs):
+        super().__init__(**kwargs)
+        self._stream = stream
+
+    def _open(self):
+        return io.TextIOWrapper(self._stream, encoding="utf-8", write_through=True)
+
+
+class CheckServer:
+    """Runs check jobs on warm profiles, which are built when first used
+    (or in advance, with `preload`) and then kept for all later jobs."""
+
+    def __init__(self):
+        self._profiles = {}
+        self._lock = threading.Lock()
+
+    def profile(self, name):
+        """The profile of the given name: the name of a FontBakery profile
+        (e.g. "googlefonts"), or the module/file name of another one."""
+        with self._lock:
+            if name not in self._profiles:
+                module_name = name
+                if "." not in name and not os.path.isfile(name):
+                    module_name = "fontbakery.profiles." + name
+                self._profiles[name] = profile_factory(get_module(module_name))
+            return self._profiles[name]
+
+    def preload(self, names):
+        for name in names:
+            self.profile(name)
+
+    def run_job(self, job, stream):
+        """Run the checks described by `job` and stream the results
+        to the binary file object `stream`."""
+        try:
+            if not isinstance(job, dict) or not job.get("files"):
+                raise ValueError("A job must list the files to check.")
+            profile = self.profile(job.get("profile", DEFAULT_PROFILE))
+            config = Configuration(**job.get("config", {}))
+            config.maybe_override(
+                Configuration(
+                    explicit_checks=job.get("checks"),
+                    exclude_checks=job.get("exclude_checks"),
+                )
+            )
+            context = setup_context(job["files"])
+            runner = CheckRunner(profile, context, config)
+        except Exception as e:  # pylint: disable=broad-except
+            stream.write(
+                (json.dumps({"error": f"{type(e).__name__}: {e}"}) + "\n").encode(
+                    "utf-8"
+                )
+            )
+            return
+        reporter = _StreamReporter(stream, runner=runner, loglevels=[PASS], quiet=True)
+        runner.run([reporter])
+
+
+class _JobHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            line = self.rfile.readline()
+            try:
+                job = json.loads(line)
+            except ValueError:
+                job = None
+            self.server.check_server.run_job(job, self.wfile)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away; there is no one left to report to.
+            pass
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def make_server(check_server, socket_path=None, port=None):
+    """A socket server handing each connection, one job each, to a new
+    thread. It listens on the Unix socket `socket_path`, or else on
+    `port` of localhost."""
+    if socket_path:
+        # Remove the socket left by a previous server, but never a file
+        # which is not a socket.
+        if os.path.exists(socket_path) and stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.unlink(socket_path)
+        server = _UnixServer(socket_path, _JobHandler)
+    else:
+        server = _TCPServer(("127.0.0.1", port or 0), _JobHandler)
+    server.check_server = check_server
+    return server
+
+
+def submit(job, socket_path=None, port=None):
+    """Submit a job to a running daemon and yield the decoded lines of
+    its results as they arrive."""
+    if socket_path:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(socket_path)
+    else:
+        connection = socket.create_connection(("127.0.0.1", port))
+    with connection, connection.makefile("rwb") as stream:
+        stream.write((json.dumps(job) + "\n").encode("utf-8"))
+        stream.flush()
+        for line in stream:
+            yield json.loads(line)
@@ -0,0 +1,178 @@
+"""
+FontBakery external_tools runs the external programs which some checks rely
+on (ots-sanitize, FontValidator, ufolint) through a runner shared by the
+whole check run, which bounds how many of them run at once, applies a
+timeout, and keeps their output, keyed by the contents of the files they
+were run on and the version of the tool.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. Please keep it so.
+"""
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from typing import Dict
+
+from fontbakery.result_cache import hash_path
+from fontbakery.timing import measure
+
+DEFAULT_TIMEOUT = 600  # seconds
+
+# Arguments replaced by a temporary directory, whose files are collected
+# into ToolResult.files once the tool has run.
+OUTPUT_DIR = "{output_dir}"
+
+
+@dataclass
+class ToolResult:
+    """The outcome of running a tool: its return code and output, and the
+    files it wrote in its output directory."""
+
+    returncode: int
+    stdout: bytes = b""
+    stderr: bytes = b""
+    files: Dict[str, bytes] = field(default_factory=dict)
+
+
+class ToolRunner:
+    """Runs external tools on files.
+
+    - At most `max_processes` tools run at once (in this process), however
+      many checks are being run in parallel.
+    - A tool taking longer than `timeout` seconds is killed, and
+      subprocess.TimeoutExpired is raised.
+    - Results are kept by tool version, arguments and contents of the input
+      files: in memory for the whole run (so that a tool runs once per
+      file, even if it is asked for concurrently), and in `cache` (a
+      ResultCache) if given, across runs."""
+
+    def __init__(self, max_processes=None, timeout=DEFAULT_TIMEOUT, cache=None):
+        self.timeout = timeout
+        self.cache = cache
+        self._slots = threading.BoundedSemaphore(max_processes or os.cpu_count() or 1)
+        self._lock = threading.Lock()
+        self._results = {}  # key -> Future of a ToolResult
+        self._versions = {}
+
+    def version(self, executable):
+        """Identifies the installed version of a tool, for tools which do
+        not tell: its path, size and modification time."""
+        if executable not in self._versions:
+            path = shutil.which(executable)
+            if path is None:
+                raise FileNotFoundError(f"{executable} is not available")
+            stat = os.stat(path)
+            self._versions[executable] = f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+        return self._versions[executable]
+
+    def key(self, args, inputs, version):
+        """The key of the result of running `args` on `inputs` (which are
+        identified by their contents rather than their paths)."""
+        hashes = {path: hash_path(path) for path in inputs}
+        data = json.dumps(
+            [version, [hashes.get(arg, arg) for arg in args]], sort_keys=True
+        )
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def run(self, args, inputs, version=None, timeout=None):
+        """Run a tool (or reuse the result of an earlier run of it).
+
+        args: the command line. An argument equal to OUTPUT_DIR is replaced
+            with a temporary directory.
+        inputs: the files (or directories) among the args which the result
+            depends on.
+        version: the version of the tool (by default, see `version()`)."""
+        if version is None:
+            version = self.version(args[0])
+        key = self.key(args, inputs, version)
+        future, owner = self._claim(key)
+        if owner:
+            self._resolve(future, key, lambda: self._execute(args, inputs, timeout))
+        return future.result()
+
+    def run_batch(self, args, inputs, split, version=None, timeout=None):
+        """Run a tool once on several inputs, for tools which accept many
+        files at a time, and keep the result of each input as if the tool
+        had been run on it alone.
+
+        args: a function of a list of inputs returning a command line.
+        split: a function of the batch result and an input returning the
+            ToolResult of that input.
+
+        Returns the result of each input. Inputs already run (or being run)
+        are not run again."""
+        if version is None:
+            version = self.version(args(inputs[:1])[0])
+        futures, pending = {}, {}
+        for path in inputs:
+            key = self.key(args([path]), [path], version)
+            futures[path], owner = self._claim(key)
+            cached = self._cached(key) if owner else None
+            if cached:
+                futures[path].set_result(cached)
+            elif owner:
+                pending[path] = key
+
+        if pending:
+            try:
+                result = self._execute(args(list(pending)), list(pending), timeout)
+            except BaseException as error:
+                for path in pending:
+                    futures[path].set_exception(error)
+                raise
+            for path, key in pending.items():
+                self._resolve(futures[path], key, lambda p=path: split(result, p))
+        return {path: future.result() for path, future in futures.items()}
+
+    def _claim(self, key):
+        """The future result of a key, and whether the caller must compute it."""
+        with self._lock:
+            if key in self._results:
+                return self._results[key], False
+            future = self._results[key] = Future()
+            return future, True
+
+    def _resolve(self, future, key, compute):
+        try:
+            result = self._cached(key)
+            if result is None:
+                result = compute()
+                if self.cache is not None:
+                    self.cache.put(key, result)
+            future.set_result(result)
+        except BaseException as error:  # pylint: disable=broad-except
+            future.set_exception(error)
+
+    def _cached(self, key):
+        if self.cache is not None:
+            result = self.cache.get(key)
+            if isinstance(result, ToolResult):
+                return result
+        return None
+
+    def _execute(self, args, inputs, timeout):
+        with tempfile.TemporaryDirectory(prefix="fontbakery-tool-") as output_dir:
+            command = [output_dir if arg == OUTPUT_DIR else arg for arg in args]
+            with self._slots, measure(
+                "tool", os.path.basename(args[0]), file=", ".join(inputs)
+            ):
+                process = subprocess.run(
+                    command,
+                    capture_output=True,
+                    timeout=timeout or self.timeout,
+                    check=False,
+                )
+            files = {}
+            for name in os.listdir(output_dir):
+                path = os.path.join(output_dir, name)
+                if os.path.isfile(path):
+                    with open(path, "rb") as fh:
+                        files[name] = fh.read()
+        return ToolResult(process.returncode, process.stdout, process.stderr, files)
@@ -12,10 +12,13 @@ import warnings
 from fontTools.ttLib.sfnt import readTTCHeader
 
 import fontbakery.checks
+from fontbakery import check_manifest
 from fontbakery.callable import FontBakeryCheck
+from fontbakery.checkrunner import check_is_selected
 from fontbakery.testable import CheckRunContext, FILE_TYPES, TTCFont
 from fontbakery.errors import ValueValidationError
 from fontbakery.profile import Profile, Section
+from fontbakery.utils import is_negated
 
 
 ITERARGS = {val.singular: val.plural for val in FILE_TYPES}
@@ -58,6 +61,7 @@ def setup_context(files):
 checks_by_id = {}
 conditions_by_name = {}
 checks_loaded = False
+loaded_modules = set()  # Check modules imported through the check manifest
 
 FILE_MODULE_NAME_PREFIX = "."
 
@@ -105,28 +109,91 @@ def load_all_checks(package=fontbakery.checks):
         load_checks_from_module(module)
 
 
-def add_checks_to_nascent_profile(sections, section, checks, excluded=None):
+def _load_all_checks_once():
+    # XXX replace with a singleton one day
+    global checks_loaded  # pylint: disable=global-statement
+    if not checks_loaded:
+        load_all_checks()
+        checks_loaded = True
+
+
+def _import_modules(module_names):
+    """Import the check modules not loaded yet, and register their checks;
+    return whether there were any."""
+    imported = False
+    for module_name in module_names:
+        if module_name in loaded_modules:
+            continue
+        loaded_modules.add(module_name)
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            warnings.warn("Failed to load %s: %s" % (module_name, e))
+            continue
+        load_checks_from_module(module)
+        imported = True
+    return imported
+
+
+def check_exists(check_id):
+    """Whether there is a check of the given id, without loading it
+    if the check manifest knows about it."""
+    if check_id not in checks_by_id and check_id not in check_manifest.CHECKS:
+        # Not a check of ours, or a stale manifest
+        _load_all_checks_once()
+    return check_id in checks_by_id or check_id in check_manifest.CHECKS
+
+
+def load_check(check_id):
+    """The check of the given id, importing the module which defines it."""
+    if check_id not in checks_by_id and check_id in check_manifest.CHECKS:
+        _import_modules([check_manifest.CHECKS[check_id]])
+    if check_id not in checks_by_id:
+        _load_all_checks_once()
+    return checks_by_id[check_id]
+
+
+def load_conditions(names):
+    """Import the modules defining the conditions of the given names (which
+    attach them to the testables); return whether any had to be imported."""
+    return _import_modules(
+        module_name
+        for name in names
+        for module_name in check_manifest.CONDITIONS.get(name, [])
+    )
+
+
+def add_checks_to_nascent_profile(
+    sections,
+    section,
+    checks,
+    excluded=None,
+    explicit_checks=None,
+    exclude_checks=None,
+):
     if section not in sections:
         sections[section] = Section(
             name=section,
             checks=[],
         )
     for check in checks:
-        if check not in checks_by_id:
+        if not check_exists(check):
             raise ValueError(f"Check '{check}' not found")
         if excluded and check in excluded:
             continue
-        check_object = checks_by_id[check]
+        if not check_is_selected(check, explicit_checks, exclude_checks):
+            continue
         if not sections[section].has_check(check):
-            sections[section].checks.append(check_object)
+            sections[section].checks.append(load_check(check))
 
 
-def profile_factory(module):
-    # XXX replace with a singleton one day
-    global checks_loaded  # pylint: disable=global-statement
-    if not checks_loaded:
-        load_all_checks()
-        checks_loaded = True
+def profile_factory(module, explicit_checks=None, exclude_checks=None):
+    """Build the profile defined by a module.
+
+    Only the modules defining its checks (and the conditions those checks
+    need) are imported, as listed in the check manifest. When
+    explicit_checks and/or exclude_checks are given, the profile only
+    includes the checks they select (see check_is_selected)."""
     profile_data = getattr(module, "PROFILE")
     sections = {}
 
@@ -137,7 +204,7 @@ def profile_factory(module):
     if "include_profiles" in profile_data:
         for profilename in profile_data["include_profiles"]:
             module = importlib.import_module(f"fontbakery.profiles.{profilename}")
-            included_profile = profile_factory(module)
+            included_profile = profile_factory(module, explicit_checks, exclude_checks)
             for section in included_profile.sections:
                 add_checks_to_nascent_profile(
                     sections,
@@ -154,8 +221,17 @@ def profile_factory(module):
             checks,
             excluded=profile_data.get("exclude_checks", [])
             + profile_data.get("pending_review", []),
+            explicit_checks=explicit_checks,
+            exclude_checks=exclude_checks,
         )
 
+    load_conditions(
+        name
+        for section in sections.values()
+        for check in section.checks
+        for name in list(check.args) + [is_negated(c)[1] for c in check.conditions]
+    )
+
     profile = Profile(
         name=profile_data.get(
             "name", module.__name__.replace("fontbakery.profiles.", "")
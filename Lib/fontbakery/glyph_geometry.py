@@ -0,0 +1,281 @@
+"""
+FontBakery glyph_geometry computes the basic facts about the outlines
+of every glyph in a font in a single pass, so that checks can share them
+instead of each drawing the glyphs with their own pens.
+"""
+from array import array
+import math
+
+from fontTools.pens.areaPen import AreaPen
+from fontTools.pens.basePen import DecomposingPen
+from fontTools.pens.boundsPen import BoundsPen
+from fontTools.pens.teePen import TeePen
+
+from fontbakery.utils import drawable_glyph_set
+
+NO_BOUNDS = math.nan
+
+
+class _CountingPen(DecomposingPen):
+    """Counts the contours and points drawn with it, including those of
+    the components (e.g. of CFF "seac" accented glyphs)."""
+
+    skipMissingComponents = False
+
+    def __init__(self, glyphSet):
+        super().__init__(glyphSet)
+        self.contours = 0
+        self.points = 0
+
+    def moveTo(self, pt):
+        self.points += 1
+
+    def lineTo(self, pt):
+        self.points += 1
+
+    def curveTo(self, *points):
+        self.points += len(points)
+
+    def qCurveTo(self, *points):
+        self.points += len([pt for pt in points if pt is not None])
+
+    def closePath(self):
+        self.contours += 1
+
+    def endPath(self):
+        self.contours += 1
+
+
+class GlyphGeometry:
+    """A table of per-glyph outline facts, indexed by glyph ID:
+
+    - bounds: the tight bounding box of the outline, as a BoundsPen would
+      compute it, or None for glyphs without any points.
+    - area: the signed outline area, as an AreaPen would compute it.
+    - contour and point counts, including those of the components.
+    - has_ink: whether the glyph draws anything. Composite glyphs have ink
+      if any of their components have ink; simple TrueType glyphs need at
+      least three points.
+    - advance width and left side bearing, from the hmtx table.
+
+    The values are stored in arrays, one per field. Composite glyphs reuse
+    the values computed for their components, where possible. Variable
+    fonts are measured at their default location.
+
+    Glyphs which cannot be drawn are listed in `broken_glyphs` (see also
+    `is_broken()`); asking for their outline facts raises a ValueError,
+    rather than passing them off as empty glyphs."""
+
+    def __init__(self, ttFont):
+        self.glyph_order = ttFont.getGlyphOrder()
+        self._gids = ttFont.getReverseGlyphMap()
+        count = len(self.glyph_order)
+        self._bounds = array("d", [NO_BOUNDS]) * (4 * count)
+        self._area = array("d", [0.0]) * count
+        self._contours = array("l", [0]) * count
+        self._points = array("l", [0]) * count
+        self._ink = array("b", [0]) * count
+        self._advance = array("l", [0]) * count
+        self._lsb = array("l", [0]) * count
+        # Glyphs which could not be drawn
+        self.broken_glyphs = []
+        self._broken = set()
+
+        if "hmtx" in ttFont:
+            metrics = ttFont["hmtx"].metrics
+            for gid, name in enumerate(self.glyph_order):
+                if name in metrics:
+                    self._advance[gid], self._lsb[gid] = metrics[name]
+
+        if "glyf" in ttFont:
+            self._measure_glyf(ttFont)
+        elif "CFF " in ttFont or "CFF2" in ttFont:
+            self._measure_cff(ttFont)
+
+    def _mark_broken(self, gid, name):
+        self.broken_glyphs.append(name)
+        self._broken.add(gid)
+
+    def _store(self, gid, bounds, area, contours, points, ink):
+        if bounds is not None:
+            self._bounds[4 * gid : 4 * gid + 4] = array("d", bounds)
+        self._area[gid] = area
+        self._contours[gid] = contours
+        self._points[gid] = points
+        self._ink[gid] = ink
+
+    def _measure_cff(self, ttFont):
+        glyphset = drawable_glyph_set(ttFont)
+        for gid, name in enumerate(self.glyph_order):
+            bounds_pen, area_pen, counting_pen = (
+                BoundsPen(glyphset),
+                AreaPen(glyphset),
+                _CountingPen(glyphset),
+            )
+            try:
+                glyphset[name].draw(TeePen(bounds_pen, area_pen, counting_pen))
+            except Exception:
+                self._mark_broken(gid, name)
+                continue
+            self._store(
+                gid,
+                bounds_pen.bounds,
+                area_pen.value,
+                counting_pen.contours,
+                counting_pen.points,
+                bounds_pen.bounds is not None,
+            )
+
+    def _measure_glyf(self, ttFont):
+        glyphset = drawable_glyph_set(ttFont)
+        glyf = ttFont["glyf"]
+        done = set()
+        # Bounds of the outlines as stored in glyf. Glyph sets shift a glyph
+        # drawn on its own (but not as a component) by lsb - xMin, so that
+        # its outline starts at its left side bearing; the stored bounds
+        # include that shift.
+        raw_bounds = {}
+
+        def measure(gid, name, pending):
+            if gid in done:
+                return
+            glyph = glyf[name]
+            if not glyph.isComposite():
+                if glyph.numberOfContours <= 0:
+                    self._store(gid, None, 0.0, 0, 0, False)
+                else:
+                    bounds_pen, area_pen = BoundsPen(None), AreaPen(None)
+                    glyph.draw(TeePen(bounds_pen, area_pen), glyf)
+                    points = len(glyph.getCoordinates(glyf)[0])
+                    bounds = raw_bounds[gid] = bounds_pen.bounds
+                    if bounds is not None:
+                        offset = self._lsb[gid] - glyph.xMin
+                        bounds = (
+                            bounds[0] + offset,
+                            bounds[1],
+                            bounds[2] + offset,
+                            bounds[3],
+                        )
+                    self._store(
+                        gid,
+                        bounds,
+                        area_pen.value,
+                        glyph.numberOfContours,
+                        points,
+                        points > 2,
+                    )
+                done.add(gid)
+                return
+
+            # A composite glyph adds up the values of its components,
+            # which are measured first.
+            pending = pending | {gid}
+            bounds, area, contours, points, ink = None, 0.0, 0, 0, False
+            only_scaled = True
+            for component in glyph.components:
+                component_gid = self._gids.get(component.glyphName)
+                if component_gid is None or component_gid in pending:
+                    # Missing component, or a (broken) cyclic reference
+                    continue
+                measure(component_gid, component.glyphName, pending)
+                ink = ink or bool(self._ink[component_gid])
+                if component.glyphName != ".ttfautohint":
+                    contours += self._contours[component_gid]
+                    points += self._points[component_gid]
+                if not hasattr(component, "x"):
+                    # Positioned by matching points; only drawing can tell.
+                    only_scaled = False
+                    continue
+                _, (xx, xy, yx, yy, dx, dy) = component.getComponentInfo()
+                if xy or yx:
+                    only_scaled = False
+                    continue
+                area += xx * yy * self._area[component_gid]
+                component_bounds = raw_bounds.get(component_gid)
+                if component_bounds is None:
+                    continue
+                xMin, yMin, xMax, yMax = component_bounds
+                xs = sorted((xx * xMin + dx, xx * xMax + dx))
+                ys = sorted((yy * yMin + dy, yy * yMax + dy))
+                if bounds is None:
+                    bounds = (xs[0], ys[0], xs[1], ys[1])
+                else:
+                    bounds = (
+                        min(bounds[0], xs[0]),
+                        min(bounds[1], ys[0]),
+                        max(bounds[2], xs[1]),
+                        max(bounds[3], ys[1]),
+                    )
+
+            if not only_scaled:
+                # Rotated, skewed or point-matched components:
+                # draw the decomposed outline instead.
+                bounds_pen, area_pen = BoundsPen(glyphset), AreaPen(glyphset)
+                with glyphset.pushDepth():
+                    glyphset[name].draw(TeePen(bounds_pen, area_pen))
+                bounds, area = bounds_pen.bounds, area_pen.value
+            raw_bounds[gid] = bounds
+            if bounds is not None and self._lsb[gid] != getattr(
+                glyph, "xMin", self._lsb[gid]
+            ):
+                # Let the glyph set place the composite as it draws it.
+                bounds_pen = BoundsPen(glyphset)
+                glyphset[name].draw(bounds_pen)
+                bounds = bounds_pen.bounds
+            self._store(gid, bounds, area, contours, points, ink)
+            done.add(gid)
+
+        for gid, name in enumerate(self.glyph_order):
+            try:
+                measure(gid, name, frozenset())
+            except Exception:
+                self._mark_broken(gid, name)
+                done.add(gid)
+
+    def __len__(self):
+        return len(self.glyph_order)
+
+    def __contains__(self, glyph_name):
+        return glyph_name in self._gids
+
+    def gid(self, glyph):
+        """The glyph ID of a glyph, given either its name or its ID."""
+        if isinstance(glyph, int):
+            return glyph
+        return self._gids[glyph]
+
+    def is_broken(self, glyph):
+        """Whether a glyph (given either its name or its ID) is one of the
+        `broken_glyphs`."""
+        return self.gid(glyph) in self._broken
+
+    def _measured(self, glyph):
+        gid = self.gid(glyph)
+        if gid in self._broken:
+            raise ValueError(f"Glyph {self.glyph_order[gid]!r} could not be drawn")
+        return gid
+
+    def bounds(self, glyph):
+        gid = self._measured(glyph)
+        bounds = tuple(self._bounds[4 * gid : 4 * gid + 4])
+        if math.isnan(bounds[0]):
+            return None
+        return bounds
+
+    def area(self, glyph):
+        return self._area[self._measured(glyph)]
+
+    def contour_count(self, glyph):
+        return self._contours[self._measured(glyph)]
+
+    def point_count(self, glyph):
+        return self._points[self._measured(glyph)]
+
+    def has_ink(self, glyph):
+        return bool(self._ink[self._measured(glyph)])
+
+    def advance_width(self, glyph):
+        return self._advance[self.gid(glyph)]
+
+    def lsb(self, glyph):
+        return self._lsb[self.gid(glyph)]
@@ -0,0 +1,33 @@
+"""
+Sets of Korean Hangul syllables, by frequency of use.
+
+These are loaded (through fontbakery.constants) only by the checks which
+need them. The codepoints are stored in fontbakery/data/codepoint_sets.bin.
+"""
+from fontbakery.codepoints import CodepointSet, codepoint_set
+
+# Set of 2,350 modern Korean hangul syllables from KS X 1001 encoding.
+# The file linked below provides the mapping between KS X 1001 and Unicode.
+# http://unicode.org/Public/MAPPINGS/OBSOLETE/EASTASIA/KSC/KSX1001.TXT
+MODERN_HANGUL_SYLLABLES_CODEPOINTS = codepoint_set("MODERN_HANGUL_SYLLABLES")
+
+# Set based on the character set of the Hahmlet Fonts Project (Version 1.002)
+# https://github.com/hyper-type/hahmlet#hahmlet-fonts-project
+OTHER_COMMON_HANGUL_SYLLABLES_CODEPOINTS = codepoint_set(
+    "OTHER_COMMON_HANGUL_SYLLABLES"
+)
+
+# "Hangul Syllables" Unicode v2.0 block (Full range: U+AC00..U+D7AF)
+# https://en.wikipedia.org/wiki/Hangul_Syllables
+ALL_HANGUL_SYLLABLES_CODEPOINTS = CodepointSet.from_ranges([(0xAC00, 0xD7A3)])
+
+LESS_COMMON_HANGUL_SYLLABLES_CODEPOINTS = (
+    ALL_HANGUL_SYLLABLES_CODEPOINTS
+    - MODERN_HANGUL_SYLLABLES_CODEPOINTS
+    - OTHER_COMMON_HANGUL_SYLLABLES_CODEPOINTS
+)
+
+assert len(ALL_HANGUL_SYLLABLES_CODEPOINTS) == 11172
+assert len(MODERN_HANGUL_SYLLABLES_CODEPOINTS) == 2350
+assert len(OTHER_COMMON_HANGUL_SYLLABLES_CODEPOINTS) == 438  # 438 + 2350 = 2788
+assert len(LESS_COMMON_HANGUL_SYLLABLES_CODEPOINTS) == 8384
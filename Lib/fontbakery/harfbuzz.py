@@ -0,0 +1,160 @@
+"""
+FontBakery harfbuzz shares the HarfBuzz objects of a font file between the
+checks which shape text with it, so that the file is read, and its face
+parsed, only once per run, and shapes batches of short strings with little
+overhead per string.
+"""
+from array import array
+import threading
+
+# Below this many strings per worker process, starting the processes costs
+# more than shaping the strings in this one.
+MIN_STRINGS_PER_WORKER = 5000
+
+
+class HarfBuzz:
+    """The HarfBuzz blob and face of a font file, created when first used
+    (by whichever thread gets there first) and shared from then on.
+
+    HarfBuzz fonts hold state which checks change (variation coordinates,
+    font functions), so each caller gets a font of its own on the shared
+    face. Those are cheap to create: the tables, and the shaping plans,
+    belong to the face."""
+
+    def __init__(self, filename, face=None):
+        self.filename = str(filename)
+        self._lock = threading.Lock()
+        self._blob = None
+        # The face may be given, when it has already been parsed
+        self._face = face
+
+    @property
+    def blob(self):
+        import uharfbuzz as hb
+
+        with self._lock:
+            if self._blob is None:
+                self._blob = hb.Blob.from_file_path(self.filename)
+            return self._blob
+
+    @property
+    def face(self):
+        import uharfbuzz as hb
+
+        blob = self.blob
+        with self._lock:
+            if self._face is None:
+                self._face = hb.Face(blob)
+            return self._face
+
+    def font(self):
+        """A new HarfBuzz font on the shared face."""
+        import uharfbuzz as hb
+
+        return hb.Font(self.face)
+
+    def shaper(self):
+        """A new Vharfbuzz shaper, on a new font of the shared face."""
+        from vharfbuzz import Vharfbuzz
+
+        shaper = Vharfbuzz(self.filename)
+        # Vharfbuzz would otherwise load the file again on first use.
+        shaper._hbfont = self.font()  # pylint: disable=protected-access
+        return shaper
+
+    def batch_shaper(self, parameters=None):
+        """A BatchShaper on a new font of the shared face."""
+        return BatchShaper(self.font(), parameters)
+
+    def shape_many(self, texts, parameters=None, workers=1):
+        """The glyph IDs of each of the given strings, shaped with the same
+        parameters. Large batches are split between up to `workers`
+        processes."""
+        texts = list(texts)
+        workers = min(workers, len(texts) // MIN_STRINGS_PER_WORKER)
+        if workers <= 1:
+            return list(self.batch_shaper(parameters).map(texts))
+
+        import concurrent.futures
+        import multiprocessing
+
+        chunk_size = -(-len(texts) // workers)
+        chunks = [
+            texts[start : start + chunk_size]
+            for start in range(0, len(texts), chunk_size)
+        ]
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_shaping_worker,
+            initargs=(self.filename, parameters),
+        ) as executor:
+            return [
+                glyph_ids
+                for chunk_result in executor.map(_shape_in_worker, chunks)
+                for glyph_ids in chunk_result
+            ]
+
+
+class BatchShaper:
+    """Shapes one string after the other with the same font, parameters and
+    HarfBuzz buffer, returning only the glyph IDs of the result, so that
+    shaping many short strings costs little more than HarfBuzz's own work.
+
+    The parameters are those of Vharfbuzz.shape(): "script", "direction" and
+    "language" (guessed from each string when not given), "features",
+    "variations" and "shaper"."""
+
+    def __init__(self, hbfont, parameters=None):
+        parameters = parameters or {}
+        self.font = hbfont
+        self.script = parameters.get("script")
+        self.direction = parameters.get("direction")
+        self.language = parameters.get("language")
+        self.features = parameters.get("features")
+        self.shapers = [parameters["shaper"]] if parameters.get("shaper") else None
+        if parameters.get("variations"):
+            hbfont.set_variations(parameters["variations"])
+        self._buffer = None
+
+    def shape(self, text):
+        """Shape a string. The buffer returned is reused by the next call."""
+        import uharfbuzz as hb
+
+        if self._buffer is None:
+            self._buffer = hb.Buffer()
+        buf = self._buffer
+        buf.clear_contents()
+        buf.add_str(text)
+        buf.guess_segment_properties()
+        if self.script:
+            buf.script = self.script
+        if self.direction:
+            buf.direction = self.direction
+        if self.language:
+            buf.language = self.language
+        hb.shape(self.font, buf, self.features, shapers=self.shapers)
+        return buf
+
+    def glyph_ids(self, text):
+        """The glyph IDs which a string is shaped into, as an array."""
+        return array("I", [info.codepoint for info in self.shape(text).glyph_infos])
+
+    def map(self, texts):
+        """The glyph_ids() of each string of an iterable, computed as the
+        strings are consumed (so the iterable may depend on earlier
+        results)."""
+        for text in texts:
+            yield self.glyph_ids(text)
+
+
+_worker_shaper = None
+
+
+def _init_shaping_worker(filename, parameters):
+    global _worker_shaper  # pylint: disable=global-statement
+    _worker_shaper = HarfBuzz(filename).batch_shaper(parameters)
+
+
+def _shape_in_worker(texts):
+    return list(_worker_shaper.map(texts))
@@ -0,0 +1,160 @@
+"""
+FontBakery http_client makes the HTTP requests of the checks through a
+single connection-pooled session, shared by the whole check run, and can
+keep the responses on disk: to avoid fetching them again while they are
+fresh, and to replay them later without any network access.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. Please keep it so.
+"""
+import hashlib
+import json
+import os
+import re
+import time
+
+from fontbakery.result_cache import ResultCache
+
+# How long a response without caching headers is considered fresh.
+DEFAULT_TTL = 24 * 60 * 60  # seconds
+
+# Requests which may be answered from the cache outside of replay mode.
+CACHEABLE_METHODS = ("GET", "HEAD")
+
+
+class HTTPClient:
+    """Makes HTTP requests, as `requests` would.
+
+    - All requests share a session, so connections to a host are kept
+      alive and reused, by up to `pool_size` threads at once.
+    - With a `cache_dir`, every response is recorded there, keyed by
+      method, URL, query and body. A GET or HEAD request is answered from
+      the cache while its response is fresh (according to its
+      Cache-Control header, or for DEFAULT_TTL seconds), and revalidated
+      with its ETag or Last-Modified date once it is stale. Server errors
+      are recorded, but never considered fresh.
+    - In `replay` mode, requests are only ever answered from the cache,
+      whatever their age; a request which was not recorded fails with a
+      ConnectionError, as if the network was down."""
+
+    def __init__(self, cache_dir=None, replay=False, timeout=None, pool_size=None):
+        import requests
+
+        if replay and not cache_dir:
+            raise ValueError("Replaying responses requires a cache directory")
+        self.timeout = timeout
+        self.replay = replay
+        self.store = ResultCache(cache_dir) if cache_dir else None
+        pool_size = pool_size or max(10, os.cpu_count() or 1)
+        self.session = requests.Session()
+        for prefix in ("http://", "https://"):
+            self.session.mount(
+                prefix,
+                requests.adapters.HTTPAdapter(
+                    pool_connections=pool_size, pool_maxsize=pool_size
+                ),
+            )
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method, url, params=None, data=None, headers=None, **kwargs):
+        """Make a request (see requests.request), returning a
+        requests.Response."""
+        import requests
+
+        kwargs.setdefault("timeout", self.timeout)
+        if method == "HEAD":
+            # As requests.head() does
+            kwargs.setdefault("allow_redirects", False)
+        if self.store is None:
+            return self.session.request(
+                method, url, params=params, data=data, headers=headers, **kwargs
+            )
+
+        key = self.key(method, url, params, data)
+        entry = self.store.get(key)
+        if not isinstance(entry, dict):
+            entry = None
+        if self.replay:
+            if entry is None:
+                raise requests.exceptions.ConnectionError(
+                    f"No recorded response for {method} {url}"
+                )
+            return _response(entry)
+        if entry is not None and method in CACHEABLE_METHODS and _is_fresh(entry):
+            return _response(entry)
+
+        headers = dict(headers or {})
+        if entry is not None and method in CACHEABLE_METHODS:
+            if entry["headers"].get("etag"):
+                headers["If-None-Match"] = entry["headers"]["etag"]
+            if entry["headers"].get("last-modified"):
+                headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+        response = self.session.request(
+            method, url, params=params, data=data, headers=headers, **kwargs
+        )
+        if response.status_code == 304 and entry is not None:
+            entry["headers"].update(_lowercase(response.headers))
+            entry["time"] = time.time()
+            self.store.put(key, entry)
+            return _response(entry)
+        self.store.put(
+            key,
+            {
+                "status_code": response.status_code,
+                "url": response.url,
+                "headers": _lowercase(response.headers),
+                "content": response.content,
+                "time": time.time(),
+            },
+        )
+        return response
+
+    def key(self, method, url, params=None, data=None):
+        """The key of a request in the cache."""
+        if isinstance(params, dict):
+            params = sorted(params.items())
+        if isinstance(data, dict):
+            data = sorted(data.items())
+        elif isinstance(data, bytes):
+            data = data.decode("latin-1")
+        blob = json.dumps([method, url, params, data], default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _lowercase(headers):
+    return {name.lower(): value for name, value in headers.items()}
+
+
+def _is_fresh(entry):
+    if entry["status_code"] >= 500:
+        return False
+    cache_control = entry["headers"].get("cache-control", "")
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return False
+    max_age = re.search(r"max-age=(\d+)", cache_control)
+    ttl = int(max_age.group(1)) if max_age else DEFAULT_TTL
+    return time.time() - entry["time"] < ttl
+
+
+def _response(entry):
+    """A requests.Response made from a cache entry."""
+    import requests
+    from requests.structures import CaseInsensitiveDict
+    from requests.utils import get_encoding_from_headers
+
+    response = requests.Response()
+    response.status_code = entry["status_code"]
+    response.url = entry["url"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = entry["content"]  # pylint: disable=protected-access
+    return response
@@ -0,0 +1,199 @@
+"""
+FontBakery kerning_index answers questions about the pair kerning of a
+font (the GPOS pair adjustment lookups) straight from its subtables, keeping
+class-based kerning as classes instead of expanding it into every pair of
+glyphs of the classes.
+"""
+from collections import defaultdict
+
+from fontbakery.lookups import iterate_lookups
+
+
+def _is_zero(value):
+    return value is None or not any(vars(value).values())
+
+
+def _has_variable_device(value):
+    return value is not None and any(
+        getattr(device, "DeltaFormat", 0) == 0x8000
+        for name, device in vars(value).items()
+        if name.endswith("Device")
+    )
+
+
+def _advance(value):
+    if value is None:
+        return 0
+    return getattr(value, "XAdvance", 0) or 0
+
+
+class _PairSubtable:
+    """A format 1 (glyph pairs) or format 2 (class pairs) PairPos subtable."""
+
+    def __init__(self, subtable, glyph_order):
+        self.format = subtable.Format
+        self.coverage = subtable.Coverage.glyphs
+        if self.format == 1:
+            self.pairs = {
+                left: {
+                    record.SecondGlyph: (record.Value1, record.Value2)
+                    for record in pair_set.PairValueRecord
+                }
+                for left, pair_set in zip(self.coverage, subtable.PairSet)
+            }
+        else:
+            self.covered = set(self.coverage)
+            self.class1 = subtable.ClassDef1.classDefs
+            self.class2 = subtable.ClassDef2.classDefs
+            self.records = subtable.Class1Record
+            self.glyph_order = glyph_order
+
+    def get(self, left, right):
+        """The (value1, value2) of a pair, or None if this subtable does not
+        apply to it (and the next subtable of the lookup is tried)."""
+        if self.format == 1:
+            return self.pairs.get(left, {}).get(right)
+        if left not in self.covered:
+            return None
+        class1, class2 = self.class1.get(left, 0), self.class2.get(right, 0)
+        if class1 >= len(self.records):
+            return None
+        class2_records = self.records[class1].Class2Record
+        if class2 >= len(class2_records):
+            return None
+        record = class2_records[class2]
+        return record.Value1, record.Value2
+
+    def has(self, left, right):
+        """Whether this subtable has a rule for a pair: a record of the pair,
+        even a zero one (format 1), or a non-zero record of its classes
+        (format 2, whose records cover every pair of classes)."""
+        if self.format == 1:
+            return right in self.pairs.get(left, {})
+        value = self.get(left, right)
+        return value is not None and not (_is_zero(value[0]) and _is_zero(value[1]))
+
+    def _members(self, class_defs, glyphs):
+        members = defaultdict(list)
+        for glyph in glyphs:
+            members[class_defs.get(glyph, 0)].append(glyph)
+        return members
+
+    def class_pairs(self):
+        """(left glyphs, right glyphs, value1, value2) for each record."""
+        if self.format == 1:
+            for left, seconds in self.pairs.items():
+                for right, (value1, value2) in seconds.items():
+                    yield [left], [right], value1, value2
+            return
+        lefts = self._members(self.class1, self.coverage)
+        rights = self._members(self.class2, self.glyph_order)
+        for class1, class1_record in enumerate(self.records):
+            if class1 not in lefts:
+                continue
+            for class2, record in enumerate(class1_record.Class2Record):
+                if class2 in rights:
+                    yield lefts[class1], rights[class2], record.Value1, record.Value2
+
+
+class KerningIndex:
+    """The pair adjustment lookups of a font's GPOS table, with the
+    features which use each of them.
+
+    - `kern(left, right)` is the kerning of a pair of glyphs, as a shaper
+      applying the pair adjustment lookups of a feature would compute it.
+    - `has_pair(left, right)` tells whether there is a rule for the pair,
+      even an explicit zero one.
+    - `class_pairs()` and `pairs()` list the kerning rules of the subtables,
+      by class or by glyph pair (the latter expanding the classes lazily).
+    - `variable_class_pairs()` lists the rules whose values vary
+      through an item variation store.
+
+    `complete` tells whether all the lookups of the "kern" feature are pair
+    adjustments (rather than, e.g., contextual positioning), which is when
+    `kern()` agrees with shaping the pair."""
+
+    def __init__(self, ttFont):
+        self.lookups = []  # (features, [_PairSubtable])
+        self.complete = "kern" not in ttFont or "GPOS" in ttFont
+        if "GPOS" not in ttFont or not ttFont["GPOS"].table.LookupList:
+            return
+
+        gpos = ttFont["GPOS"].table
+        features = defaultdict(set)
+        if gpos.FeatureList:
+            for record in gpos.FeatureList.FeatureRecord:
+                for index in record.Feature.LookupListIndex:
+                    features[index].add(record.FeatureTag)
+        glyph_order = ttFont.getGlyphOrder()
+        for index, lookup in enumerate(iterate_lookups(ttFont, "GPOS")):
+            if lookup.LookupType != 2:
+                if "kern" in features[index]:
+                    self.complete = False
+                continue
+            self.lookups.append(
+                (
+                    features[index],
+                    [
+                        _PairSubtable(subtable, glyph_order)
+                        for subtable in lookup.SubTable
+                    ],
+                )
+            )
+
+    def _subtables(self, feature):
+        for features, subtables in self.lookups:
+            if feature is None or feature in features:
+                yield subtables
+
+    def values(self, left, right, feature="kern"):
+        """The (value1, value2) of each lookup applying to a pair of glyphs.
+        With feature=None, all the pair adjustment lookups are considered."""
+        found = []
+        for subtables in self._subtables(feature):
+            for subtable in subtables:
+                value = subtable.get(left, right)
+                if value is not None:
+                    found.append(value)
+                    break
+        return found
+
+    def has_pair(self, left, right, feature="kern"):
+        """Whether the font has kerning info for a pair of glyphs, including
+        an explicit zero pair (which `kern()` does not tell from none)."""
+        return any(
+            subtable.has(left, right)
+            for subtables in self._subtables(feature)
+            for subtable in subtables
+        )
+
+    def kern(self, left, right, feature="kern"):
+        """The change to the advance of a pair of glyphs, in font units,
+        at the default location of a variable font."""
+        return sum(
+            _advance(value1) + _advance(value2)
+            for value1, value2 in self.values(left, right, feature)
+        )
+
+    def class_pairs(self, feature=None, nonzero=True):
+        """(left glyphs, right glyphs, value1, value2) for each (by default
+        non-zero) rule of the subtables, in lookup order. A pair covered by
+        several subtables is listed for each of them."""
+        for subtables in self._subtables(feature):
+            for subtable in subtables:
+                for lefts, rights, value1, value2 in subtable.class_pairs():
+                    if not nonzero or not (_is_zero(value1) and _is_zero(value2)):
+                        yield lefts, rights, value1, value2
+
+    def pairs(self, feature=None, nonzero=True):
+        """(left, right, value1, value2) for each glyph pair of `class_pairs`."""
+        for lefts, rights, value1, value2 in self.class_pairs(feature, nonzero):
+            for left in lefts:
+                for right in rights:
+                    yield left, right, value1, value2
+
+    def variable_class_pairs(self, feature=None):
+        """The `class_pairs` with a variation device in their values."""
+        for lefts, rights, value1, value2 in self.class_pairs(feature):
+            if _has_variable_device(value1) or _has_variable_device(value2):
+                yield lefts, rights, value1, value2
@@ -0,0 +1,110 @@
+"""
+FontBakery link_checker checks whether URLs can be fetched, many at once,
+keeping the status of each URL for the whole check run, so that checks on
+each font of a family need not check the links they share again.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. Please keep it so.
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import threading
+from typing import Optional
+from urllib.parse import urlsplit
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_PER_HOST = 4
+DEFAULT_TIMEOUT = 10  # seconds
+
+# Status 429: "Too Many Requests" is acceptable because it means the website
+# is probably ok and we're just perhaps being too agressive in probing it!
+GOOD_STATUS_CODES = (200, 429)
+
+
+@dataclass
+class LinkStatus:
+    """The outcome of requesting a URL: its HTTP status code, or whether
+    the request timed out or otherwise failed."""
+
+    status_code: Optional[int] = None
+    timed_out: bool = False
+    error: Optional[str] = None
+
+    @property
+    def ok(self):
+        return self.status_code in GOOD_STATUS_CODES
+
+
+class LinkChecker:
+    """Checks URLs with HEAD requests (following redirects) through an
+    HTTPClient.
+
+    - URLs are checked concurrently, by up to `max_workers` threads, with
+      at most `per_host` requests to the same host at a time.
+    - The status of each URL is kept for the lifetime of the checker, and
+      a URL being checked is not requested again by concurrent callers."""
+
+    def __init__(
+        self,
+        http,
+        max_workers=DEFAULT_MAX_WORKERS,
+        per_host=DEFAULT_PER_HOST,
+        timeout=DEFAULT_TIMEOUT,
+    ):
+        self.http = http
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._statuses = {}  # url -> Future of a LinkStatus
+        self._hosts = {}  # host -> BoundedSemaphore
+
+    def check(self, urls):
+        """The LinkStatus of each of the given URLs."""
+        futures, pending = {}, []
+        with self._lock:
+            for url in urls:
+                if url not in self._statuses:
+                    self._statuses[url] = Future()
+                    pending.append(url)
+                futures[url] = self._statuses[url]
+
+        if len(pending) == 1:
+            self._resolve(pending[0])
+        elif pending:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(pending))
+            ) as executor:
+                for _ in executor.map(self._resolve, pending):
+                    pass
+        return {url: future.result() for url, future in futures.items()}
+
+    def _host_slots(self, url):
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.BoundedSemaphore(self.per_host)
+            return self._hosts[host]
+
+    def _resolve(self, url):
+        import requests
+
+        status = None
+        try:
+            with self._host_slots(url):
+                response = self.http.head(
+                    url, allow_redirects=True, timeout=self.timeout
+                )
+            status = LinkStatus(status_code=response.status_code)
+        except requests.exceptions.Timeout as error:
+            status = LinkStatus(timed_out=True, error=str(error))
+        except Exception as error:  # pylint: disable=broad-except
+            # Including malformed URLs, which are broken links too.
+            status = LinkStatus(error=str(error) or type(error).__name__)
+        finally:
+            if status is None:
+                # Interrupted (e.g. KeyboardInterrupt); do not leave other
+                # callers waiting for this URL forever.
+                status = LinkStatus(error="Not checked")
+            self._statuses[url].set_result(status)
@@ -0,0 +1,81 @@
+"""
+FontBakery lookups walks the lookups of a font's GSUB and GPOS tables
+without modifying the font, for the checks and for the indexes built from
+those tables (such as kerning_index), and tells which glyphs the default
+features may substitute.
+"""
+
+# Features which shapers only apply when asked to
+OPTIONAL_FEATURES = {
+    "aalt", "afrc", "c2pc", "c2sc", "case", "cpsp", "dlig", "dnom", "expt",
+    "falt", "frac", "fwid", "halt", "hist", "hkna", "hlig", "hngl", "hojo",
+    "hwid", "ital", "jalt", "jp04", "jp78", "jp83", "jp90", "lnum", "mgrk",
+    "nalt", "nlck", "numr", "onum", "ordn", "ornm", "palt", "pcap", "pkna",
+    "pnum", "pwid", "qwid", "ruby", "salt", "sinf", "smcp", "smpl", "subs",
+    "sups", "swsh", "titl", "tnum", "trad", "twid", "unic", "vert", "vhal",
+    "vkna", "vpal", "vrt2", "zero",
+}  # fmt: skip
+
+
+def substituted_glyphs(ttFont):
+    """The glyphs at which a GSUB lookup of a default feature may start
+    a substitution, or None if that cannot be told for some subtable."""
+    if "GSUB" not in ttFont:
+        return set()
+    default_lookups = set()
+    feature_list = ttFont["GSUB"].table.FeatureList
+    for record in feature_list.FeatureRecord if feature_list else []:
+        tag = record.FeatureTag
+        if tag in OPTIONAL_FEATURES or tag[:2] in ("ss", "cv") and tag[2:].isdigit():
+            continue
+        default_lookups.update(record.Feature.LookupListIndex)
+
+    glyphs = set()
+    for index, lookup in enumerate(iterate_lookups(ttFont, "GSUB")):
+        if index not in default_lookups:
+            continue
+        for subtable in lookup.SubTable:
+            for attr in ("mapping", "alternates", "ligatures"):
+                if hasattr(subtable, attr):
+                    glyphs.update(getattr(subtable, attr))
+                    break
+            else:
+                coverage = getattr(subtable, "Coverage", None) or getattr(
+                    subtable, "InputCoverage", None
+                )
+                if isinstance(coverage, list):
+                    coverage = coverage[0] if coverage else None
+                if coverage is None:
+                    return None
+                glyphs.update(coverage.glyphs)
+    return glyphs
+
+
+class UnwrappedLookup:
+    """A read-only stand-in for an Extension lookup, which exposes the
+    lookup type and the subtables wrapped by its Extension subtables.
+    Any other attribute is looked up on the Extension lookup itself."""
+
+    def __init__(self, lookup):
+        self._lookup = lookup
+        self.SubTable = [xt.ExtSubTable for xt in lookup.SubTable]
+        self.SubTableCount = len(self.SubTable)
+        self.LookupType = self.SubTable[0].LookupType
+
+    def __getattr__(self, name):
+        return getattr(self._lookup, name)
+
+
+def iterate_lookups(ttFont, table):
+    """Yields the lookups of a font's GSUB/GPOS table in lookup list order,
+    with Extension lookups unwrapped. The font is not modified."""
+    if table not in ttFont or not ttFont[table].table.LookupList:
+        return
+
+    extension_type = 9 if table == "GPOS" else 7
+
+    for lookup in ttFont[table].table.LookupList.Lookup:
+        if lookup.LookupType == extension_type and lookup.SubTable:
+            yield UnwrappedLookup(lookup)
+        else:
+            yield lookup
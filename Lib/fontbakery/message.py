@@ -7,7 +7,7 @@ KEEP_ORIGINAL_MESSAGE = None
 class Message:
     """Status messages to be yielded by FontBakeryCheck"""
 
-    def __init__(self, code, message):
+    def __init__(self, code, message, artifacts=None):
         """
         code: (string|number) a check internal, unique code to describe a
               specific failure condition. A short string is preferred, it
@@ -19,20 +19,43 @@ class Message:
 
         message: (string) human readable message.
 
+        artifacts: (list) optional objects with a `render()` method returning
+              HTML (e.g. an SVG drawing), which is costly to produce or bulky
+              to store. The message refers to each of them with the
+              placeholder returned by `artifact_placeholder(index)`, which is
+              replaced by its rendering only by the reporters which display
+              it (HTML), and left out by the others.
+
         In the future, this class could be extended to hold even more
         information if useful, e.g. a hint how to fix a specific condition.
         """
         self.code = code
         self.message = message
+        self.artifacts = artifacts or []
 
     def __repr__(self):
         if self.code:
-            return f"{self.message} [code: {self.code}]"
+            return f"{self.text()} [code: {self.code}]"
         else:
-            return f"{self.message}"
+            return f"{self.text()}"
+
+    def text(self, render_artifacts=False):
+        """The message, with its artifacts rendered, or left out."""
+        message = self.message
+        for index, artifact in enumerate(self.artifacts):
+            placeholder = artifact_placeholder(index)
+            if placeholder in message:
+                rendering = artifact.render() if render_artifacts else ""
+                message = message.replace(placeholder, rendering)
+        return message
 
-    def getData(self):
+    def getData(self, render_artifacts=False):
         """return a dictionary with data suitable for serialization,
         i.e. only stuff that is allowed in JSON.
         """
-        return {"code": self.code, "message": self.message}
+        return {"code": self.code, "message": self.text(render_artifacts)}
+
+
+def artifact_placeholder(index):
+    """Where a message shows the artifact of the given index."""
+    return f"[[artifact:{index}]]"
@@ -26,12 +26,16 @@ class FontbakeryReporter:
     collect_results_by: Optional[str] = None
     succinct: bool = False
     quiet: bool = False
+    # Whether to hold on to every CheckResult received. Reporters which
+    # only need the counters can turn it off to run in constant memory.
+    keep_results: bool = True
 
     def __post_init__(self):
         self._started = None
         self._ended = None
         self._order = None
         self._results = []  # Check results in order of appearance
+        self._received = 0  # Number of check results received
         self._indexes = {}
         self._tick = 0
         self._counter = Counter()
@@ -69,7 +73,7 @@ class FontbakeryReporter:
     def start(self, order):
         self._order = order
         length = len(self._order)
-        self._counter["(not finished)"] = length - len(self._results)
+        self._counter["(not finished)"] = length - self._received
         keys = [identity.key for identity in self._order]
         self._indexes = dict(zip(keys, range(length)))
         self._started = True
@@ -107,7 +111,9 @@ class FontbakeryReporter:
         ):
             self._worst_check_status = checkresult.summary_status
 
-        self._results.append(checkresult)
+        self._received += 1
+        if self.keep_results:
+            self._results.append(checkresult)
         self._counter[checkresult.summary_status.name] += 1
         self._counter["(not finished)"] -= 1
         self._sectioncounter[checkresult.identity.section.name][
@@ -99,4 +99,8 @@ class BadgeReporter(SerializeReporter):
             with open(filename, "w", encoding="utf-8") as fh:
                 json.dump(data, fh, sort_keys=True, indent=4)
 
-        print(f'A set of badges in JSON format has been saved to "{self.output_file}/"')
+        if not self.quiet:
+            print(
+                "A set of badges in JSON format has been saved"
+                f' to "{self.output_file}/"'
+            )
@@ -9,6 +9,8 @@ LOGLEVELS = ["ERROR", "FATAL", "FAIL", "WARN", "SKIP", "INFO", "PASS", "DEBUG"]
 class GHMarkdownReporter(HTMLReporter):
     format_name = "GitHub Markdown"
     format = "markdown"
+    # GitHub does not display inline SVG
+    render_artifacts = False
 
     @staticmethod
     def result_is_all_same(cluster):
@@ -47,6 +47,7 @@ class HTMLReporter(SerializeReporter):
 
     format_name = "HTML"
     format = "html"
+    render_artifacts = True
 
     def template_engine(self) -> Template:
         loaders = [PackageLoader("fontbakery.reporters", f"templates/{self.format}")]
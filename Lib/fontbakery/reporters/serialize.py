@@ -16,6 +16,8 @@ from fontbakery.reporters import FontbakeryReporter
 
 class SerializeReporter(FontbakeryReporter):
     format = "unknown"
+    # Whether the report displays the artifacts of the messages (drawings)
+    render_artifacts = False
 
     def __post_init__(self):
         super().__post_init__()
@@ -39,7 +41,9 @@ class SerializeReporter(FontbakeryReporter):
                 "checks": [],
                 "key": [section.name, None, None],
             }
-        self._sections[section.name]["checks"].append(checkresult.getData(self.runner))
+        self._sections[section.name]["checks"].append(
+            checkresult.getData(self.runner, self.render_artifacts)
+        )
 
     def end(self):
         super().end()
@@ -73,3 +77,83 @@ class JSONReporter(SerializeReporter):
         import json
 
         return json.dumps(doc, sort_keys=True, indent=4)
+
+
+class NDJSONReporter(FontbakeryReporter):
+    """Writes each check result to the output file as soon as it is
+    received, as a line of JSON (newline-delimited JSON), followed by
+    a last line with the summary of the run.
+
+    Unlike the JSONReporter it keeps nothing but the counters in memory,
+    so its memory use does not grow with the number of checked files.
+    Use `read_ndjson` to rebuild the JSONReporter's document from the file.
+    """
+
+    format = "NDJSON"
+
+    def __post_init__(self):
+        self.keep_results = False
+        super().__post_init__()
+        self._file = None
+
+    def _open(self):
+        return open(self.output_file, "w", encoding="utf-8")
+
+    def start(self, order):
+        super().start(order)
+        self._file = self._open()
+
+    def _write_line(self, data):
+        import json
+
+        self._file.write(json.dumps(data, sort_keys=True) + "\n")
+        self._file.flush()
+
+    def receive_result(self, checkresult: CheckResult):
+        super().receive_result(checkresult)
+        data = checkresult.getData(self.runner)
+        data["section"] = checkresult.identity.section.name
+        self._write_line(data)
+
+    def end(self):
+        super().end()
+        self._write_line(
+            {
+                "summary": {
+                    "result": self._counter,
+                    "sections": self._sectioncounter,
+                }
+            }
+        )
+        self._file.close()
+
+    def write(self):
+        if not self.quiet:
+            print(
+                f'A report in {self.format} format has been saved to "{self.output_file}"'
+            )
+
+
+def read_ndjson(lines):
+    """Rebuild the document written by the JSONReporter from the lines
+    (e.g. an open file) written by the NDJSONReporter."""
+    import json
+
+    doc = {"result": {}, "sections": []}
+    sections = {}
+    for line in lines:
+        if not line.strip():
+            continue
+        data = json.loads(line)
+        if "summary" in data:
+            doc["result"] = data["summary"]["result"]
+            for name, counter in data["summary"]["sections"].items():
+                if name in sections:
+                    sections[name]["result"] = counter
+            continue
+        name = data.pop("section")
+        if name not in sections:
+            sections[name] = {"checks": [], "key": [name, None, None]}
+            doc["sections"].append(sections[name])
+        sections[name]["checks"].append(data)
+    return doc
@@ -14,6 +14,7 @@ from rich.live import Live
 from rich.markdown import Markdown
 from rich.markup import escape
 import rich
+import rich.table
 
 from fontbakery.constants import LIGHT_THEME, CUPCAKE, MEANING_MESSAGE
 from fontbakery.message import Message
@@ -90,6 +91,7 @@ class ProgressBar:
 class TerminalReporter(FontbakeryReporter):
     print_progress: bool = True
     theme: Optional[dict] = None
+    show_timings: bool = False
 
     def __post_init__(self):
         super().__post_init__()
@@ -123,9 +125,9 @@ class TerminalReporter(FontbakeryReporter):
     def _set_progress_event(self, event):
         index = self._get_index(event.identity)
         self.progressbar[index] = event.summary_status
-        total = max(len(self._order), len(self._results))
+        total = max(len(self._order), self._received)
         self.progressbar.percent = (
-            int(round(len(self._results) / total * 100)) if total else 0
+            int(round(self._received / total * 100)) if total else 0
         )
         self.progressbar._tick = self._tick
         self._log_context.update(self.progressbar, refresh=True)
@@ -182,6 +184,10 @@ class TerminalReporter(FontbakeryReporter):
             self._console.print(self._render_results_counter())
             return
 
+        if self.show_timings and self.runner and self.runner.timings:
+            self._console.print(self._render_timings(self.runner.timings))
+            self._console.print("")
+
         self._console.print("Total:")
         self._console.print(self._render_results_counter())
         self._console.print("")
@@ -353,6 +359,29 @@ class TerminalReporter(FontbakeryReporter):
         if status not in statuses:
             self._console.print("-" * 8, status, "-" * 8)
 
+    @staticmethod
+    def _render_timings(timings, limit=30):
+        table = rich.table.Table(
+            title=f"Slowest checks and conditions (top {limit})",
+            title_justify="left",
+        )
+        table.add_column("Kind")
+        table.add_column("Name", overflow="fold")
+        table.add_column("Runs", justify="right")
+        table.add_column("Wall (s)", justify="right")
+        table.add_column("CPU (s)", justify="right")
+        table.add_column("Incl. conditions (s)", justify="right")
+        for row in timings.summary()[:limit]:
+            table.add_row(
+                row["kind"],
+                escape(row["name"]),
+                str(row["count"]),
+                f"{row['wall']:.3f}",
+                f"{row['cpu']:.3f}",
+                f"{row['total']:.3f}",
+            )
+        return table
+
     def _render_results_counter(self, counter=None):
         if counter is None:
             counter = self._counter
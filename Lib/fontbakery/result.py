@@ -62,8 +62,9 @@ class CheckResult:
         _summary_status = max(result.status for result in self.results)
         return _summary_status
 
-    def getData(self, runner):
-        """Return the result as a dictionary with data suitable for serialization."""
+    def getData(self, runner, render_artifacts=False):
+        """Return the result as a dictionary with data suitable for serialization.
+        The artifacts of the messages are rendered only if `render_artifacts`."""
         check = self.identity.check
         module = check.__module__.replace("fontbakery.checks.", "")
         if not isinstance(check.proposal, list):
@@ -87,7 +88,7 @@ class CheckResult:
             json["filename"] = runner.get_iterarg(*json["key"][2][0])
         for result in self.results:
             if isinstance(result.message, Message):
-                message = result.message.getData()
+                message = result.message.getData(render_artifacts)
             else:
                 message = {"message": result.message}
             json["logs"].append({"status": result.status.name, "message": message})
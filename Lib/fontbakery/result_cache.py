@@ -0,0 +1,104 @@
+"""
+FontBakery result_cache keeps check results on disk, so that re-running
+a profile on unchanged files does not run the checks again.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import List, Optional
+
+from fontbakery.result import Subresult
+
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024  # bytes
+
+
+def hash_path(path) -> str:
+    """A hash of the contents of a file, or of all the files in a
+    directory (e.g. a UFO source) together with their relative paths."""
+    digest = hashlib.sha256()
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for filename in sorted(files):
+                filepath = os.path.join(root, filename)
+                digest.update(os.path.relpath(filepath, path).encode("utf-8"))
+                digest.update(hash_path(filepath).encode("ascii"))
+        return digest.hexdigest()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """A directory of pickled check subresults, one file per key.
+
+    Reading an entry refreshes its modification time, so that `evict`
+    can drop the least recently used entries once the cache grows beyond
+    `max_size` bytes. Entries are written atomically, so several worker
+    processes can share the same directory."""
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def __reduce__(self):
+        return (ResultCache, (self.directory, self.max_size))
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".pickle")
+
+    def get(self, key) -> Optional[List[Subresult]]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                subresults = pickle.load(fh)
+            os.utime(path)
+        except Exception:
+            # A missing or unreadable entry is simply a cache miss.
+            return None
+        return subresults
+
+    def put(self, key, subresults: List[Subresult]):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(handle, "wb") as fh:
+                pickle.dump(subresults, fh)
+            os.replace(tmp_path, path)
+        except Exception:
+            # Failing to cache a result must never fail the check run.
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def evict(self):
+        """Remove the least recently used entries until the cache fits
+        in `max_size` bytes."""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                if not filename.endswith(".pickle"):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
@@ -30,6 +30,11 @@ class Status:
 
     __instances = {}
 
+    def __reduce__(self):
+        # Statuses are singletons, so unpickling must go through __new__
+        # to hand back the registered instance.
+        return (Status, (self.__name, self.__weight))
+
     def __str__(self):
         return f"<Status {self.__name}>"
 
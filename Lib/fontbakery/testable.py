@@ -1,11 +1,65 @@
+import importlib
 import os
+import threading
+import warnings
 from collections import defaultdict
 from dataclasses import dataclass, field
-from functools import cached_property
 from typing import Optional, List
 
 from fontTools.ttLib import TTFont
 
+from fontbakery import timing
+from fontbakery.callable import cached_property, uses_network
+
+
+class TimedTTFont(TTFont):
+    """A TTFont which reports the time taken to decompile each table
+    when the check run is being timed."""
+
+    def _readTable(self, tag):
+        with timing.measure("table", tag):
+            return super()._readTable(tag)
+
+
+# The check modules imported for the conditions they define
+_condition_modules = set()
+# Held while importing them, so that a thread looking up a condition waits
+# for another one which is importing its module.
+_condition_modules_lock = threading.RLock()
+
+
+def load_condition(name):
+    """Imports the check modules which define the condition `name`, unless
+    they have been imported already."""
+    from fontbakery import check_manifest
+
+    if name.startswith("__"):
+        return
+    with _condition_modules_lock:
+        for module_name in check_manifest.CONDITIONS.get(name, []):
+            if module_name in _condition_modules:
+                continue
+            try:
+                importlib.import_module(module_name)
+            except ImportError as e:
+                warnings.warn(f"Failed to load {module_name}: {e}")
+                continue
+            _condition_modules.add(module_name)
+
+
+def _lazy_condition(obj, name):
+    # Conditions are attached to the testables by the check modules which
+    # define them, which are only imported when needed (see check_manifest).
+    # Their checks are registered by fonts_profile, when it loads them.
+    load_condition(name)
+    attribute = getattr(type(obj), name, None)
+    if name.startswith("__") or attribute is None:
+        raise AttributeError(f"{type(obj).__name__!r} object has no attribute {name!r}")
+    # Either the condition has just been attached (by this thread or by
+    # another one), or it was already, and computing it raised an
+    # AttributeError, which calling it directly raises again as it is.
+    return attribute.__get__(obj, type(obj))  # pylint: disable=C2801
+
 
 @dataclass
 class Testable:
@@ -14,6 +68,9 @@ class Testable:
     singular = "testable"
     plural = "testables"
 
+    def __getattr__(self, name):
+        return _lazy_condition(self, name)
+
     @property
     def file_displayname(self):
         return os.path.basename(self.file)
@@ -76,7 +133,7 @@ class Font(Testable):
 
     @cached_property
     def ttFont(self):
-        font = TTFont(self.file)
+        font = TimedTTFont(self.file)
         if (
             hasattr(self, "context")
             and self.context is not None
@@ -86,6 +143,44 @@ class Font(Testable):
             font.ensureDecompiled()
         return font
 
+    def glyph_set(self, location=None, normalized=False):
+        """A glyph set of the font which pens can draw from without
+        modifying the shared ttFont, so checks need not deepcopy it."""
+        from fontbakery.utils import drawable_glyph_set
+
+        return drawable_glyph_set(self.ttFont, location, normalized)
+
+    def lookups(self, table):
+        """The lookups of the font's GSUB or GPOS table, with Extension
+        lookups unwrapped, without modifying the shared ttFont."""
+        from fontbakery.lookups import iterate_lookups
+
+        return list(iterate_lookups(self.ttFont, table))
+
+    @cached_property
+    def glyph_geometry(self):
+        """Bounds, area, contour and point counts, ink and horizontal metrics
+        of every glyph, measured once and shared by all checks."""
+        from fontbakery.glyph_geometry import GlyphGeometry
+
+        return GlyphGeometry(self.ttFont)
+
+    @cached_property
+    def kerning_index(self):
+        """The pair kerning of the font, indexed by subtable, without
+        expanding class kerning into glyph pairs."""
+        from fontbakery.kerning_index import KerningIndex
+
+        return KerningIndex(self.ttFont)
+
+    @cached_property
+    def harfbuzz(self):
+        """The HarfBuzz face of the font file, parsed once and shared by
+        all the checks which shape text with it."""
+        from fontbakery.harfbuzz import HarfBuzz
+
+        return HarfBuzz(self.file)
+
     @cached_property
     def style(self):
         """Determine font style from canonical filename."""
@@ -267,6 +362,58 @@ class CheckRunContext:
     testables: List[Testable] = field(default_factory=list)
     config: dict = field(default_factory=dict)
     is_multithreaded: bool = False
+    # The ResultCache of the check run, if any
+    cache: Optional[object] = None
+    # Whether this is the copy of the context of a worker process, which
+    # checks only some of the testables (see --executor processes)
+    in_worker_process: bool = False
+
+    def __getattr__(self, name):
+        return _lazy_condition(self, name)
+
+    @cached_property
+    def external_tools(self):
+        """The runner of the external tools used by the checks (see the
+        "external_tools" section of the configuration)."""
+        from fontbakery.external_tools import DEFAULT_TIMEOUT, ToolRunner
+
+        settings = self.config.get("external_tools") or {}
+        return ToolRunner(
+            max_processes=settings.get("max_processes"),
+            timeout=settings.get("timeout", DEFAULT_TIMEOUT),
+            cache=self.cache,
+        )
+
+    @uses_network
+    @cached_property
+    def http(self):
+        """The HTTP client of the checks which use the network (see the
+        "network_cache" and "network_replay" configuration settings)."""
+        from fontbakery.http_client import HTTPClient
+
+        return HTTPClient(
+            cache_dir=self.config.get("network_cache"),
+            replay=bool(self.config.get("network_replay")),
+        )
+
+    @uses_network
+    @cached_property
+    def link_checker(self):
+        """The checker of the links found by the checks, which keeps the
+        status of each URL for the whole run (see the "link_checker"
+        section of the configuration)."""
+        from fontbakery.link_checker import (
+            DEFAULT_MAX_WORKERS,
+            DEFAULT_PER_HOST,
+            LinkChecker,
+        )
+
+        settings = self.config.get("link_checker") or {}
+        return LinkChecker(
+            self.http,
+            max_workers=settings.get("max_workers", DEFAULT_MAX_WORKERS),
+            per_host=settings.get("per_host", DEFAULT_PER_HOST),
+        )
 
     @cached_property
     def testables_by_type(self):
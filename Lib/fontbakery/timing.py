@@ -0,0 +1,165 @@
+"""
+FontBakery timing measures where the time of a check run is spent:
+how long each check takes, how long each condition takes the first
+time it is computed (after that, conditions are cached), and so on.
+Optionally, every measurement is also kept as a span of a timeline,
+which can be saved in the Chrome trace-event format and inspected with
+chrome://tracing or https://ui.perfetto.dev
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so.
+"""
+from contextlib import contextmanager
+import json
+import os
+import threading
+import time
+
+# The recorder of the current check run, if it is being timed.
+# Conditions (and anything else using `measure`) report to it.
+active_recorder = None
+
+
+@contextmanager
+def measure(kind, name, **args):
+    """Measure the enclosed code, if the check run is being timed."""
+    recorder = active_recorder
+    if recorder is None:
+        yield
+        return
+    with recorder.measure(kind, name, **args):
+        yield
+
+
+class TimingRecorder:
+    """Accumulates wall-clock and CPU time by kind (e.g. "check" or
+    "condition") and name.
+
+    Measurements nest: a condition computed while a check runs is charged
+    to the condition, and its time is subtracted from the check's own
+    ("self") time. The inclusive wall time is kept as "total".
+
+    With `trace=True`, each measurement is also recorded as a trace event,
+    tagged with the process and thread it ran on."""
+
+    def __init__(self, trace=False):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.stats = {}
+        self.events = [] if trace else None
+        self.threads = {}
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def measure(self, kind, name, **args):
+        stack = self._stack()
+        children = [0.0, 0.0]  # wall and cpu time of nested measurements
+        stack.append(children)
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            stack.pop()
+            if stack:
+                stack[-1][0] += wall
+                stack[-1][1] += cpu
+            self.add(kind, name, 1, wall - children[0], cpu - children[1], wall)
+            if self.events is not None:
+                self._add_event(kind, name, wall_start, wall, args)
+
+    def _add_event(self, kind, name, start, duration, args):
+        thread = threading.current_thread()
+        pid = os.getpid()
+        event = {
+            "name": name,
+            "cat": kind,
+            "ph": "X",
+            "ts": start * 1e6,
+            "dur": duration * 1e6,
+            "pid": pid,
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+            self.threads[(pid, thread.ident)] = thread.name
+
+    def add(self, kind, name, count, wall, cpu, total):
+        with self._lock:
+            stats = self.stats.setdefault((kind, name), [0, 0.0, 0.0, 0.0])
+            stats[0] += count
+            stats[1] += wall
+            stats[2] += cpu
+            stats[3] += total
+
+    def pop(self):
+        """Return everything recorded so far and start afresh. This is how
+        worker processes hand their measurements to the parent."""
+        with self._lock:
+            data = {"stats": self.stats, "events": self.events, "threads": self.threads}
+            self.stats = {}
+            self.events = [] if self.events is not None else None
+            self.threads = {}
+        return data
+
+    def merge(self, data):
+        for (kind, name), values in data["stats"].items():
+            self.add(kind, name, *values)
+        if self.events is not None and data["events"]:
+            with self._lock:
+                self.events.extend(data["events"])
+                self.threads.update(data["threads"])
+
+    def summary(self, kind=None):
+        """A list of dictionaries, slowest (by own wall time) first."""
+        rows = [
+            {
+                "kind": row_kind,
+                "name": name,
+                "count": count,
+                "wall": wall,
+                "cpu": cpu,
+                "total": total,
+            }
+            for (row_kind, name), (count, wall, cpu, total) in self.stats.items()
+            if kind is None or row_kind == kind
+        ]
+        return sorted(rows, key=lambda row: row["wall"], reverse=True)
+
+    def write(self, filename):
+        kinds = sorted({kind for kind, _ in self.stats})
+        with open(filename, "w", encoding="utf-8") as fh:
+            json.dump({kind + "s": self.summary(kind) for kind in kinds}, fh, indent=4)
+
+    def write_trace(self, filename):
+        """Save the recorded spans in the Chrome trace-event format."""
+        metadata = []
+        for pid in sorted({pid for pid, _ in self.threads}):
+            name = "fontbakery" if pid == os.getpid() else f"worker {pid}"
+            metadata.append(
+                {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}}
+            )
+        for (pid, tid), name in self.threads.items():
+            metadata.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+            )
+        with open(filename, "w", encoding="utf-8") as fh:
+            json.dump(
+                {"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}, fh
+            )
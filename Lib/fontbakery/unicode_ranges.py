@@ -0,0 +1,84 @@
+"""
+FontBakery unicode_ranges tells which Unicode ranges (the OS/2 UnicodeRange
+bits, the CJK blocks) codepoints belong to, through sorted interval indexes
+built once from the range tables of fontbakery.constants.
+"""
+from bisect import bisect_right
+from functools import lru_cache
+
+
+class IntervalIndex:
+    """Maps codepoints to the labels of the (possibly overlapping) ranges
+    which contain them.
+
+    The ranges are split into disjoint segments, each one with the labels
+    of all the ranges covering it, so that looking up a codepoint is a
+    bisection, and a whole cmap is classified in a single sorted pass."""
+
+    def __init__(self, ranges):
+        """ranges: (first codepoint, last codepoint, label) tuples."""
+        ranges = list(ranges)
+        boundaries = sorted(
+            {first for first, _, _ in ranges} | {last + 1 for _, last, _ in ranges}
+        )
+        self._starts = boundaries[:-1]
+        self._ends = boundaries[1:]
+        self._labels = [
+            tuple(
+                dict.fromkeys(
+                    label
+                    for first, last, label in ranges
+                    if first <= start and end - 1 <= last
+                )
+            )
+            for start, end in zip(self._starts, self._ends)
+        ]
+
+    def labels(self, codepoint):
+        """The labels of the ranges containing a codepoint."""
+        i = bisect_right(self._starts, codepoint) - 1
+        if i < 0 or codepoint >= self._ends[i]:
+            return ()
+        return self._labels[i]
+
+    def __contains__(self, codepoint):
+        return bool(self.labels(codepoint))
+
+    def group(self, codepoints):
+        """The given codepoints, sorted, by label of the ranges containing
+        them. Codepoints outside of all ranges are left out."""
+        groups = {}
+        i, count = 0, len(self._starts)
+        for codepoint in sorted(codepoints):
+            while i < count and codepoint >= self._ends[i]:
+                i += 1
+            if i == count:
+                break
+            if codepoint < self._starts[i]:
+                continue
+            for label in self._labels[i]:
+                groups.setdefault(label, []).append(codepoint)
+        return groups
+
+
+@lru_cache(maxsize=None)
+def unicode_range_index():
+    """The ranges of each bit of the OS/2 ulUnicodeRange fields,
+    labelled by bit number."""
+    from fontbakery.constants import UNICODERANGE_DATA
+
+    return IntervalIndex(
+        (first, last, bit)
+        for entries in UNICODERANGE_DATA
+        for bit, _, first, last in entries
+    )
+
+
+@lru_cache(maxsize=None)
+def cjk_index():
+    """The CJK blocks, labelled by their (first, last) codepoints."""
+    from fontbakery.constants import CJK_UNICODE_RANGES
+
+    return IntervalIndex(
+        (first, last, (first, last)) for first, last in CJK_UNICODE_RANGES
+    )
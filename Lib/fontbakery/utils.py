@@ -13,17 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from collections.abc import Mapping
 import os
 import subprocess
 import sys
+import threading
 from typing import Text, Optional
-from copy import deepcopy
+import weakref
 
-from fontTools.pens.basePen import BasePen
+from fontTools.pens.basePen import BasePen, NullPen
 from fontTools.ttLib import TTFont
-import rich
 
-from fontbakery.constants import NO_COLORS_THEME, DARK_THEME, LIGHT_THEME
+from fontbakery.lookups import iterate_lookups
 
 
 def exit_with_install_instructions(profile_name):
@@ -77,6 +78,8 @@ def apple_terminal_bg_is_white():
 
 
 def get_theme(args):
+    from fontbakery.constants import NO_COLORS_THEME, DARK_THEME, LIGHT_THEME
+
     if args.no_colors:
         return NO_COLORS_THEME
     if args.light_theme:
@@ -269,8 +272,9 @@ def glyph_contour_count(font, name):
     return contour_count
 
 
-def get_font_glyph_data(font):
-    """Return information for each glyph in a font"""
+def get_font_glyph_data(font, glyph_geometry=None):
+    """Return information for each glyph in a font.
+    Contour counts are taken from `glyph_geometry` when given."""
     from fontbakery.constants import PlatformID, WindowsEncodingID
 
     font_data = []
@@ -293,7 +297,10 @@ def get_font_glyph_data(font):
     for glyph_name in font.getGlyphSet().keys():
         if glyph_name in cmap_reversed:
             uni_glyph = cmap_reversed[glyph_name]
-            contours = glyph_contour_count(font, glyph_name)
+            if glyph_geometry is not None:
+                contours = glyph_geometry.contour_count(glyph_name)
+            else:
+                contours = glyph_contour_count(font, glyph_name)
             font_data.append(
                 {"unicode": uni_glyph, "name": glyph_name, "contours": {contours}}
             )
@@ -353,23 +360,43 @@ class BadCertificateSetupException(Exception):
     pass
 
 
-def download_file(url):
+CERTIFICATES_NOT_INSTALLED = (
+    "You probably installed official"
+    " Mac python from python.org but forgot to also install"
+    " the certificates. There is a note in the installer"
+    " Readme about that. Check the Python folder in the"
+    " Applications directory, you should find a shell script"
+    " to install the certificates."
+)
+
+
+def download_file(url, http=None):
+    """The contents of a URL, as a BytesIO, or None if it cannot be
+    fetched. It is downloaded with the HTTP client given, if any."""
     from urllib.request import urlopen
     from urllib.error import URLError
     from io import BytesIO
 
+    if http is not None:
+        import requests
+
+        try:
+            response = http.get(url)
+        except requests.exceptions.SSLError as e:
+            if "CERTIFICATE_VERIFY_FAILED" in str(e):
+                raise BadCertificateSetupException(CERTIFICATES_NOT_INSTALLED)
+            return None
+        except requests.exceptions.RequestException:
+            return None
+        if response.status_code != requests.codes.ok:
+            return None
+        return BytesIO(response.content)
+
     try:
         return BytesIO(urlopen(url).read())
     except URLError as e:
         if "CERTIFICATE_VERIFY_FAILED" in str(e.reason):
-            raise BadCertificateSetupException(
-                "You probably installed official"
-                " Mac python from python.org but forgot to also install"
-                " the certificates. There is a note in the installer"
-                " Readme about that. Check the Python folder in the"
-                " Applications directory, you should find a shell script"
-                " to install the certificates."
-            )
+            raise BadCertificateSetupException(CERTIFICATES_NOT_INSTALLED)
 
 
 def cff_glyph_has_ink(font: TTFont, glyph_name: Text) -> bool:
@@ -426,29 +453,23 @@ def get_preferred_cmap(ttFont):
         return None
 
 
-def chars_in_range(ttFont, bit):
-    from fontbakery.constants import UNICODERANGE_DATA
+def chars_by_unicoderange_bit(ttFont):
+    """The (sorted) codepoints of the font's cmap, by UnicodeRange bit."""
+    from fontbakery.unicode_ranges import unicode_range_index
 
-    cmap = get_preferred_cmap(ttFont)
-    chars = []
-    for c in sorted(cmap):
-        for entry in UNICODERANGE_DATA[bit]:
-            if c >= entry[2] and c <= entry[3]:
-                chars.append(c)
-    return chars
+    return unicode_range_index().group(get_preferred_cmap(ttFont))
 
 
-def compute_unicoderange_bits(ttFont):
-    from fontbakery.constants import UNICODERANGE_DATA
+def chars_in_range(ttFont, bit):
+    return chars_by_unicoderange_bit(ttFont).get(bit, [])
+
 
-    cmap = get_preferred_cmap(ttFont)
+def compute_unicoderange_bits(ttFont, chars_by_bit=None):
+    if chars_by_bit is None:
+        chars_by_bit = chars_by_unicoderange_bit(ttFont)
     result = 0
-    for c in sorted(cmap):
-        for bit in range(len(UNICODERANGE_DATA)):
-            for entry in UNICODERANGE_DATA[bit]:
-                bit = entry[0]
-                if c >= entry[2] and c <= entry[3]:
-                    result |= 1 << bit
+    for bit in chars_by_bit:
+        result |= 1 << bit
     return result
 
 
@@ -487,71 +508,95 @@ def filenames_ending_in(suffix, root):
 
 
 def all_kerning(ttFont):
-    if "GPOS" not in ttFont:
-        return []
-    rules = []
-
-    def _invertClassDef(a, font):
-        classes = {}
-        for glyph, klass in a.items():
-            if klass not in classes:
-                classes[klass] = []
-            classes[klass].append(glyph)
-        glyphset = set(font.getGlyphOrder())
-        classes[0] = glyphset - set(a.keys())
-        return classes
-
-    kern_subtables = []
-    for lu in ttFont["GPOS"].table.LookupList.Lookup:
-        for subtable in lu.SubTable:
-            if subtable.LookupType == 9:
-                subtable = subtable.ExtSubTable
-            if subtable.LookupType == 2:
-                kern_subtables.append(subtable)
-
-    for subtable in kern_subtables:
-        if subtable.Format == 1:
-            for g, pair in zip(subtable.Coverage.glyphs, subtable.PairSet):
-                for vr in pair.PairValueRecord:
-                    rules.append((g, vr.SecondGlyph, vr.Value1, vr.Value2))
-        else:
-            class1 = _invertClassDef(subtable.ClassDef1.classDefs, ttFont)
-            class2 = _invertClassDef(subtable.ClassDef2.classDefs, ttFont)
-            for ix1, c1 in enumerate(subtable.Class1Record):
-                if ix1 not in class1:
-                    continue
-                for ix2, c2 in enumerate(c1.Class2Record):
-                    if ix2 not in class2:
-                        continue
-                    firstClass = list(set(class1[ix1]) & set(subtable.Coverage.glyphs))
-                    for left in firstClass:
-                        for right in class2[ix2]:
-                            rules.append((left, right, c2.Value1, c2.Value2))
-    return rules
+    """All the (left, right, value1, value2) kerning pairs of the font,
+    with class kerning expanded. Prefer Font.kerning_index, which does not
+    build this (potentially huge) list."""
+    from fontbakery.kerning_index import KerningIndex
+
+    return list(KerningIndex(ttFont).pairs(nonzero=False))
 
 
 def iterate_lookup_list_with_extensions(ttFont, table, callback, *args):
     """Iterates over the lookup list of a font's GSUB/GPOS table, calling
     the callback with the lookup and the provided arguments, but descending
     into Extension subtables."""
-    if table not in ttFont or not ttFont[table].table.LookupList:
-        return
-
-    # This function mutates the TTF; deep copy to avoid this, and so avoid
-    # issues with concurrent tests that also use ttFont.
-    # See https://github.com/fonttools/fontbakery/issues/4834
-    ttFont = deepcopy(ttFont)
-
-    extension_type = 9 if table == "GPOS" else 7
-
-    for lookup in ttFont[table].table.LookupList.Lookup:
-        if lookup.LookupType == extension_type:
-            for xt in lookup.SubTable:
-                xt.SubTable = [xt.ExtSubTable]
-                xt.LookupType = xt.ExtSubTable.LookupType
-                callback(xt, *args)
-        else:
-            callback(lookup, *args)
+    for lookup in iterate_lookups(ttFont, table):
+        callback(lookup, *args)
+
+
+# fontTools decompiles glyph outlines lazily, the first time they are drawn,
+# which modifies the font object. Once a glyph has been drawn (and so it and
+# the subroutines it calls are decompiled), drawing it again is read-only,
+# so checks running concurrently can share a single font object.
+_OUTLINES_LOCK = threading.Lock()
+# ttFont -> {glyph name (or None, for the glyf/gvar tables): the error
+# raised decompiling it, or None}
+_DECOMPILED_OUTLINES = weakref.WeakKeyDictionary()
+
+
+def _decompile_once(ttFont, key, decompile):
+    with _OUTLINES_LOCK:
+        decompiled = _DECOMPILED_OUTLINES.setdefault(ttFont, {})
+        if key not in decompiled:
+            try:
+                decompile()
+                decompiled[key] = None
+            except Exception as error:  # pylint: disable=broad-except
+                decompiled[key] = error
+    if decompiled[key] is not None:
+        raise decompiled[key]
+
+
+def decompile_outlines(ttFont):
+    """Decompiles the TrueType glyph outlines (and their variations) of a
+    font once, so that drawing its glyphs no longer modifies it. CFF
+    charstrings are decompiled one glyph at a time, by drawable_glyph_set."""
+
+    def decompile():
+        for tag in ("glyf", "gvar"):
+            if tag in ttFont:
+                ttFont[tag].ensureDecompiled()
+
+    _decompile_once(ttFont, None, decompile)
+
+
+class DrawableGlyphSet(Mapping):
+    """A glyph set of a font (see TTFont.getGlyphSet) whose CFF glyphs are
+    decompiled the first time they are looked up, under a lock shared by
+    all the glyph sets of the font. A glyph which cannot be drawn raises
+    the same error each time it is looked up, without being drawn again."""
+
+    def __init__(self, ttFont, glyphset):
+        self._font = ttFont
+        self._glyphset = glyphset
+        self._cff = "CFF " in ttFont or "CFF2" in ttFont
+
+    def __getitem__(self, glyph_name):
+        glyph = self._glyphset[glyph_name]
+        if self._cff:
+            _decompile_once(self._font, glyph_name, lambda: glyph.draw(NullPen()))
+        return glyph
+
+    def __iter__(self):
+        return iter(self._glyphset)
+
+    def __len__(self):
+        return len(self._glyphset)
+
+    def __contains__(self, glyph_name):
+        return glyph_name in self._glyphset
+
+    def __getattr__(self, name):
+        return getattr(self._glyphset, name)
+
+
+def drawable_glyph_set(ttFont, location=None, normalized=False):
+    """A glyph set of the font which pens can draw from without modifying
+    the font, and so without needing a deep copy of it."""
+    decompile_outlines(ttFont)
+    return DrawableGlyphSet(
+        ttFont, ttFont.getGlyphSet(location=location, normalized=normalized)
+    )
 
 
 def axis(ttFont, tag):
@@ -626,7 +671,7 @@ class IndentedParagraph:
         lines = console.render_lines(
             self.renderable, render_options, style=style, pad=True
         )
-        _Segment = rich.segment.Segment
+        from rich.segment import Segment as _Segment
 
         left = _Segment(" " * self.left, style) if self.left else None
         first = _Segment(" " * self.first, style) if self.left else None
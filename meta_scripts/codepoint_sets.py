@@ -0,0 +1,68 @@
+"""Inspect or edit FontBakery's character repertoires.
+
+The repertoires used by the checks (OGL2, WGL4, the Hangul syllable sets,
+Type Network's minimal Latin set, ...) are stored as compact codepoint sets
+in Lib/fontbakery/data/codepoint_sets.bin. This script converts that file
+to and from a plain-text listing, which is easier to review and edit:
+
+    python meta_scripts/codepoint_sets.py dump > codepoint_sets.txt
+    (edit codepoint_sets.txt)
+    python meta_scripts/codepoint_sets.py build codepoint_sets.txt
+
+In the listing, each set starts with a "[NAME]" line, followed by one
+codepoint ("0041") or inclusive range ("0041..005A") per line.
+"""
+import os
+import sys
+
+from fontbakery.codepoints import (
+    CodepointSet,
+    dump_codepoint_sets,
+    load_codepoint_sets,
+)
+
+DATA_FILE = os.path.join(
+    os.path.dirname(__file__), "..", "Lib", "fontbakery", "data", "codepoint_sets.bin"
+)
+
+
+def dump():
+    with open(DATA_FILE, "rb") as fh:
+        sets = load_codepoint_sets(fh.read())
+    for name, codepoints in sets.items():
+        print(f"[{name}]")
+        for first, last in codepoints.ranges():
+            print(f"{first:04X}" if first == last else f"{first:04X}..{last:04X}")
+
+
+def build(listing):
+    sets = {}
+    with open(listing, encoding="utf-8") as fh:
+        for line in fh:
+            line = line.split("#")[0].strip()
+            if not line:
+                continue
+            if line.startswith("["):
+                name = line.strip("[]")
+                sets[name] = []
+                continue
+            first, _, last = line.partition("..")
+            sets[name].append((int(first, 16), int(last or first, 16)))
+    with open(DATA_FILE, "wb") as fh:
+        fh.write(
+            dump_codepoint_sets(
+                {
+                    name: CodepointSet.from_ranges(ranges)
+                    for name, ranges in sets.items()
+                }
+            )
+        )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["dump"]:
+        dump()
+    elif sys.argv[1:2] == ["build"] and len(sys.argv) == 3:
+        build(sys.argv[2])
+    else:
+        sys.exit(__doc__)
@@ -0,0 +1,70 @@
+"""Generate FontBakery's check_manifest.py module.
+
+The check manifest maps the id of every check, and the name of every
+condition, defined in the fontbakery.checks package to the module defining
+it. profile_factory uses it to import only the modules which are needed by
+the checks of a profile (and by the -c/-x selection), instead of importing
+every check module up front.
+
+Run this script again whenever checks or conditions are added, moved or
+renamed. (A stale manifest is not fatal: checks which cannot be found through
+it are looked up by importing all of the check modules.)
+"""
+import os
+import sys
+from collections import defaultdict
+
+from fontbakery.callable import cached_property
+from fontbakery.fonts_profile import checks_by_id, load_all_checks
+from fontbakery.testable import FILE_TYPES, CheckRunContext, TTCFont
+
+
+def main():
+    load_all_checks()
+    checks = {check_id: check.__module__ for check_id, check in checks_by_id.items()}
+    conditions = defaultdict(set)
+    for cls in [CheckRunContext, TTCFont] + FILE_TYPES:
+        for name, attribute in vars(cls).items():
+            if isinstance(
+                attribute, cached_property
+            ) and attribute.func.__module__.startswith("fontbakery.checks."):
+                conditions[name].add(attribute.func.__module__)
+
+    lines = [
+        "# This file is generated by meta_scripts/generate_check_manifest.py",
+        "# pylint: disable=line-too-long  # This is data, not code",
+        "",
+        "# The module defining each check",
+        "CHECKS = {",
+    ]
+    lines += [f'    "{check_id}": "{checks[check_id]}",' for check_id in sorted(checks)]
+    lines += [
+        "}",
+        "",
+        "# The modules defining each condition (on any of the testables)",
+        "CONDITIONS = {",
+    ]
+    lines += [
+        f'    "{name}": {sorted(conditions[name])!r},'.replace("'", '"')
+        for name in sorted(conditions)
+    ]
+    lines += ["}", ""]
+    source = "\n".join(lines)
+    try:
+        import black
+
+        source = black.format_str(source, mode=black.Mode())
+    except ImportError:
+        pass
+
+    manifest_path = os.path.join(
+        os.path.dirname(__file__), "..", "Lib", "fontbakery", "check_manifest.py"
+    )
+    print(f"Saving to {manifest_path}")
+    with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+        manifest_file.write(source)
+    print("done")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
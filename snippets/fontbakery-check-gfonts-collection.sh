@@ -9,24 +9,11 @@ else
   exit 1
 fi
 
-APACHE_FOLDERS=$COLLECTION_FOLDER/apache/*
-OFL_FOLDERS=$COLLECTION_FOLDER/ofl/*
-UFL_FOLDERS=$COLLECTION_FOLDER/ufl/*
 RESULTS_FOLDER=$COLLECTION_FOLDER/check_results
 
-mkdir -p $RESULTS_FOLDER
-rm -f $RESULTS_FOLDER/issues.txt
-rm -f $RESULTS_FOLDER/all_fonts.txt
-rm -f $COLLECTION_FOLDER/*/*/*fontbakery.json
+rm -rf $RESULTS_FOLDER
 
-for f in $APACHE_FOLDERS $OFL_FOLDERS $UFL_FOLDERS
-do
-  echo "$f" >> $RESULTS_FOLDER/all_fonts.txt
-  echo "Processing '$f'..."
-  LICENSE_DIR=$(basename "$(dirname $f)")
-  REPORT=$RESULTS_FOLDER/$LICENSE_DIR/$(basename $f).json
-  mkdir -p $(dirname $REPORT)
-  fontbakery check-googlefonts --json $REPORT "$f/*.ttf"
-done
-
-cat $RESULTS_FOLDER/issues.txt
+# Checks every family in a single process, writing a report for each
+# family to $RESULTS_FOLDER/<license>/<family>.json and a summary of
+# all of them to $RESULTS_FOLDER/summary.json
+fontbakery batch googlefonts $COLLECTION_FOLDER -O $RESULTS_FOLDER --auto-jobs
@@ -0,0 +1,271 @@
+import pickle
+from unittest.mock import Mock
+
+from fontbakery.checkrunner import CheckRunner
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.configuration import Configuration
+from fontbakery.fonts_profile import profile_factory, setup_context
+from fontbakery.reporters import FontbakeryReporter
+from fontbakery.result import Subresult
+from fontbakery.status import PASS, WARN
+from fontbakery.message import Message
+
+
+def run_universal(files, checks, **kwargs):
+    import fontbakery.profiles.universal
+
+    profile = profile_factory(fontbakery.profiles.universal)
+    context = setup_context(files)
+    context.is_multithreaded = kwargs.get("jobs", 0) > 1
+    runner = CheckRunner(
+        profile, context, Configuration(explicit_checks=checks), **kwargs
+    )
+    reporter = FontbakeryReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+    return {
+        result.identity.key: [
+            (subresult.status, subresult.message.code) for subresult in result.results
+        ]
+        for result in reporter._results
+    }
+
+
+def test_results_are_picklable():
+    subresult = Subresult(WARN, Message("some-code", "Some message"))
+    copy = pickle.loads(pickle.dumps(subresult))
+    assert copy.status is WARN
+    assert copy.message.code == "some-code"
+
+
+def test_process_executor_matches_serial_run():
+    files = [
+        TEST_FILE("nunito/Nunito-Regular.ttf"),
+        TEST_FILE("nunito/Nunito-Bold.ttf"),
+    ]
+    checks = ["contour_count", "whitespace_glyphs", "family/win_ascent_and_descent"]
+    serial = run_universal(files, checks)
+    parallel = run_universal(files, checks, jobs=2, executor="processes")
+    assert serial
+    assert parallel == serial
+
+
+def test_schedule_groups_identities_by_font():
+    from fontbakery.result import Identity
+
+    order = [
+        Identity(None, None, (("font", 0),)),
+        Identity(None, None, (("font", 1),)),
+        Identity(None, None, ()),
+        Identity(None, None, (("font", 0),)),
+        Identity(None, None, (("font", 1),)),
+    ]
+    assert CheckRunner._schedule(order) == [[0, 3], [1, 4], [2]]
+
+
+def test_parallel_runs_report_in_scheduled_order():
+    files = [
+        TEST_FILE("nunito/Nunito-Regular.ttf"),
+        TEST_FILE("nunito/Nunito-Bold.ttf"),
+    ]
+    checks = ["contour_count", "whitespace_glyphs", "family/win_ascent_and_descent"]
+    threads = run_universal(files, checks, jobs=2)
+    processes = run_universal(files, checks, jobs=2, executor="processes")
+    assert list(threads.items()) == list(processes.items())
+    fonts = [key[2] for key in threads]
+    # All the checks on the first font, then those on the second one.
+    assert fonts == sorted(fonts, key=lambda iterargs: iterargs[0][1])
+
+
+def test_result_cache_replays_results(tmp_path, monkeypatch):
+    from fontbakery.result_cache import ResultCache
+
+    files = [TEST_FILE("nunito/Nunito-Regular.ttf")]
+    checks = ["contour_count", "whitespace_glyphs"]
+    cache = ResultCache(str(tmp_path))
+    first = run_universal(files, checks, cache=cache)
+
+    def fail(self, identity):
+        raise AssertionError(f"{identity.check.id} should have been cached")
+
+    monkeypatch.setattr(CheckRunner, "_execute_check", fail)
+    assert run_universal(files, checks, cache=cache) == first
+
+
+def test_result_cache_keys_on_sidecar_files_and_skips_network(tmp_path, monkeypatch):
+    import shutil
+
+    import requests
+
+    from fontbakery.result_cache import ResultCache
+
+    family = tmp_path / "family"
+    family.mkdir()
+    fonts = [str(family / "Nunito-Regular.ttf"), str(family / "Nunito-Bold.ttf")]
+    shutil.copy(TEST_FILE("nunito/Nunito-Regular.ttf"), fonts[0])
+    shutil.copy(TEST_FILE("nunito/Nunito-Bold.ttf"), fonts[1])
+    (family / "METADATA.pb").write_text("name: 'Nunito'\n")
+    cache = ResultCache(str(tmp_path / "cache"))
+    monkeypatch.setattr(
+        requests.Session, "request", Mock(side_effect=requests.ConnectionError)
+    )
+
+    executed = []
+    execute_check = CheckRunner._execute_check
+
+    def counting(self, identity):
+        executed.append(identity.check.id)
+        return execute_check(self, identity)
+
+    monkeypatch.setattr(CheckRunner, "_execute_check", counting)
+    checks = ["contour_count", "family/control_chars", "fontbakery_version"]
+    everything = (
+        ["contour_count"] * 2 + ["family/control_chars"] + ["fontbakery_version"] * 2
+    )
+    run_universal(fonts, checks, cache=cache)
+    assert sorted(executed) == everything
+
+    # Checks using the network always run again.
+    executed.clear()
+    run_universal(fonts, checks, cache=cache)
+    assert executed == ["fontbakery_version"] * 2
+
+    # Other files beside the fonts are not read by the checks...
+    executed.clear()
+    (family / "notes.txt").write_text("Nothing to see here\n")
+    run_universal(fonts, checks, cache=cache)
+    assert executed == ["fontbakery_version"] * 2
+
+    # ...nor are the other fonts, by checks on a single font...
+    executed.clear()
+    shutil.copy(TEST_FILE("nunito/Nunito-Regular.ttf"), fonts[1])
+    run_universal(fonts, checks, cache=cache)
+    assert sorted(executed) == (
+        ["contour_count", "family/control_chars"] + ["fontbakery_version"] * 2
+    )
+
+    # ...but their sidecar files may be.
+    executed.clear()
+    (family / "METADATA.pb").write_text("name: 'Nunito Sans'\n")
+    run_universal(fonts, checks, cache=cache)
+    assert sorted(executed) == everything
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    import os
+    import time
+
+    from fontbakery.result_cache import ResultCache
+
+    cache = ResultCache(str(tmp_path), max_size=0)
+    cache.put("aa", [Subresult(PASS, Message("ok", "fine"))])
+    size = os.path.getsize(cache._path("aa"))
+    cache.max_size = size
+    cache.put("bb", [Subresult(PASS, Message("ok", "fine"))])
+    past = time.time() - 60
+    os.utime(cache._path("aa"), (past, past))
+    cache.evict()
+    assert cache.get("aa") is None
+    assert cache.get("bb") is not None
+
+
+def test_timings_charge_conditions_separately():
+    from fontbakery.timing import TimingRecorder
+
+    files = [
+        TEST_FILE("nunito/Nunito-Regular.ttf"),
+        TEST_FILE("nunito/Nunito-Bold.ttf"),
+    ]
+    for kwargs in ({}, {"jobs": 2, "executor": "processes"}):
+        timings = TimingRecorder()
+        run_universal(files, ["contour_count"], timings=timings, **kwargs)
+        checks = {row["name"]: row for row in timings.summary("check")}
+        conditions = {row["name"]: row for row in timings.summary("condition")}
+        assert checks["contour_count"]["count"] == 2
+        assert conditions["Font.ttFont"]["count"] == 2
+        # The check's own time does not include the conditions it triggered
+        assert checks["contour_count"]["wall"] < checks["contour_count"]["total"]
+
+
+def test_trace_records_spans_from_every_worker(tmp_path):
+    import json
+
+    from fontbakery.timing import TimingRecorder
+
+    files = [
+        TEST_FILE("nunito/Nunito-Regular.ttf"),
+        TEST_FILE("nunito/Nunito-Bold.ttf"),
+    ]
+    timings = TimingRecorder(trace=True)
+    run_universal(
+        files, ["contour_count"], timings=timings, jobs=2, executor="processes"
+    )
+    trace_file = tmp_path / "trace.json"
+    timings.write_trace(str(trace_file))
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    spans = [event for event in events if event["ph"] == "X"]
+    assert {span["cat"] for span in spans} >= {"check", "condition", "table"}
+    checks = [span for span in spans if span["cat"] == "check"]
+    assert sorted(span["args"]["files"][0] for span in checks) == [
+        "Nunito-Bold.ttf",
+        "Nunito-Regular.ttf",
+    ]
+    assert any(event["name"] == "process_name" for event in events)
+
+
+def test_execution_plan_is_compiled_once():
+    import fontbakery.profiles.universal
+
+    files = [
+        TEST_FILE("nunito/Nunito-Regular.ttf"),
+        TEST_FILE("nunito/Nunito-Bold.ttf"),
+    ]
+    profile = profile_factory(fontbakery.profiles.universal)
+    context = setup_context(files)
+    checks = ["whitespace_glyphs", "family/win_ascent_and_descent"]
+    runner = CheckRunner(profile, context, Configuration(explicit_checks=checks))
+    assert runner.order is runner.order
+
+    plan = runner.plan.describe()
+    assert plan["identities"] == len(runner.order) == 4
+    assert plan["checks"]["family/win_ascent_and_descent"]["args"] == {
+        "ttFont": "font.ttFont",
+        "vmetrics": "collection",
+    }
+    identity = runner.order[0]
+    assert runner._get("font", identity.iterargs) is context.testables[0]
+    assert runner._get("ttFont", identity.iterargs) is context.testables[0].ttFont
+
+
+def test_ndjson_report_rebuilds_json_report(tmp_path):
+    import json
+
+    import fontbakery.profiles.universal
+    from fontbakery.reporters.serialize import (
+        JSONReporter,
+        NDJSONReporter,
+        read_ndjson,
+    )
+
+    files = [
+        TEST_FILE("nunito/Nunito-Regular.ttf"),
+        TEST_FILE("nunito/Nunito-Bold.ttf"),
+    ]
+    profile = profile_factory(fontbakery.profiles.universal)
+    runner = CheckRunner(
+        profile,
+        setup_context(files),
+        Configuration(explicit_checks=["whitespace_glyphs", "family/control_chars"]),
+    )
+    kwargs = {"runner": runner, "loglevels": [PASS], "quiet": True}
+    json_reporter = JSONReporter(output_file=str(tmp_path / "report.json"), **kwargs)
+    ndjson_file = tmp_path / "report.ndjson"
+    ndjson_reporter = NDJSONReporter(output_file=str(ndjson_file), **kwargs)
+    runner.run([json_reporter, ndjson_reporter])
+    json_reporter.write()
+
+    assert not ndjson_reporter._results
+    lines = ndjson_file.read_text().splitlines()
+    assert len(lines) == len(runner.order) + 1
+    with open(ndjson_file, encoding="utf-8") as fh:
+        rebuilt = read_ndjson(fh)
+    assert rebuilt == json.loads((tmp_path / "report.json").read_text())
@@ -338,7 +338,7 @@ def test_check_override_weight_class_fvar():
     )
 
 
-@patch("requests.get", side_effect=requests.exceptions.ConnectionError)
+@patch("requests.Session.request", side_effect=requests.exceptions.ConnectionError)
 def test_check_override_fontbakery_version(mock_get):
     """Check that overridden test yields SKIP rather than FAIL."""
     check = CheckTester(
@@ -40,3 +40,15 @@ def test_check_empty_letters():
     ttFont = TTFont(TEST_FILE("familysans/FamilySans-Regular.ttf"))
     msg = assert_results_contain(check(ttFont), FAIL, "empty-letter")
     assert msg == "U+0042 should be visible, but its glyph ('B') is empty."
+
+
+def test_check_empty_letters_after_drawing():
+    """Glyphs drawn by other checks are still told apart from empty ones."""
+    check = CheckTester("empty_letters")
+    for font in (
+        "source-sans-pro/OTF/SourceSansPro-Black.otf",
+        "deprecated_operators/cff1_endchar_seac.otf",
+    ):
+        ttFont = TTFont(TEST_FILE(font))
+        assert_PASS(CheckTester("whitespace_ink")(ttFont))
+        assert_PASS(check(ttFont))
@@ -16,7 +16,7 @@ def test_extra_needed_exit(monkeypatch):
     from fontbakery.checks.fontval import check_fontvalidator
 
     with pytest.raises(SystemExit):
-        list(check_fontvalidator(None, None))
+        list(check_fontvalidator(None, None, None))
 
     remove_import_raiser(module_name)
 
@@ -24,6 +24,29 @@ def test_check_hinting_impact():
     )
 
 
+def test_dehinted_size_is_cached(tmp_path, monkeypatch):
+    """The dehinted size is computed in memory, once per font contents."""
+    from fontbakery.checks import hinting
+    from fontbakery.result_cache import ResultCache
+
+    font = tmp_path / "Rokkitt-Bold.otf"
+    with open(TEST_FILE("rokkitt/Rokkitt-Bold.otf"), "rb") as fh:
+        font.write_bytes(fh.read())
+    data = font.read_bytes()
+
+    cache = ResultCache(str(tmp_path / "cache"))
+    hinting._dehinted_sizes.clear()
+    size = hinting.dehinted_size(data, cache)
+    assert 0 < size < len(data)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["Rokkitt-Bold.otf", "cache"]
+
+    # Neither this process nor another one need dehint it again.
+    hinting._dehinted_sizes.clear()
+    monkeypatch.setattr(hinting, "_dehint", None)
+    assert hinting.dehinted_size(data, cache) == size
+    assert hinting.dehinted_size(data) == size
+
+
 def test_check_integer_ppem_if_hinted():
     """PPEM must be an integer on hinted fonts."""
     check = CheckTester("integer_ppem_if_hinted")
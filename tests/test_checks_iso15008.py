@@ -139,3 +139,35 @@ def test_check_iso15008_interline_spacing():
     assert_results_contain(
         check(font), FAIL, "bad-interline-spacing", "with bad interline space..."
     )
+
+
+def test_pair_kerning_of_substituted_glyphs(tmp_path):
+    from fontTools.feaLib.builder import addOpenTypeFeaturesFromString
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    from fontbakery.checks.iso15008 import pair_kerning
+    from fontbakery.testable import Font
+
+    glyph_order = [".notdef", "l", "l.alt", "v"]
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyph_order)
+    builder.setupCharacterMap({ord("l"): "l", ord("v"): "v"})
+    builder.setupGlyf({name: TTGlyphPen(None).glyph() for name in glyph_order})
+    builder.setupHorizontalMetrics({name: (500, 0) for name in glyph_order})
+    builder.setupHorizontalHeader()
+    builder.setupOS2()
+    builder.setupPost()
+    addOpenTypeFeaturesFromString(
+        builder.font,
+        """
+        feature calt { sub l' v by l.alt; } calt;
+        feature kern { pos l v -10; pos l.alt v -50; } kern;
+        """,
+    )
+    path = str(tmp_path / "Test-Regular.ttf")
+    builder.save(path)
+
+    # "l" is substituted before it is kerned, so the pair is shaped.
+    assert pair_kerning(Font(path), "l", "v") == -50
+    assert pair_kerning(Font(path), "v", "l") == 0
@@ -1,7 +1,7 @@
 from fontTools.ttLib import TTFont
 
 from fontbakery.codetesting import (
-    # assert_PASS,  FIXME: We must also have PASS test-cases!
+    assert_PASS,
     assert_results_contain,
     CheckTester,
     TEST_FILE,
@@ -53,3 +53,10 @@ def test_check_kerning_for_non_ligated_sequences():
         "GPOS table lacks kerning info for the following non-ligated sequences:\n\n"
         "\t- f + f\n\n\t- f + i\n\n\t- f + l"
     )
+
+    # Sequences which are kerned
+    assert_PASS(check(MockFont(file=font, ligatures={"f": [["o"], ["j"]]})))
+
+    # An explicit zero kerning pair is kerning info too.
+    font = TEST_FILE("nunito/Nunito-Regular.ttf")
+    assert_PASS(check(MockFont(file=font, ligatures={"ellipsis": [["j"]]})))
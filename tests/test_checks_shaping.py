@@ -1,5 +1,6 @@
 import json
 import os
+import pickle
 import tempfile
 from unittest.mock import patch
 
@@ -51,6 +52,43 @@ def test_check_shaping_regression():
         )
 
 
+def test_shaping_report_drawings():
+    """Failing examples are drawn lazily, and only up to a limit."""
+    check = CheckTester("shaping/regression")
+
+    shaping_test = {
+        "configuration": {},
+        "tests": [
+            {"input": "AV", "expectation": "A=0+664|V=1+691"},
+            {"input": "VA", "expectation": "V=0+691|A=1+664"},
+        ],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_gf_dir:
+        json.dump(
+            shaping_test,
+            open(os.path.join(tmp_gf_dir, "test.json"), "w", encoding="utf-8"),
+        )
+
+        config = {"shaping": {"test_directory": tmp_gf_dir, "max_drawn_examples": 1}}
+        font = TEST_FILE("slabo/Slabo13px.ttf")
+        results = check(font, config=config)
+        message = [r.message for r in results if r.status == FAIL][0]
+
+        # The got and expected buffers of the first failure only
+        assert len(message.artifacts) == 2
+        assert "<svg" not in message.message
+        assert "<svg" not in message.getData()["message"]
+        rendered = message.getData(render_artifacts=True)["message"]
+        assert rendered.count("<svg") == 2
+        assert "Only the first 1 failures are drawn" in message.message
+
+        # Drawings unpickled (e.g. from the result cache) read the font again
+        unpickled = pickle.loads(pickle.dumps(message))
+        assert unpickled.artifacts[0].face is None
+        assert unpickled.getData(render_artifacts=True)["message"] == rendered
+
+
 def test_check_shaping_regression_with_variations():
     """Check that we can test shaping with variation settings against expectations."""
     check = CheckTester("shaping/regression")
@@ -82,6 +120,40 @@ def test_check_shaping_regression_with_variations():
         assert_PASS(check(font, config=config), "Oswald: A=0+453|V=1+505")
 
 
+def test_shaping_suite_index():
+    """Shaping suites are parsed once, with their tests indexed by font."""
+    from pathlib import Path
+
+    from fontbakery.checks.shaping import ShapingSuite
+
+    shaping_test = {
+        "configuration": {"defaults": {"script": "latn", "features": {"kern": 0}}},
+        "tests": [
+            {"input": "AV", "expectation": "x"},
+            {"input": "AT", "expectation": "x", "only": ["A.ttf"]},
+            {"input": "AW", "expectation": "x", "exclude": ["A.ttf"]},
+            {"input": "AY", "expectation": "x", "script": "grek"},
+        ],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_gf_dir:
+        path = Path(tmp_gf_dir, "test.json")
+        path.write_text(json.dumps(shaping_test), encoding="utf-8")
+        suite = ShapingSuite(path)
+        assert suite.error is None
+        assert [t["input"] for t in suite.tests_for("A.ttf")] == ["AV", "AT", "AY"]
+        assert [t["input"] for t in suite.tests_for("B.ttf")] == ["AV", "AW", "AY"]
+        assert suite.tests[0].parameters["script"] == "latn"
+        assert suite.tests[0].parameters["features"] == {"kern": 0}
+        assert suite.tests[3].parameters["script"] == "grek"
+        assert suite.tests[3].parameters["variations"] == {}
+
+        path.write_text("{", encoding="utf-8")
+        assert ShapingSuite(path).error.code == "shaping-invalid-json"
+        path.write_text("{}", encoding="utf-8")
+        assert ShapingSuite(path).error.code == "shaping-missing-tests"
+
+
 def test_check_shaping_forbidden():
     """Check that we can test for forbidden glyphs in output."""
     check = CheckTester("shaping/forbidden")
@@ -140,6 +212,37 @@ def test_check_shaping_collides():
         )
 
 
+def test_shaping_collisions_drawn_lazily():
+    """Collisions are only drawn when a report displays them."""
+    from collidoscope import Collidoscope
+
+    check = CheckTester("shaping/collides")
+
+    shaping_test = {
+        "configuration": {"collidoscope": {"area": 0, "bases": True, "marks": True}},
+        "tests": [{"input": "ïï"}],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_gf_dir:
+        json.dump(
+            shaping_test,
+            open(os.path.join(tmp_gf_dir, "test.json"), "w", encoding="utf-8"),
+        )
+
+        config = {"shaping": {"test_directory": tmp_gf_dir}}
+        font = TEST_FILE("nunito/Nunito-Black.ttf")
+        with patch.object(
+            Collidoscope, "draw_overlaps", autospec=True, return_value="<svg/>"
+        ) as draw_overlaps:
+            results = check(font, config=config)
+            message = [r.message for r in results if r.status == FAIL][0]
+            draw_overlaps.assert_not_called()
+
+            assert "<svg" in message.getData(render_artifacts=True)["message"]
+            assert "<svg" in pickle.loads(pickle.dumps(message)).artifacts[0].render()
+            draw_overlaps.assert_called_once()
+
+
 def test_check_dotted_circle():
     """Ensure dotted circle glyph is present and can attach marks."""
     check = CheckTester("dotted_circle")
@@ -209,6 +209,13 @@ def test_check_ttx_roundtrip():
     font = TEST_FILE("mada/Mada-Regular.ttf")
     assert_PASS(check(font))
 
+    # This font has a name table (and little else), so fontTools cannot
+    # dump it; the error is reported as ttx would print it.
+    font = TEST_FILE("bizudpmincho-nameonly/BIZUDPMincho-Regular.ttf")
+    messages = [str(r.message) for r in check(font) if r.status == FAIL]
+    assert "ERROR: Unhandled exception has occurred" in messages
+    assert "KeyError: 'maxp'" in messages
+
     # TODO: Can anyone show us a font file that fails ttx roundtripping?!
     #
     # font = TEST_FILE("...")
@@ -328,7 +335,7 @@ class MockDistribution:
 # We don't want to make an actual GET request to PyPI.org, so we'll mock it.
 # We'll also mock pip-api's 'installed_distributions' method.
 @patch("pip_api.installed_distributions")
-@patch("requests.get")
+@patch("requests.Session.request")
 def test_check_fontbakery_version(mock_get, mock_installed):
     """Check if FontBakery is up-to-date"""
     check = CheckTester("fontbakery_version")
@@ -0,0 +1,43 @@
+import random
+
+from fontbakery.codepoints import (
+    CodepointSet,
+    codepoint_set,
+    dump_codepoint_sets,
+    load_codepoint_sets,
+)
+
+
+def test_codepoint_set_operations_match_python_sets():
+    rng = random.Random(1234)
+    a = set(rng.sample(range(0x3000), 1000)) | set(range(0x41, 0x5B))
+    b = set(rng.sample(range(0x3000), 1200))
+    A, B = CodepointSet(a), CodepointSet(b)
+
+    assert A == a and len(A) == len(a) and list(A) == sorted(a)
+    assert all((c in A) == (c in a) for c in range(0x3010))
+    assert (A | B) == a | b
+    assert (A & B) == a & b
+    assert (A - B) == a - b
+    # The other operand may be any collection of codepoints, e.g. a cmap.
+    assert (A - dict.fromkeys(b)) == a - b
+    assert A.coverage(b) == len(a & b) / len(a)
+    assert CodepointSet.from_ranges(A.ranges()) == A
+    assert (A - A).issubset(B) and not A.issubset(B)
+
+
+def test_codepoint_sets_file_round_trip():
+    sets = {"EMPTY": CodepointSet(), "SOME": CodepointSet([0x20, 0x21, 0x10FFFF])}
+    assert load_codepoint_sets(dump_codepoint_sets(sets)) == sets
+
+
+def test_shipped_repertoires():
+    from fontbakery import hangul
+
+    assert len(codepoint_set("OGL2")) == 887
+    assert len(codepoint_set("WGL4_REQUIRED")) == 578
+    assert len(codepoint_set("WGL4_OPTIONAL")) == 79
+    assert len(codepoint_set("TYPENETWORK_LATIN")) == 361
+    assert hangul.MODERN_HANGUL_SYLLABLES_CODEPOINTS.issubset(
+        hangul.ALL_HANGUL_SYLLABLES_CODEPOINTS
+    )
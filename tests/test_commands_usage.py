@@ -26,6 +26,25 @@ def test_list_checks_option(capfd):
     assert set(output.split()) == all_checks
 
 
+def test_plan_option(capfd):
+    """Test if 'fontbakery <subcommand> --plan' prints the execution plan
+    without running any check."""
+    import json
+
+    font = os.path.join("data", "test", "nunito", "Nunito-Regular.ttf")
+    subprocess.run(
+        [TOOL_NAME, "check-universal", "--plan", "-c", "whitespace_glyphs", font],
+        check=True,
+    )
+    plan = json.loads(capfd.readouterr().out)
+    assert plan["identities"] == 1
+    assert plan["checks"]["whitespace_glyphs"]["identities"] == 1
+    assert plan["checks"]["whitespace_glyphs"]["args"] == {
+        "ttFont": "font.ttFont",
+        "missing_whitespace_chars": "font.missing_whitespace_chars",
+    }
+
+
 def test_command_check_googlefonts():
     """Test if 'fontbakery check-googlefonts' can run successfully."""
     subprocess.run([TOOL_NAME, "check-googlefonts", "-h"], check=True)
@@ -176,3 +195,91 @@ explicit_checks:
     # This font has a WARN here, so should now FAIL
     assert "FAIL: 1" in stdout
     os.unlink(config.name)
+
+
+def test_command_batch(tmp_path):
+    """Test if 'fontbakery batch' writes a report for each family of a
+    collection, plus a summary."""
+    import json
+    import shutil
+
+    for family in ["nunito", "abeezee"]:
+        shutil.copytree(os.path.join("data", "test", family), tmp_path / "ofl" / family)
+    # The fonts of a family's subdirectories belong to the family.
+    static = tmp_path / "ofl" / "nunito" / "static"
+    static.mkdir()
+    for font in ["Nunito-Black.ttf", "Nunito-BlackItalic.ttf"]:
+        shutil.move(tmp_path / "ofl" / "nunito" / font, static / font)
+    output_dir = tmp_path / "results"
+    subprocess.run(
+        [
+            TOOL_NAME,
+            "batch",
+            "universal",
+            str(tmp_path),
+            "-O",
+            str(output_dir),
+            "-c",
+            "whitespace_glyphs",
+            "--executor",
+            "threads",
+            "-J",
+            "2",
+            "--ghmarkdown",
+            str(tmp_path / "markdown"),
+            "-l",
+            "PASS",
+        ],
+        check=True,
+    )
+    summary = json.loads((output_dir / "summary.json").read_text())
+    assert list(summary) == ["ofl/abeezee", "ofl/nunito"]
+    assert summary["ofl/nunito"]["result"]["PASS"] == 14
+    report = json.loads((output_dir / "ofl" / "nunito.json").read_text())
+    assert report["result"] == summary["ofl/nunito"]["result"]
+    assert (tmp_path / "markdown" / "ofl" / "abeezee.md").exists()
+
+
+# CPU time (in seconds) allowed for `fontbakery --version`, interpreter
+# startup included. CPU time, unlike the wall-clock times reported by
+# `-X importtime`, does not depend on the load of the machine. Reporters,
+# configuration file parsers and large data tables must only be imported
+# when they are used.
+STARTUP_CPU_BUDGET = 0.25
+LAZY_MODULES = (
+    "rich",
+    "jinja2",
+    "cmarkgfm",
+    "yaml",
+    "toml",
+    "multiprocessing",
+    "fontbakery.reporters",
+    "fontbakery.checks.",
+    "fontbakery.hangul",
+    "fontbakery.glyphdata",
+)
+
+
+def test_import_time_budget():
+    import sys
+
+    resource = pytest.importorskip("resource")  # Not available on Windows
+
+    cpu_times = []
+    for _ in range(3):
+        before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "fontbakery", "--version"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stderr
+        after = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu_times.append(
+            after.ru_utime - before.ru_utime + after.ru_stime - before.ru_stime
+        )
+        for line in stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                module = line.split("|")[-1].strip()
+                assert not module.startswith(LAZY_MODULES), f"{module} imported eagerly"
+    assert min(cpu_times) < STARTUP_CPU_BUDGET
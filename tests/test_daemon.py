@@ -0,0 +1,81 @@
+import io
+import os
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.daemon import CheckServer, _JobHandler, make_server, submit
+
+
+def test_daemon_runs_concurrent_jobs_on_a_warm_profile(tmp_path):
+    check_server = CheckServer()
+    check_server.preload(["universal"])
+    server = make_server(check_server, socket_path=str(tmp_path / "fontbakery.sock"))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        jobs = [
+            {
+                "files": [os.path.abspath(TEST_FILE(f"nunito/Nunito-{style}.ttf"))],
+                "checks": ["whitespace_glyphs", "contour_count"],
+            }
+            for style in ("Regular", "Bold")
+        ]
+        results = [None, None]
+
+        def run(index):
+            results[index] = list(
+                submit(jobs[index], socket_path=server.server_address)
+            )
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for style, lines in zip(("Regular", "Bold"), results):
+            *checks, summary = lines
+            assert {line["filename"] for line in checks} == {f"Nunito-{style}.ttf"}
+            assert sorted(line["key"][1] for line in checks) == [
+                "<FontBakeryCheck:contour_count>",
+                "<FontBakeryCheck:whitespace_glyphs>",
+            ]
+            assert summary["summary"]["result"]["(not finished)"] == 0
+
+        assert list(check_server._profiles) == ["universal"]
+        error = list(submit({"files": []}, socket_path=server.server_address))
+        assert list(error[0]) == ["error"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_daemon_replaces_only_sockets(tmp_path):
+    path = tmp_path / "fontbakery.sock"
+    make_server(CheckServer(), socket_path=str(path)).server_close()
+    # A stale socket is replaced...
+    make_server(CheckServer(), socket_path=str(path)).server_close()
+
+    # ...but any other file is left alone.
+    path.unlink()
+    path.write_text("precious")
+    with pytest.raises(OSError):
+        make_server(CheckServer(), socket_path=str(path))
+    assert path.read_text() == "precious"
+
+
+def test_daemon_survives_clients_going_away():
+    class GoneStream(io.RawIOBase):
+        def writable(self):
+            return True
+
+        def write(self, b):
+            raise BrokenPipeError
+
+    handler = _JobHandler.__new__(_JobHandler)
+    handler.server = Mock(check_server=CheckServer())
+    handler.rfile = io.BytesIO(b'{"files": []}\n')
+    handler.wfile = GoneStream()
+    handler.handle()
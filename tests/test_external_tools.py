@@ -0,0 +1,93 @@
+import subprocess
+import sys
+
+import pytest
+
+from fontbakery.external_tools import OUTPUT_DIR, ToolResult, ToolRunner
+from fontbakery.result_cache import ResultCache
+
+# Prints the size of each file given, and counts its runs in a log file.
+TOOL = """
+import os, sys
+log, out, files = sys.argv[1], sys.argv[2], sys.argv[3:]
+with open(log, "a") as fh:
+    fh.write("run\\n")
+for path in files:
+    with open(os.path.join(out, os.path.basename(path)), "w") as fh:
+        fh.write(str(os.path.getsize(path)))
+"""
+
+
+def tool_args(log):
+    return lambda files: [sys.executable, "-c", TOOL, log, OUTPUT_DIR] + files
+
+
+def runs(log):
+    with open(log, encoding="utf-8") as fh:
+        return len(fh.readlines())
+
+
+def test_run_is_keyed_by_file_contents(tmp_path):
+    log = str(tmp_path / "log")
+    font_a, font_b = tmp_path / "a.ttf", tmp_path / "b.ttf"
+    font_a.write_bytes(b"12345")
+    font_b.write_bytes(b"12345")
+
+    runner = ToolRunner(cache=ResultCache(str(tmp_path / "cache")))
+    result = runner.run(tool_args(log)([str(font_a)]), [str(font_a)], version="1")
+    assert result.returncode == 0
+    assert result.files == {"a.ttf": b"5"}
+
+    # Same arguments, same contents: not run again.
+    runner.run(tool_args(log)([str(font_a)]), [str(font_a)], version="1")
+    assert runs(log) == 1
+
+    # Another runner on the same cache directory reuses the result too.
+    runner = ToolRunner(cache=ResultCache(str(tmp_path / "cache")))
+    runner.run(tool_args(log)([str(font_a)]), [str(font_a)], version="1")
+    assert runs(log) == 1
+
+    # A new version of the tool, or new file contents, run it again.
+    runner.run(tool_args(log)([str(font_a)]), [str(font_a)], version="2")
+    assert runs(log) == 2
+    font_a.write_bytes(b"123")
+    result = runner.run(tool_args(log)([str(font_a)]), [str(font_a)], version="2")
+    assert runs(log) == 3
+    assert result.files == {"a.ttf": b"3"}
+    assert font_b.read_bytes() == b"12345"
+
+
+def test_run_batch(tmp_path):
+    log = str(tmp_path / "log")
+    fonts = []
+    for size in range(1, 4):
+        font = tmp_path / f"{size}.ttf"
+        font.write_bytes(b"x" * size)
+        fonts.append(str(font))
+
+    def split(result, path):
+        name = path.rsplit("/", 1)[-1]
+        return ToolResult(result.returncode, files={name: result.files[name]})
+
+    runner = ToolRunner()
+    results = runner.run_batch(tool_args(log), fonts[:2], split, version="1")
+    assert runs(log) == 1
+    assert results[fonts[1]].files == {"2.ttf": b"2"}
+
+    # Only the font not run yet is passed to the tool.
+    results = runner.run_batch(tool_args(log), fonts, split, version="1")
+    assert runs(log) == 2
+    assert [results[font].files for font in fonts] == [
+        {"1.ttf": b"1"},
+        {"2.ttf": b"2"},
+        {"3.ttf": b"3"},
+    ]
+
+
+def test_run_timeout_and_missing_tool(tmp_path):
+    runner = ToolRunner(timeout=0.5)
+    with pytest.raises(subprocess.TimeoutExpired):
+        runner.run([sys.executable, "-c", "import time; time.sleep(10)"], [])
+
+    with pytest.raises(FileNotFoundError):
+        runner.run(["surely-not-an-installed-tool", str(tmp_path)], [])
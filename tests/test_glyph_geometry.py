@@ -0,0 +1,111 @@
+import pytest
+from fontTools.pens.areaPen import AreaPen
+from fontTools.pens.boundsPen import BoundsPen
+from fontTools.ttLib import TTFont
+
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.glyph_geometry import GlyphGeometry
+from fontbakery.utils import glyph_contour_count, glyph_has_ink
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "nunito/Nunito-Regular.ttf",
+        "source-sans-pro/TTF/SourceSansPro-It.ttf",
+        "source-sans-pro/OTF/SourceSansPro-Regular.otf",
+    ],
+)
+def test_glyph_geometry_matches_pens(filename):
+    ttFont = TTFont(TEST_FILE(filename))
+    geometry = GlyphGeometry(ttFont)
+    glyphset = ttFont.getGlyphSet()
+    assert len(geometry) == len(ttFont.getGlyphOrder())
+
+    for gid, name in enumerate(ttFont.getGlyphOrder()):
+        bounds_pen, area_pen = BoundsPen(glyphset), AreaPen(glyphset)
+        glyphset[name].draw(bounds_pen)
+        glyphset[name].draw(area_pen)
+        if bounds_pen.bounds is None:
+            assert geometry.bounds(name) is None
+        else:
+            assert geometry.bounds(name) == pytest.approx(bounds_pen.bounds)
+        assert geometry.area(gid) == pytest.approx(area_pen.value)
+        assert geometry.has_ink(name) == glyph_has_ink(ttFont, name)
+        if "glyf" in ttFont:
+            assert geometry.contour_count(name) == glyph_contour_count(ttFont, name)
+        assert (geometry.advance_width(name), geometry.lsb(name)) == tuple(
+            ttFont["hmtx"].metrics[name]
+        )
+
+
+def test_glyph_geometry_counts_contours_and_points():
+    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Regular.otf"))
+    geometry = GlyphGeometry(ttFont)
+    assert geometry.contour_count("space") == 0
+    assert geometry.point_count("space") == 0
+    assert not geometry.has_ink("space")
+    assert geometry.contour_count("O") == 2
+    assert geometry.point_count("O") > 8
+    assert "O" in geometry
+    assert "not-a-glyph" not in geometry
+
+
+def test_glyph_geometry_of_seac_glyphs():
+    """CFF accented glyphs built with "seac" are measured with their
+    components."""
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.misc.psCharStrings import T2CharString
+    from fontTools.pens.t2CharStringPen import T2CharStringPen
+
+    def rectangle(xMin, yMin, xMax, yMax):
+        pen = T2CharStringPen(500, None)
+        pen.moveTo((xMin, yMin))
+        pen.lineTo((xMax, yMin))
+        pen.lineTo((xMax, yMax))
+        pen.lineTo((xMin, yMax))
+        pen.closePath()
+        return pen.getCharString()
+
+    builder = FontBuilder(1000, isTTF=False)
+    builder.setupGlyphOrder([".notdef", "A", "grave", "Agrave"])
+    builder.setupCharacterMap({0x41: "A", 0x60: "grave", 0xC0: "Agrave"})
+    builder.setupCFF(
+        "Test",
+        {"FullName": "Test"},
+        {
+            ".notdef": rectangle(0, 0, 500, 700),
+            "A": rectangle(0, 0, 500, 700),
+            "grave": rectangle(0, 0, 200, 100),
+            # adx, ady, base (StandardEncoding "A"), accent ("grave")
+            "Agrave": T2CharString(program=[100, 700, 65, 193, "endchar"]),
+        },
+        {},
+    )
+    builder.setupHorizontalMetrics(
+        {name: (500, 0) for name in builder.font.getGlyphOrder()}
+    )
+    builder.setupHorizontalHeader()
+    builder.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+    builder.setupOS2()
+    builder.setupPost()
+    ttFont = builder.font
+
+    geometry = GlyphGeometry(ttFont)
+    assert not geometry.broken_glyphs
+    assert geometry.has_ink("Agrave") == glyph_has_ink(ttFont, "Agrave")
+    assert geometry.has_ink("Agrave")
+    assert geometry.bounds("Agrave") == (0, 0, 500, 800)
+    assert geometry.contour_count("Agrave") == 2
+    assert geometry.point_count("Agrave") == 8
+
+
+def test_glyph_geometry_of_broken_glyphs():
+    ttFont = TTFont(TEST_FILE("subr_test_fonts/subr_test_font_infinite_recursion.otf"))
+    geometry = GlyphGeometry(ttFont)
+    assert geometry.broken_glyphs == ["F"]
+    assert geometry.is_broken("F")
+    assert geometry.is_broken(geometry.gid("F"))
+    assert not geometry.is_broken("A")
+    with pytest.raises(ValueError, match="could not be drawn"):
+        geometry.has_ink("F")
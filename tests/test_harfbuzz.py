@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.testable import Font
+
+
+def test_harfbuzz_face_is_shared():
+    font = Font(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    harfbuzz = font.harfbuzz
+    assert font.harfbuzz is harfbuzz
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        faces = list(executor.map(lambda _: harfbuzz.face, range(8)))
+    assert all(face is faces[0] for face in faces)
+
+    # Each caller gets its own font (which it may change), on the shared face
+    first, second = harfbuzz.font(), harfbuzz.font()
+    assert first is not second
+    assert first.face is second.face is harfbuzz.face
+
+    shaper = harfbuzz.shaper()
+    assert shaper.hbfont.face is harfbuzz.face
+    assert shaper.serialize_buf(shaper.shape("AV"), glyphsonly=True) == "A|V"
+
+
+def test_batch_shaper():
+    font = Font(TEST_FILE("varfont/Oswald-VF.ttf"))
+    shaper = font.harfbuzz.shaper()
+    texts = ["AV", "fi", "Ta", "", "WAVE"]
+
+    def reference(text, parameters=None):
+        buf = shaper.shape(text, parameters)
+        return [info.codepoint for info in buf.glyph_infos]
+
+    batch = font.harfbuzz.batch_shaper()
+    assert [ids.tolist() for ids in batch.map(texts)] == [reference(t) for t in texts]
+
+    # The parameters apply to every string of the batch
+    parameters = {"features": {"liga": False}, "variations": {"wght": 700}}
+    batch = font.harfbuzz.batch_shaper(parameters)
+    assert [ids.tolist() for ids in batch.map(texts)] == [
+        reference(t, parameters) for t in texts
+    ]
+    glyph_ids = font.harfbuzz.shape_many(texts, parameters)
+    assert [ids.tolist() for ids in glyph_ids] == [
+        reference(t, parameters) for t in texts
+    ]
+
+
+def test_shape_many_in_worker_processes():
+    from unittest.mock import patch
+
+    font = Font(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    texts = ["AV", "fi", "Ta", "WAVE", "office"] * 4
+    expected = font.harfbuzz.shape_many(texts)
+    with patch("fontbakery.harfbuzz.MIN_STRINGS_PER_WORKER", 5):
+        assert font.harfbuzz.shape_many(texts, workers=2) == expected
@@ -0,0 +1,49 @@
+import pytest
+import requests
+
+from fontbakery.http_client import HTTPClient
+
+URL = "https://example.com/metadata"
+
+
+def test_responses_are_cached_while_fresh(tmp_path, requests_mock):
+    requests_mock.get(URL, text="v1", headers={"Cache-Control": "max-age=3600"})
+    http = HTTPClient(cache_dir=str(tmp_path))
+    assert http.get(URL).text == "v1"
+
+    requests_mock.get(URL, text="v2")
+    assert http.get(URL).text == "v1"
+    assert HTTPClient(cache_dir=str(tmp_path)).get(URL).text == "v1"
+    assert requests_mock.call_count == 1
+
+    # Without a cache directory, every request goes to the network.
+    assert HTTPClient().get(URL).text == "v2"
+
+
+def test_stale_responses_are_revalidated(tmp_path, requests_mock):
+    requests_mock.get(
+        URL, text="v1", headers={"Cache-Control": "no-cache", "ETag": "x"}
+    )
+    http = HTTPClient(cache_dir=str(tmp_path))
+    assert http.get(URL).text == "v1"
+
+    requests_mock.get(URL, status_code=304)
+    response = http.get(URL)
+    assert response.status_code == 200
+    assert response.text == "v1"
+    assert requests_mock.last_request.headers["If-None-Match"] == "x"
+
+
+def test_replay(tmp_path, requests_mock):
+    requests_mock.post(URL, text="recorded", headers={"Cache-Control": "no-store"})
+    HTTPClient(cache_dir=str(tmp_path)).post(URL, params={"q": "Family"})
+
+    http = HTTPClient(cache_dir=str(tmp_path), replay=True)
+    assert http.post(URL, params={"q": "Family"}).text == "recorded"
+    assert requests_mock.call_count == 1
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        http.post(URL, params={"q": "Other Family"})
+
+    with pytest.raises(ValueError):
+        HTTPClient(replay=True)
@@ -0,0 +1,79 @@
+import pytest
+from fontTools.ttLib import TTFont
+
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.kerning_index import KerningIndex
+
+
+def shaped_kerning(filename, ttFont, left, right):
+    import uharfbuzz as hb
+
+    with open(filename, "rb") as fh:
+        font = hb.Font(hb.Face(fh.read()))
+    # Shape glyph IDs, smuggled in as codepoints
+    font.funcs = hb.FontFuncs()
+    font.funcs.set_nominal_glyph_func(lambda font, codepoint, data: codepoint - 0xF0000)
+    widths = []
+    for kern in (True, False):
+        buf = hb.Buffer()
+        buf.add_codepoints(
+            [0xF0000 + ttFont.getGlyphID(left), 0xF0000 + ttFont.getGlyphID(right)]
+        )
+        buf.guess_segment_properties()
+        hb.shape(font, buf, {"kern": kern})
+        widths.append(sum(pos.x_advance for pos in buf.glyph_positions))
+    return widths[0] - widths[1]
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "cabin/Cabin-Regular.ttf",
+        "source-sans-pro/OTF/SourceSansPro-Bold.otf",
+        "abeezee_ext_lookup/ABeeZee-Regular_GPOS_ext_lookup.ttf",
+    ],
+)
+def test_kern_matches_shaping(filename):
+    ttFont = TTFont(TEST_FILE(filename))
+    index = KerningIndex(ttFont)
+    assert index.complete
+    glyphs = [g for g in ttFont.getGlyphOrder() if g.isalpha()][:40]
+    pairs = [(left, right) for left in glyphs for right in glyphs]
+    # Include some pairs which are kerned for sure.
+    pairs += [(left, right) for left, right, _, _ in index.pairs(feature="kern")][:50]
+    for left, right in pairs:
+        expected = shaped_kerning(TEST_FILE(filename), ttFont, left, right)
+        assert index.kern(left, right) == expected, (left, right)
+
+
+def test_has_pair_keeps_explicit_zero_pairs():
+    # An explicit zero pair (format 1) is kerning info...
+    index = KerningIndex(TTFont(TEST_FILE("nunito/Nunito-Regular.ttf")))
+    assert index.kern("ellipsis", "j") == 0
+    assert index.has_pair("ellipsis", "j")
+
+    # ...but a zero record of a class pair (format 2) is not.
+    index = KerningIndex(
+        TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Bold.otf"))
+    )
+    assert index.kern("f", "l") == 0
+    assert not index.has_pair("f", "l")
+    assert index.has_pair("f", "o")
+
+
+def test_class_pairs_are_not_expanded():
+    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Bold.otf"))
+    index = KerningIndex(ttFont)
+    class_pairs = list(index.class_pairs())
+    expanded = sum(len(lefts) * len(rights) for lefts, rights, _, _ in class_pairs)
+    assert len(class_pairs) < expanded
+    assert expanded == sum(1 for _ in index.pairs())
+
+
+def test_variable_class_pairs():
+    ttFont = TTFont(TEST_FILE("BadGrades/BadGrades-VF.ttf"))
+    index = KerningIndex(ttFont)
+    variable = list(index.variable_class_pairs())
+    assert variable
+    for _, _, value1, _ in variable:
+        assert value1.XAdvDevice.DeltaFormat == 0x8000
@@ -0,0 +1,50 @@
+import requests
+
+from fontbakery.http_client import HTTPClient
+from fontbakery.link_checker import LinkChecker
+
+
+def test_link_checker(requests_mock):
+    requests_mock.head("https://example.com/good", text="good")
+    requests_mock.head("https://example.com/busy", status_code=429)
+    requests_mock.head("https://example.com/gone", status_code=404)
+    requests_mock.head("https://example.com/slow", exc=requests.Timeout())
+    requests_mock.head("https://example.com/down", exc=requests.ConnectionError())
+
+    checker = LinkChecker(HTTPClient(), per_host=2)
+    statuses = checker.check(
+        [
+            "https://example.com/good",
+            "https://example.com/busy",
+            "https://example.com/gone",
+            "https://example.com/slow",
+            "https://example.com/down",
+            "https://example.com/good",
+        ]
+    )
+    assert [url for url, status in statuses.items() if status.ok] == [
+        "https://example.com/good",
+        "https://example.com/busy",
+    ]
+    assert statuses["https://example.com/gone"].status_code == 404
+    assert statuses["https://example.com/slow"].timed_out
+    assert statuses["https://example.com/down"].status_code is None
+    assert not statuses["https://example.com/down"].timed_out
+    assert requests_mock.call_count == 5
+
+    # Links already checked are not requested again.
+    statuses = checker.check(["https://example.com/gone", "https://example.com/good"])
+    assert statuses["https://example.com/gone"].status_code == 404
+    assert requests_mock.call_count == 5
+
+
+def test_link_checker_malformed_urls(requests_mock):
+    requests_mock.head("https://example.com/good", text="good")
+    checker = LinkChecker(HTTPClient())
+
+    for _ in range(2):
+        statuses = checker.check(["http://[broken", "https://example.com/good"])
+        assert not statuses["http://[broken"].ok
+        assert statuses["http://[broken"].status_code is None
+        assert statuses["http://[broken"].error
+        assert statuses["https://example.com/good"].ok
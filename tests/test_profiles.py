@@ -35,3 +35,96 @@ def test_rationale_field():
     for checkid, definition in checks_by_id.items():
         assert definition.rationale is not None
         assert definition.rationale.strip() != ""
+
+
+def test_check_manifest_is_up_to_date():
+    """If this fails, run meta_scripts/generate_check_manifest.py"""
+    from fontbakery import check_manifest
+    from fontbakery.callable import cached_property
+    from fontbakery.testable import FILE_TYPES, CheckRunContext, TTCFont
+
+    assert check_manifest.CHECKS == {
+        checkid: definition.__module__ for checkid, definition in checks_by_id.items()
+    }
+    for cls in [CheckRunContext, TTCFont] + FILE_TYPES:
+        for name, attribute in vars(cls).items():
+            if isinstance(attribute, cached_property):
+                module = attribute.func.__module__
+                if module.startswith("fontbakery.checks."):
+                    assert module in check_manifest.CONDITIONS[name]
+
+
+def test_profile_factory_imports_only_the_selected_checks():
+    import json
+    import subprocess
+    import sys
+
+    script = """
+import json, sys
+from fontbakery.fonts_profile import profile_factory
+import fontbakery.profiles.opentype
+profile = profile_factory(
+    fontbakery.profiles.opentype, explicit_checks=["opentype/name/empty_records"]
+)
+print(json.dumps({
+    "checks": [check.id for section in profile.sections for check in section.checks],
+    "modules": sorted(m for m in sys.modules if m.startswith("fontbakery.checks.")),
+}))
+"""
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    ).stdout
+    result = json.loads(output)
+    assert result["checks"] == ["opentype/name/empty_records"]
+    assert result["modules"] == [
+        "fontbakery.checks.opentype",
+        "fontbakery.checks.opentype.name",
+    ]
+
+
+def test_lazy_conditions_load_once_across_threads():
+    import subprocess
+    import sys
+
+    script = """
+import threading
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.testable import Font
+
+barrier = threading.Barrier(8)
+results = []
+
+def lookup():
+    font = Font(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    barrier.wait()
+    results.append(font.best_familyname)
+
+threads = [threading.Thread(target=lookup) for _ in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert results == ["Nunito"] * 8, results
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_lazy_conditions_keep_attribute_errors_of_their_own():
+    import pytest
+
+    from fontbakery.callable import condition
+    from fontbakery.codetesting import TEST_FILE
+    from fontbakery.testable import Font
+
+    class BrokenFont(Font):
+        pass
+
+    @condition(BrokenFont)
+    def broken_condition(font):
+        return font.ttFont.no_such_attribute
+
+    font = BrokenFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    with pytest.raises(AttributeError, match="no_such_attribute"):
+        assert font.broken_condition
+    with pytest.raises(AttributeError, match="has no attribute 'no_such_condition'"):
+        assert font.no_such_condition
@@ -20,7 +20,9 @@ from fontbakery.utils import (
     split_camel_case,
     unindent_and_unwrap_rationale,
     all_kerning,
+    drawable_glyph_set,
     iterate_lookup_list_with_extensions,
+    iterate_lookups,
 )
 from fontbakery.codetesting import TEST_FILE
 
@@ -359,3 +361,92 @@ def test_iterate_lookup_list_with_extensions_doesnt_change_font():
     all_kerning_after = all_kerning(ttFont)
 
     assert all_kerning_before == all_kerning_after
+
+
+def test_iterate_lookups_unwraps_extension_lookups():
+    from fontTools.ttLib import TTFont
+
+    ttFont = TTFont(TEST_FILE("abeezee_ext_lookup/ABeeZee-Regular_GPOS_ext_lookup.ttf"))
+    lookups = ttFont["GPOS"].table.LookupList.Lookup
+    assert any(lookup.LookupType == 9 for lookup in lookups)
+
+    unwrapped = list(iterate_lookups(ttFont, "GPOS"))
+    assert len(unwrapped) == len(lookups)
+    assert all(lookup.LookupType != 9 for lookup in unwrapped)
+    # The font itself is left untouched
+    assert any(lookup.LookupType == 9 for lookup in lookups)
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "nunito/Nunito-Regular.ttf",
+        "source-sans-pro/OTF/SourceSansPro-Regular.otf",
+    ],
+)
+def test_drawable_glyph_set_decompiles_outlines(filename):
+    from fontTools.pens.areaPen import AreaPen
+    from fontTools.ttLib import TTFont
+
+    ttFont = TTFont(TEST_FILE(filename))
+    glyphset = drawable_glyph_set(ttFont)
+    if "glyf" in ttFont:
+        assert not any(hasattr(g, "data") for g in ttFont["glyf"].glyphs.values())
+    else:
+        # CFF glyphs are only decompiled when they are looked up.
+        charstrings = ttFont["CFF "].cff.topDictIndex[0].CharStrings
+        assert charstrings["A"].needsDecompilation()
+        assert glyphset["A"] is not None
+        assert not charstrings["A"].needsDecompilation()
+        assert charstrings["B"].needsDecompilation()
+
+    pen = AreaPen(glyphset)
+    glyphset["A"].draw(pen)
+    assert pen.value != 0
+
+
+def test_drawable_glyph_set_remembers_broken_glyphs():
+    from fontTools.ttLib import TTFont
+
+    ttFont = TTFont(TEST_FILE("subr_test_fonts/subr_test_font_infinite_recursion.otf"))
+    glyphset = drawable_glyph_set(ttFont)
+    with pytest.raises(RecursionError) as first:
+        assert glyphset["F"]
+    with pytest.raises(RecursionError) as second:
+        assert drawable_glyph_set(ttFont)["F"]
+    assert second.value is first.value
+    # The other glyphs can still be drawn.
+    assert glyphset["A"] is not None
+
+
+def test_unicoderange_index_matches_linear_scan():
+    from fontTools.ttLib import TTFont
+
+    from fontbakery.constants import UNICODERANGE_DATA
+    from fontbakery.unicode_ranges import unicode_range_index
+    from fontbakery.utils import chars_in_range, compute_unicoderange_bits
+
+    index = unicode_range_index()
+    # Bit 57 (non-plane 0) overlaps bit 101 (Linear B), and ranges are
+    # inclusive at both ends.
+    for codepoint in (0x0, 0x7F, 0x80, 0xFFFF, 0x10000, 0x1007F, 0x10FFFF):
+        expected = [
+            bit
+            for bit, entries in enumerate(UNICODERANGE_DATA)
+            for _, _, first, last in entries
+            if first <= codepoint <= last
+        ]
+        assert list(index.labels(codepoint)) == expected
+    assert index.labels(0x110000) == ()
+
+    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    cmap = ttFont.getBestCmap()
+    expected_bits = 0
+    for bit, entries in enumerate(UNICODERANGE_DATA):
+        chars = sorted(
+            c for c in cmap for _, _, first, last in entries if first <= c <= last
+        )
+        assert chars_in_range(ttFont, bit) == chars
+        if chars:
+            expected_bits |= 1 << bit
+    assert compute_unicoderange_bits(ttFont) == expected_bits